@@ -1,3 +1,10 @@
+import time
+
+# Taken before the heavy imports so the startup report includes them.
+_PROCESS_START = time.perf_counter()
+
+from functools import cached_property
+
 import pygame
 import chess
 from src.core.game import ChessGame
@@ -6,23 +13,38 @@ from src.ui.menu import MenuRenderer
 from src.ui.sidebar import SidebarRenderer
 from src.ui.promotion import PromotionDialog
 from src.utils.constants import *
+from src.utils.startup import StartupTimer
+
+# Posted once, two seconds after a game ends, to redraw the final position.
+GAME_OVER_EVENT = pygame.USEREVENT + 1
+
 
 class ChessApp:
     def __init__(self):
-        pygame.init()
+        self.startup = StartupTimer(_PROCESS_START)
+        self.startup.mark("imports")
+
+        # Only the subsystems the app uses; pygame.init() would also start audio and joysticks.
+        pygame.display.init()
+        pygame.font.init()
         self.screen = pygame.display.set_mode((BOARD_SIZE + 200, BOARD_SIZE))
         pygame.display.set_caption('Chess Game')
         self.clock = pygame.time.Clock()
+        self.startup.mark("display")
         
         self.game = ChessGame()
-        self.board_renderer = BoardRenderer(self.screen)
+        self.game.ponder_enabled = True
         self.menu_renderer = MenuRenderer(self.screen)
-        self.sidebar_renderer = SidebarRenderer(self.screen)
-        self.promotion_dialog = PromotionDialog(self.screen, self.board_renderer.piece_images)
+        self.startup.mark("menu")
+        # The board, sidebar and promotion dialog are created on first use,
+        # which is after the menu has been shown.
+        self.needs_full_redraw = True
         
         self.game_active = False
         self.result_message = ""
+        # Milliseconds the "Check!!" banner has left, counted against a tick deadline.
         self.check_timer = 0
+        self.check_deadline = 0
         self.pending_move_animation = None
         self.animation_active = False
         self.animation_start_time = 0
@@ -34,6 +56,20 @@ class ChessApp:
         self.animation_source_square = None
         self.animation_board = None
 
+    @cached_property
+    def board_renderer(self):
+        with self.startup.measure("board and piece atlas"):
+            return BoardRenderer(self.screen)
+
+    @cached_property
+    def sidebar_renderer(self):
+        with self.startup.measure("sidebar"):
+            return SidebarRenderer(self.screen)
+
+    @cached_property
+    def promotion_dialog(self):
+        return PromotionDialog(self.screen, self.board_renderer.piece_images)
+
     def _square_to_pixel(self, square):
         file = chess.square_file(square)
         rank = chess.square_rank(square)
@@ -74,10 +110,9 @@ class ChessApp:
             self.pending_move_animation = None
             self.game.commit_pending_move()
             self.animation_board = None
-            self.game.selected_square = None
-            self.game.valid_moves = []
+            self.game.select_square(None)
             if self.game.board.is_check():
-                self.check_timer = 60
+                self._show_check_banner()
             if not self.game.game_over and self.game.board.turn == chess.BLACK:
                 self.game.start_ai_search()
 
@@ -95,112 +130,174 @@ class ChessApp:
         
         if self.game.selected_square is not None:
             if square == self.game.selected_square:
-                self.game.selected_square = None
-                self.game.valid_moves = []
+                self.game.select_square(None)
                 return
                 
-            move = None
-            for valid_move in self.game.valid_moves:
-                if valid_move.from_square == self.game.selected_square and valid_move.to_square == square:
-                    move = valid_move
-                    break
-                    
-            if move:
-                # Handle promotion
-                selected_piece = self.game.board.piece_at(self.game.selected_square)
-                if (selected_piece and selected_piece.piece_type == chess.PAWN and
-                    ((self.game.board.turn == chess.WHITE and chess.square_rank(square) == 7) or
-                     (self.game.board.turn == chess.BLACK and chess.square_rank(square) == 0))):
-                    promotion_piece = self.promotion_dialog.show(move, self.game.board.turn == chess.WHITE)
-                    if promotion_piece:
-                        move = chess.Move(self.game.selected_square, square, 
-                                        promotion=chess.Piece.from_symbol(promotion_piece).piece_type)
-                
-                if self.game.queue_pending_move(move):
-                    self.game.selected_square = None
-                    self.game.valid_moves = []
-                    self._start_move_animation(move)
+            # Several moves share a target square only when they are promotions.
+            moves = self.game.moves_from(self.game.selected_square).get(square)
+            if moves:
+                if moves[0].promotion is not None:
+                    # The move is played once a piece is picked; see _handle_event.
+                    self.promotion_dialog.open(moves, self.game.board.turn == chess.WHITE)
+                else:
+                    self._play_player_move(moves[0])
             else:
                 if piece and piece.color == chess.WHITE:
-                    self.game.selected_square = square
-                    self.game.valid_moves = [m for m in self.game.board.legal_moves if m.from_square == square]
+                    self.game.select_square(square)
                 else:
-                    self.game.selected_square = None
-                    self.game.valid_moves = []
+                    self.game.select_square(None)
         else:
             if piece and piece.color == chess.WHITE:
-                self.game.selected_square = square
-                self.game.valid_moves = [m for m in self.game.board.legal_moves if m.from_square == square]
+                self.game.select_square(square)
+
+    def _play_player_move(self, move):
+        if self.game.queue_pending_move(move):
+            self.game.select_square(None)
+            self._start_move_animation(move)
+
+    def _show_check_banner(self):
+        self.check_deadline = pygame.time.get_ticks() + CHECK_BANNER_MS
+        self.check_timer = CHECK_BANNER_MS
+
+    def _ai_move_ready(self):
+        return self.game.ai_thinking and self.game.ai_thread is None
+
+    def _next_events(self):
+        """Return the pending events, sleeping on the queue while nothing moves on screen."""
+        if self.animation_active or self.check_timer > 0 or self._ai_move_ready():
+            return pygame.event.get()
+
+        event = pygame.event.wait(THINKING_WAIT_MS if self.game.ai_thinking else IDLE_WAIT_MS)
+        if event.type == pygame.NOEVENT:
+            return []
+        return [event] + pygame.event.get()
+
+    def _handle_event(self, event):
+        """Handle one event; return False when the app should quit."""
+        if event.type == pygame.QUIT:
+            self.game.cancel_ai_search()
+            return False
+
+        elif event.type == GAME_OVER_EVENT:
+            # Fire once; set_timer only takes a loops argument from pygame 2.0.1.
+            pygame.time.set_timer(GAME_OVER_EVENT, 0)
+
+        elif self.game_active and self.promotion_dialog.active and event.type in (pygame.KEYDOWN, pygame.MOUSEBUTTONDOWN):
+            # The promotion picker is modal: it takes every key and click until it closes.
+            move = self.promotion_dialog.handle_event(event)
+            if not self.promotion_dialog.active:
+                self.board_renderer.invalidate(self.promotion_dialog.rect)
+            if move is not None:
+                self._play_player_move(move)
+
+        elif event.type == pygame.KEYDOWN and event.key == pygame.K_F3:
+            # Search profile overlay; timing is only collected while it is shown.
+            self.game.set_instrumentation(self.sidebar_renderer.toggle_debug())
+
+        elif event.type == pygame.MOUSEBUTTONDOWN:
+            pos = pygame.mouse.get_pos()
+
+            if not self.game_active:
+                level = self.menu_renderer.handle_click(pos)
+                if level:
+                    self.game.start_new_game(level)
+                    self.game_active = True
+                    self.result_message = ""
+            else:
+                sidebar_action = self.sidebar_renderer.handle_click(pos)
+                if sidebar_action == 'back':
+                    self.game.cancel_ai_search()
+                    self.game_active = False
+                elif sidebar_action == 'undo' and not self.game.game_over:
+                    self.game.undo_move()
+                elif sidebar_action == 'restart':
+                    level = self.game.ai.level if self.game.ai else 'intermediate'
+                    self.game.start_new_game(level)
+                else:
+                    self.handle_board_click(pos)
+
+        return True
+
+    def _draw(self):
+        # In a game only the changed squares and the sidebar are sent to the display.
+        if self.game_active:
+            if self.needs_full_redraw:
+                self.board_renderer.invalidate()
+                self.sidebar_renderer.invalidate()
+                self.needs_full_redraw = False
+            # The translucent overlay must be drawn over freshly painted squares.
+            if self.sidebar_renderer.debug_rect is not None:
+                self.board_renderer.invalidate(self.sidebar_renderer.debug_rect)
+            if self.animation_active:
+                render_board = self.animation_board if self.animation_board is not None else self.game.board
+                dirty_rects = self.board_renderer.draw(
+                    render_board,
+                    self.game.selected_square,
+                    self.game.moves_from(self.game.selected_square),
+                    animated_piece=(self.animation_piece, self.animation_current_pos),
+                    skip_square=self.animation_source_square if self.animation_active else None,
+                )
+            else:
+                dirty_rects = self.board_renderer.draw(
+                    self.game.board, self.game.selected_square, self.game.moves_from(self.game.selected_square)
+                )
+            dialog_rect = self.promotion_dialog.draw()
+            if dialog_rect is not None:
+                dirty_rects.append(dialog_rect)
+            ai_level = self.game.ai.level if self.game.ai else ""
+            sidebar_rect = self.sidebar_renderer.draw(ai_level, self.game.game_over, self.game.message, self.check_timer)
+            if sidebar_rect is not None:
+                dirty_rects.append(sidebar_rect)
+            overlay_rect = self.sidebar_renderer.draw_debug_overlay()
+            if overlay_rect is not None:
+                dirty_rects.append(overlay_rect)
+            pygame.display.update(dirty_rects)
+        else:
+            self.menu_renderer.draw(self.result_message)
+            # The menu covers the board and sidebar; repaint both when a game starts.
+            self.needs_full_redraw = True
+            pygame.display.flip()
+        self.startup.frame_shown()
 
     def run(self):
+        # The search thread posts this when its move is ready, waking the loop.
+        ai_move_event = pygame.event.custom_type()
+        self.game.on_search_finished = lambda: pygame.event.post(pygame.event.Event(ai_move_event))
+
         running = True
         while running:
-            for event in pygame.event.get():
-                if event.type == pygame.QUIT:
+            events = self._next_events()
+            # Redraw only when something happened or is still moving.
+            redraw = bool(events) or self.animation_active or self.check_timer > 0
+            for event in events:
+                if not self._handle_event(event):
                     running = False
-                    
-                    
-                elif event.type == pygame.MOUSEBUTTONDOWN:
-                    pos = pygame.mouse.get_pos()
-                    
-                    if not self.game_active:
-                        level = self.menu_renderer.handle_click(pos)
-                        if level:
-                            self.game.start_new_game(level)
-                            self.game_active = True
-                            self.result_message = ""
-                    else:
-                        sidebar_action = self.sidebar_renderer.handle_click(pos)
-                        if sidebar_action == 'back':
-                            self.game_active = False
-                        elif sidebar_action == 'undo' and not self.game.game_over:
-                            self.game.undo_move()
-                        elif sidebar_action == 'restart':
-                            level = self.game.ai.level if self.game.ai else 'intermediate'
-                            self.game.start_new_game(level)
-                        else:
-                            self.handle_board_click(pos)
-            
-            if self.game.ai_thinking and self.game.ai_thread is None:
+
+            if self._ai_move_ready():
                 if self.game.apply_pending_ai_move():
                     if self.game.board.is_check():
-                        self.check_timer = 60
+                        self._show_check_banner()
+                redraw = True
 
-            # Update check timer
+            # Update check timer; the frame rate varies, so count wall-clock time.
             if self.check_timer > 0:
-                self.check_timer -= 1
-                
+                self.check_timer = max(0, self.check_deadline - pygame.time.get_ticks())
+
             # Check for game over
             if self.game.game_over and self.game_active:
                 self.result_message = self.game.message
-                pygame.time.set_timer(pygame.USEREVENT + 1, 2000)
+                pygame.time.set_timer(GAME_OVER_EVENT, 2000)
                 self.game_active = False
-            
+                redraw = True
+
             if self.animation_active:
                 self._advance_animation()
 
-            # Draw
-            self.screen.fill(WHITE)
-            if self.game_active:
-                if self.animation_active:
-                    render_board = self.animation_board if self.animation_board is not None else self.game.board
-                    self.board_renderer.draw(
-                        render_board,
-                        self.game.selected_square,
-                        self.game.valid_moves,
-                        animated_piece=(self.animation_piece, self.animation_current_pos),
-                        skip_square=self.animation_source_square if self.animation_active else None,
-                    )
-                else:
-                    self.board_renderer.draw(self.game.board, self.game.selected_square, self.game.valid_moves)
-                ai_level = self.game.ai.level if self.game.ai else ""
-                self.sidebar_renderer.draw(ai_level, self.game.game_over, self.game.message, self.check_timer)
-            else:
-                self.menu_renderer.draw(self.result_message)
-                
-            pygame.display.flip()
-            self.clock.tick(60)
-            
+            if redraw and running:
+                self._draw()
+
+            self.clock.tick(THINKING_FPS if self.game.ai_thinking else ANIMATION_FPS)
+
         pygame.quit()
 
 
@@ -9,12 +9,16 @@ setup(
         "pygame>=2.0.0",
         "python-chess>=1.999"
     ],
+    extras_require={
+        "batch": ["numpy>=1.22"]
+    },
     package_data={
         "chess_game": ["assets/*.png"]
     },
     entry_points={
         "console_scripts": [
-            "chess-game=chess_game.main:main"
+            "chess-game=chess_game.main:main",
+            "chess-uci=core.uci:main"
         ]
     }
 )
\ No newline at end of file
@@ -1,16 +1,88 @@
 import chess
+import multiprocessing
 import random
+import threading
 import time
-from typing import Optional
+from concurrent.futures import ProcessPoolExecutor, TimeoutError as FutureTimeoutError
+from typing import Any, Callable, Optional
 
-from .opening_book import OPENING_BOOK
+from .instrumentation import SearchProfiler
+from .opening_book import OpeningBook
+from .search_state import SearchState
+from .tablebase import TABLEBASE_WIN_SCORE, SyzygyTablebase
+from .transposition import EXACT, LOWER_BOUND, UPPER_BOUND, EvaluationCache, TranspositionTable, zobrist_key
+
+# Upper bound on iterative deepening when only a time or node budget is given.
+MAX_SEARCH_DEPTH = 64
+
+MATE_SCORE = 100000
+
+# Finite stand-in for infinity so null windows (alpha, alpha + 1) stay integral.
+INFINITY_SCORE = 1000000
+
+# Half-width of the aspiration window around the previous iteration's score.
+ASPIRATION_WINDOW = 50
+
+# How much deeper than its normal depth the AI searches while pondering.
+PONDER_EXTRA_DEPTH = 2
+
+
+class SearchAborted(Exception):
+    """Raised inside the search when it is stopped or the time or node budget runs out."""
+
+
+# Workers add their nodes to the shared node count in batches of this size,
+# so a parallel search overshoots its node budget by at most this much per worker.
+NODE_SYNC_INTERVAL = 1024
+
+# Per-process state for parallel root search workers.
+_worker_ai: Optional["ChessAI"] = None
+_worker_best_score: Any = None
+
+
+def _init_search_worker(
+    level: str,
+    tt_size_mb: float,
+    use_quiescence: bool,
+    syzygy_path: Optional[str],
+    best_score: Any,
+    stop_event: Any,
+    node_count: Any,
+) -> None:
+    global _worker_ai, _worker_best_score
+    _worker_ai = ChessAI(level, tt_size_mb=tt_size_mb, use_quiescence=use_quiescence, syzygy_path=syzygy_path)
+    _worker_ai.stop_event = stop_event
+    _worker_ai._worker_node_count = node_count
+    _worker_best_score = best_score
+
+
+def _search_root_move(
+    board: chess.Board,
+    move: chess.Move,
+    depth: int,
+    beta: int,
+    full_window: bool,
+    time_left: Optional[float],
+    node_limit: Optional[int],
+) -> Optional[tuple[int, dict[str, int]]]:
+    return _worker_ai._search_root_move(
+        board, move, depth, beta, full_window, time_left, node_limit, _worker_best_score
+    )
 
 
 class ChessAI:
     """
     Chess AI using:
-    - Minimax
+    - Negamax
     - Alpha-Beta Pruning
+    - Principal Variation Search
+    - Aspiration Windows
+    - Null-Move Pruning
+    - Late Move Reductions
+    - Quiescence Search
+    - Iterative Deepening
+    - Transposition Table
+    - Evaluation Cache
     - Material Evaluation
     - Piece-Square Tables
     - Mobility
@@ -24,6 +96,8 @@ class ChessAI:
             "mistake_probability": 0.35,
             "blunder_probability": 0.10,
             "randomness": 0.60,
+            "null_move_pruning": False,
+            "late_move_reductions": False,
         },
         "intermediate": {
             "candidate_moves": 4,
@@ -31,6 +105,8 @@ class ChessAI:
             "mistake_probability": 0.15,
             "blunder_probability": 0.03,
             "randomness": 0.20,
+            "null_move_pruning": True,
+            "late_move_reductions": True,
         },
         "advanced": {
             "candidate_moves": 1,
@@ -38,6 +114,8 @@ class ChessAI:
             "mistake_probability": 0.01,
             "blunder_probability": 0.00,
             "randomness": 0.00,
+            "null_move_pruning": True,
+            "late_move_reductions": True,
         },
     }
 
@@ -50,6 +128,28 @@ class ChessAI:
         chess.KING: 20000,
     }
 
+    # Move ordering stage scores. History scores stay below CHECK_SCORE.
+    HASH_MOVE_SCORE = 10000000
+    CAPTURE_SCORE = 2000000
+    PROMOTION_SCORE = 1500000
+    KILLER_SCORE = 1000000
+    CHECK_SCORE = 500000
+    HISTORY_LIMIT = 400000
+
+    # Quiescence skips captures that cannot lift the score back to the
+    # window even with this much positional compensation.
+    DELTA_MARGIN = 200
+
+    # Null-move pruning: depth reduction of the null-move search and the
+    # shallowest node it is tried at.
+    NULL_MOVE_REDUCTION = 2
+    NULL_MOVE_MIN_DEPTH = 3
+
+    # Late move reductions: quiet moves from this index onwards are searched
+    # one ply shallower at nodes of at least LMR_MIN_DEPTH.
+    LMR_MIN_MOVE_INDEX = 3
+    LMR_MIN_DEPTH = 3
+
     # -----------------------------
     # Piece Square Tables
     # Values adapted from simplified
@@ -122,7 +222,21 @@ class ChessAI:
        -30,-40,-40,-50,-50,-40,-40,-30,
     ]
 
-    def __init__(self, level: str = "intermediate"):
+    def __init__(
+        self,
+        level: str = "intermediate",
+        tt_size_mb: float = 16,
+        time_limit: Optional[float] = None,
+        node_limit: Optional[int] = None,
+        max_depth: Optional[int] = None,
+        use_quiescence: bool = True,
+        workers: int = 1,
+        eval_cache_size: int = 200000,
+        book_path: Optional[str] = None,
+        use_book: bool = True,
+        syzygy_path: Optional[str] = None,
+        instrument: bool = False,
+    ):
 
         self.level = level.lower()
         self.level_config = self.DIFFICULTY_SETTINGS.get(
@@ -140,8 +254,76 @@ class ChessAI:
             self.depth = 3
             self.randomness = 0.10
 
+        self.transposition_table = TranspositionTable(tt_size_mb)
+
+        # Polyglot book at book_path (or the bundled one), then the built-in book.
+        self.opening_book = OpeningBook(book_path)
+        self.use_book = use_book
+
+        # Syzygy tables from syzygy_path (or the bundled directory), if any.
+        self.tablebase = SyzygyTablebase(syzygy_path)
+
+        # Static evaluations survive between moves of the same game.
+        self.eval_cache = EvaluationCache(eval_cache_size)
+
+        # Search budget. Setting a time or node limit switches find_best_move
+        # to iterative deepening, capped at max_depth when given.
+        self.time_limit = time_limit
+        self.node_limit = node_limit
+        self.max_depth = max_depth
+        self._deadline: Optional[float] = None
+        self._enforce_budget = False
+
+        # Cooperative cancellation, checked at every node. Callers that need
+        # to cancel a particular search install a fresh event before starting it.
+        self.stop_event = threading.Event()
+        self.ponder_extra_depth = PONDER_EXTRA_DEPTH
+
+        # Resolve captures and promotions at the horizon before evaluating.
+        self.use_quiescence = use_quiescence
+
+        # Selective search, enabled per difficulty level.
+        self.use_null_move = self.level_config.get("null_move_pruning", False)
+        self.use_lmr = self.level_config.get("late_move_reductions", False)
+
+        # Root moves are split across a process pool when workers > 1.
+        self.workers = max(1, workers)
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._shared_best_score: Any = None
+        self._shared_stop_event: Any = None
+        # Nodes searched by all workers this search, for the node budget.
+        self._shared_node_count: Any = None
+        # In a worker: the same counter, which it adds its nodes to every
+        # NODE_SYNC_INTERVAL nodes, and the last total it saw there.
+        self._worker_node_count: Any = None
+        self._synced_nodes = 0
+        self._shared_nodes_seen = 0
+
+        # Material + PST per (color, piece type, square), and the incrementally
+        # updated key and score of the board being searched (None outside a search).
+        self._piece_square_values = self._build_piece_square_values()
+        self._search_state: Optional[SearchState] = None
+
+        # Quiet-move ordering heuristics: two killer slots per ply and a
+        # [color][from][to] history table, both refreshed per search.
+        self._root_ply = 0
+        self.killer_moves: list[list[Optional[chess.Move]]] = [[None, None] for _ in range(MAX_SEARCH_DEPTH)]
+        self.history_scores: list[list[list[int]]] = [[[0] * 64 for _ in range(64)] for _ in range(2)]
+
+        # Per-phase timing and cutoff statistics, off unless requested.
+        self.profiler: Optional[SearchProfiler] = None
+        if instrument:
+            self.enable_instrumentation()
+
         # Statistics (used later in sidebar)
         self.nodes_searched = 0
+        self.qnodes_searched = 0
+        self.aspiration_researches = 0
+        self.null_move_cutoffs = 0
+        self.lmr_reductions = 0
+        self.lmr_researches = 0
+        self.tablebase_hits = 0
+        self.last_depth = 0
         self.last_search_time = 0.0
         self.last_evaluation = 0
         self.last_best_move: Optional[chess.Move] = None
@@ -175,57 +357,400 @@ class ChessAI:
 
         return bonus if piece.color == chess.WHITE else -bonus
 
+    def _build_piece_square_values(self) -> list[list[list[int]]]:
+        """Precompute material + PST for every piece on every square, indexed [color][piece_type][square]."""
+        values: list[list[list[int]]] = [[[0] * 64 for _ in range(7)] for _ in range(2)]
+        for color in chess.COLORS:
+            for piece_type in chess.PIECE_TYPES:
+                piece = chess.Piece(piece_type, color)
+                for square in chess.SQUARES:
+                    values[color][piece_type][square] = (
+                        self._material_score(piece) + self._piece_square_score(piece, square)
+                    )
+        return values
+
+    def enable_instrumentation(self, enabled: bool = True) -> None:
+        """Turn per-phase search timing on or off."""
+        if enabled and self.profiler is None:
+            self.profiler = SearchProfiler()
+            self.profiler.attach(self)
+        elif not enabled and self.profiler is not None:
+            self.profiler.detach(self)
+            self.profiler = None
+
+    def _begin_search_state(self, board: chess.Board) -> None:
+        """Start tracking the Zobrist key and material of the board being searched."""
+        self._search_state = SearchState(board, self._piece_square_values, self.evaluate_material(board))
+
+    def _make_move(self, board: chess.Board, move: chess.Move) -> None:
+        """Push a move, keeping the search state in step."""
+        if self._search_state is not None:
+            self._search_state.push(board, move)
+        else:
+            board.push(move)
+
+    def _unmake_move(self, board: chess.Board) -> None:
+        """Pop the last move and restore the search state."""
+        if self._search_state is not None:
+            self._search_state.pop(board)
+        else:
+            board.pop()
+
+    def _position_key(self, board: chess.Board) -> int:
+        if self._search_state is not None:
+            return self._search_state.key
+        return zobrist_key(board)
+
     def _get_book_move(self, board: chess.Board) -> Optional[chess.Move]:
-        """Return a book move for the current position if the FEN exists in the opening book."""
-        fen = board.fen()
-        moves = OPENING_BOOK.get(fen)
-        if not moves:
+        """Return a book move for the current position, looked up by Zobrist key."""
+        if not self.use_book:
             return None
+        move = self.opening_book.choose_move(board)
+        if move is not None and move in board.legal_moves:
+            return move
+        return None
 
-        book_move = random.choice(moves)
-        try:
-            move = chess.Move.from_uci(book_move)
-        except ValueError:
+    def _get_tablebase_move(self, board: chess.Board) -> Optional[chess.Move]:
+        """Return the tablebase move for an endgame root position, updating the statistics."""
+        if not self.tablebase.available:
             return None
 
-        if move in board.legal_moves:
-            return move
+        self.tablebase.new_search()
+        start_time = time.perf_counter()
+        result = self.tablebase.best_move(board)
+        if result is None:
+            return None
 
-        return None
+        move, wdl = result
+        score = TABLEBASE_WIN_SCORE if wdl == 2 else -TABLEBASE_WIN_SCORE if wdl == -2 else 0
+        self._reset_search_counters()
+        self.tablebase_hits = 1
+        self.last_depth = 0
+        self.last_search_time = time.perf_counter() - start_time
+        self.last_evaluation = score if board.turn == chess.WHITE else -score
+        self.last_best_move = move
+        self.last_best_move_san = board.san(move)
+        self.has_completed_search = True
+        return move
+
+    @property
+    def iterative_deepening(self) -> bool:
+        return self.time_limit is not None or self.node_limit is not None
+
+    def stop(self) -> None:
+        """Ask the running search to stop as soon as possible."""
+        self.stop_event.set()
+
+    # Per-search counters, summed across parallel workers.
+    SEARCH_COUNTERS = (
+        "nodes_searched",
+        "qnodes_searched",
+        "aspiration_researches",
+        "null_move_cutoffs",
+        "lmr_reductions",
+        "lmr_researches",
+        "tablebase_hits",
+    )
+
+    def _reset_search_counters(self) -> None:
+        for name in self.SEARCH_COUNTERS:
+            setattr(self, name, 0)
+
+    def _search_counters(self) -> dict[str, int]:
+        return {name: getattr(self, name) for name in self.SEARCH_COUNTERS}
+
+    def _add_search_counters(self, counters: dict[str, int]) -> None:
+        for name, value in counters.items():
+            setattr(self, name, getattr(self, name) + value)
+
+    def _check_budget(self) -> None:
+        """Abort the running iteration when stopped or once the time or node budget is spent."""
+        if self.stop_event.is_set():
+            raise SearchAborted()
+        if not self._enforce_budget:
+            return
+        if self.node_limit is not None:
+            nodes = self.nodes_searched + self.qnodes_searched
+            if self._worker_node_count is not None:
+                nodes = self._sync_node_count(nodes)
+            if nodes >= self.node_limit:
+                raise SearchAborted()
+        if self._deadline is not None and time.perf_counter() >= self._deadline:
+            raise SearchAborted()
+
+    def _sync_node_count(self, nodes: int, force: bool = False) -> int:
+        """Worker side: publish this worker's new nodes and return the estimated total across workers."""
+        unsynced = nodes - self._synced_nodes
+        if unsynced >= NODE_SYNC_INTERVAL or force:
+            with self._worker_node_count.get_lock():
+                self._worker_node_count.value += unsynced
+                self._shared_nodes_seen = self._worker_node_count.value
+            self._synced_nodes = nodes
+            unsynced = 0
+        return self._shared_nodes_seen + unsynced
+
+    def _rank_root_moves(
+        self,
+        board: chess.Board,
+        ordered_moves: list[chess.Move],
+        depth: Optional[int] = None,
+        alpha: int = -INFINITY_SCORE,
+        beta: int = INFINITY_SCORE,
+    ) -> list[tuple[chess.Move, int]]:
+        """
+        Score every legal root move and return them best-first.
 
-    def _rank_root_moves(self, board: chess.Board, ordered_moves: list[chess.Move]) -> list[tuple[chess.Move, int]]:
-        """Evaluate each legal root move once, reusing the existing minimax search logic."""
-        maximizing = board.turn == chess.WHITE
+        ``alpha``/``beta`` form the root window from the side to move's
+        point of view; returned scores are from White's point of view.
+        Only the first move gets an exact score, the rest may be bounds.
+        """
+        depth = self.depth if depth is None else depth
+        if self.workers > 1 and len(ordered_moves) > 1:
+            return self._rank_root_moves_parallel(board, ordered_moves, depth, alpha, beta)
+
+        sign = 1 if board.turn == chess.WHITE else -1
         ranked_moves: list[tuple[chess.Move, int]] = []
 
-        alpha = -float("inf")
-        beta = float("inf")
+        for index, move in enumerate(ordered_moves):
+            self._make_move(board, move)
+            score = self._search_child(board, depth - 1, alpha, beta, index == 0)
+            self._unmake_move(board)
 
-        for move in ordered_moves:
-            board.push(move)
-            evaluation = self.minimax(
-                board,
-                self.depth - 1,
-                alpha,
-                beta,
-                not maximizing,
+            ranked_moves.append((move, score * sign))
+
+            if score > alpha:
+                alpha = score
+            if alpha >= beta:
+                # Aspiration fail-high: the caller re-searches with a wider window.
+                break
+
+        # Stable sort keeps the search order among equal scores.
+        ranked_moves.sort(key=lambda item: item[1] * sign, reverse=True)
+        return ranked_moves
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        """Start the worker pool on first use; it is reused for later searches."""
+        if self._executor is None:
+            # Spawn rather than fork: the search usually runs off the UI thread.
+            context = multiprocessing.get_context("spawn")
+            self._shared_best_score = context.Value("q", -INFINITY_SCORE)
+            self._shared_stop_event = context.Event()
+            self._shared_node_count = context.Value("q", 0)
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.workers,
+                mp_context=context,
+                initializer=_init_search_worker,
+                initargs=(
+                    self.level,
+                    self.transposition_table.size_mb,
+                    self.use_quiescence,
+                    self.tablebase.path,
+                    self._shared_best_score,
+                    self._shared_stop_event,
+                    self._shared_node_count,
+                ),
             )
-            board.pop()
+        return self._executor
+
+    def close(self) -> None:
+        """Shut down the parallel search pool, if one was started, and release the book file."""
+        self.opening_book.close()
+        self.tablebase.close()
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+            self._shared_best_score = None
+            self._shared_stop_event = None
+            self._shared_node_count = None
+
+    def _rank_root_moves_parallel(
+        self,
+        board: chess.Board,
+        ordered_moves: list[chess.Move],
+        depth: int,
+        alpha: int = -INFINITY_SCORE,
+        beta: int = INFINITY_SCORE,
+    ) -> list[tuple[chess.Move, int]]:
+        """
+        Search root moves concurrently in worker processes.
 
+        Workers share the best root score found so far as their alpha bound,
+        so the top move matches the serial search at the same depth.
+        Non-best moves only get bounds, exactly as in the serial search.
+        """
+        executor = self._get_executor()
+        self._shared_stop_event.clear()
+        with self._shared_best_score.get_lock():
+            self._shared_best_score.value = alpha
+
+        time_left = None
+        if self._enforce_budget and self._deadline is not None:
+            time_left = max(0.0, self._deadline - time.perf_counter())
+
+        # Workers share one node count, starting from what earlier iterations spent.
+        node_limit = self.node_limit if self._enforce_budget else None
+        with self._shared_node_count.get_lock():
+            self._shared_node_count.value = self.nodes_searched + self.qnodes_searched
+
+        # Search the first (expected best) move alone so the others start
+        # with a useful alpha bound, then fan the rest out.
+        futures = [executor.submit(_search_root_move, board, ordered_moves[0], depth, beta, True, time_left, node_limit)]
+        if self._wait_for_worker(futures[0], futures) is None:
+            raise SearchAborted()
+        futures += [
+            executor.submit(_search_root_move, board, move, depth, beta, False, time_left, node_limit)
+            for move in ordered_moves[1:]
+        ]
+
+        sign = 1 if board.turn == chess.WHITE else -1
+        ranked_moves: list[tuple[chess.Move, int]] = []
+        for move, future in zip(ordered_moves, futures):
+            result = self._wait_for_worker(future, futures)
+            if result is None:
+                for pending in futures:
+                    pending.cancel()
+                raise SearchAborted()
+
+            evaluation, counters = result
+            self._add_search_counters(counters)
             ranked_moves.append((move, evaluation))
 
-            if maximizing:
-                alpha = max(alpha, evaluation)
-            else:
-                beta = min(beta, evaluation)
+        # Stable sort keeps the original order among equal scores, like the serial search.
+        ranked_moves.sort(key=lambda item: item[1] * sign, reverse=True)
+        return ranked_moves
 
-        if maximizing:
-            ranked_moves.sort(key=lambda item: item[1], reverse=True)
-        else:
-            ranked_moves.sort(key=lambda item: item[1])
+    def _wait_for_worker(self, future: Any, futures: list[Any]) -> Optional[tuple[int, dict[str, int]]]:
+        """Wait for one worker result, forwarding a stop request to the pool meanwhile."""
+        while True:
+            try:
+                return future.result(timeout=0.05)
+            except FutureTimeoutError:
+                if self.stop_event.is_set():
+                    self._shared_stop_event.set()
+                    for pending in futures:
+                        pending.cancel()
+                    raise SearchAborted()
+
+    def _search_root_move(
+        self,
+        board: chess.Board,
+        move: chess.Move,
+        depth: int,
+        beta: int,
+        full_window: bool,
+        time_left: Optional[float],
+        node_limit: Optional[int],
+        best_score: Any,
+    ) -> Optional[tuple[int, dict[str, int]]]:
+        """Worker side of the parallel root search: score one root move."""
+        self._reset_search_counters()
+        self.transposition_table.new_search()
+        self._root_ply = len(board.move_stack)
+        self.killer_moves = [[None, None] for _ in range(MAX_SEARCH_DEPTH)]
+        self._deadline = time.perf_counter() + time_left if time_left is not None else None
+        self.node_limit = node_limit
+        self._synced_nodes = 0
+        self._shared_nodes_seen = self._worker_node_count.value
+        self._enforce_budget = time_left is not None or node_limit is not None
+
+        # The shared best score is stored from the root side's point of view.
+        alpha = int(best_score.value)
+
+        self._begin_search_state(board)
+        try:
+            self._make_move(board, move)
+            score = self._search_child(board, depth - 1, alpha, beta, full_window)
+        except SearchAborted:
+            return None
+        finally:
+            self._search_state = None
+            self._enforce_budget = False
+            self._sync_node_count(self.nodes_searched + self.qnodes_searched, force=True)
+
+        with best_score.get_lock():
+            if score > best_score.value:
+                best_score.value = score
+
+        self._unmake_move(board)
+        sign = 1 if board.turn == chess.WHITE else -1
+        return score * sign, self._search_counters()
+
+    def _unwind(self, board: chess.Board, root_ply: int) -> None:
+        """Undo the moves an aborted search left on the board."""
+        while len(board.move_stack) > root_ply:
+            self._unmake_move(board)
+
+    def _iterative_deepening(
+        self,
+        board: chess.Board,
+        ordered_moves: list[chess.Move],
+        max_depth: Optional[int] = None,
+        use_budget: bool = True,
+        on_iteration: Optional[Callable[[int, list[tuple[chess.Move, int]]], None]] = None,
+    ) -> list[tuple[chess.Move, int]]:
+        """
+        Search depth 1, 2, 3... until the budget runs out (or the search is
+        stopped) and return the ranking from the last iteration that completed.
+        """
+        if max_depth is None:
+            max_depth = self.max_depth if self.max_depth is not None else MAX_SEARCH_DEPTH
+        root_ply = len(board.move_stack)
+        sign = 1 if board.turn == chess.WHITE else -1
+        ranked_moves: list[tuple[chess.Move, int]] = []
+
+        for depth in range(1, max_depth + 1):
+            # The first iteration always completes so there is a move to return.
+            self._enforce_budget = use_budget and bool(ranked_moves)
+            previous_score = ranked_moves[0][1] * sign if ranked_moves else None
+            try:
+                ranked_moves = self._aspiration_search(board, ordered_moves, depth, previous_score)
+            except SearchAborted:
+                self._unwind(board, root_ply)
+                break
+            finally:
+                self._enforce_budget = False
+
+            self.last_depth = depth
+            if on_iteration is not None:
+                on_iteration(depth, ranked_moves)
+
+            # Seed the next iteration with this iteration's ranking.
+            ordered_moves = [move for move, _ in ranked_moves]
+
+            if abs(ranked_moves[0][1]) >= MATE_SCORE:
+                break
+            if not use_budget:
+                continue
+            if self.node_limit is not None and self.nodes_searched + self.qnodes_searched >= self.node_limit:
+                break
+            if self._deadline is not None and time.perf_counter() >= self._deadline:
+                break
 
         return ranked_moves
 
+    def _aspiration_search(
+        self,
+        board: chess.Board,
+        ordered_moves: list[chess.Move],
+        depth: int,
+        previous_score: Optional[int],
+    ) -> list[tuple[chess.Move, int]]:
+        """Search a narrow window around the previous score, widening it on failure."""
+        if previous_score is None or abs(previous_score) >= MATE_SCORE:
+            return self._rank_root_moves(board, ordered_moves, depth)
+
+        alpha = previous_score - ASPIRATION_WINDOW
+        beta = previous_score + ASPIRATION_WINDOW
+        ranked_moves = self._rank_root_moves(board, ordered_moves, depth, alpha, beta)
+
+        sign = 1 if board.turn == chess.WHITE else -1
+        best_score = ranked_moves[0][1] * sign
+        if alpha < best_score < beta:
+            return ranked_moves
+
+        self.aspiration_researches += 1
+        return self._rank_root_moves(board, ordered_moves, depth)
+
     def _choose_move_by_difficulty(self, board: chess.Board, ranked_moves: list[tuple[chess.Move, int]]) -> tuple[chess.Move, int]:
         """Select a move from the ranked list using lightweight difficulty-aware heuristics."""
         if not ranked_moves:
@@ -279,47 +804,138 @@ class ChessAI:
 
         return selected_move, selected_score
 
-    def _order_moves(self, board: chess.Board, moves: list[chess.Move]) -> list[chess.Move]:
-        """Return legal moves sorted by lightweight tactical heuristics."""
+    def _gives_check(self, board: chess.Board, move: chess.Move) -> bool:
+        """
+        Cheap check test from attack tables, without pushing the move.
+
+        Covers direct and discovered checks; castling falls back to
+        ``board.gives_check``.
+        """
+        us = board.turn
+        king = board.king(not us)
+        if king is None:
+            return False
+        if board.is_castling(move):
+            return board.gives_check(move)
+
+        from_bb = chess.BB_SQUARES[move.from_square]
+        to_bb = chess.BB_SQUARES[move.to_square]
+        occupied = (board.occupied & ~from_bb) | to_bb
+        if board.is_en_passant(move):
+            occupied &= ~chess.BB_SQUARES[move.to_square - 8 if us == chess.WHITE else move.to_square + 8]
+
+        piece_type = move.promotion if move.promotion is not None else board.piece_type_at(move.from_square)
+        king_bb = chess.BB_SQUARES[king]
+
+        if piece_type == chess.PAWN:
+            if chess.BB_PAWN_ATTACKS[us][move.to_square] & king_bb:
+                return True
+        elif piece_type == chess.KNIGHT:
+            if chess.BB_KNIGHT_ATTACKS[move.to_square] & king_bb:
+                return True
+
+        # Sliders (including the moved piece on its new square) seen from the king.
+        ours = board.occupied_co[us] & ~from_bb
+        diagonal = (board.bishops | board.queens) & ours
+        straight = (board.rooks | board.queens) & ours
+        if piece_type in (chess.BISHOP, chess.QUEEN):
+            diagonal |= to_bb
+        if piece_type in (chess.ROOK, chess.QUEEN):
+            straight |= to_bb
+
+        if diagonal & chess.BB_DIAG_ATTACKS[king][chess.BB_DIAG_MASKS[king] & occupied]:
+            return True
+        if straight & (
+            chess.BB_RANK_ATTACKS[king][chess.BB_RANK_MASKS[king] & occupied]
+            | chess.BB_FILE_ATTACKS[king][chess.BB_FILE_MASKS[king] & occupied]
+        ):
+            return True
+        return False
+
+    def _order_moves(
+        self,
+        board: chess.Board,
+        moves: list[chess.Move],
+        hash_move: Optional[chess.Move] = None,
+        ply: Optional[int] = None,
+    ) -> list[chess.Move]:
+        """
+        Return legal moves sorted in stages: hash move, captures (MVV-LVA),
+        promotions, killer moves, quiet checks, then quiet moves by history.
+
+        Only piece lookups and attack tables are used; no move is pushed.
+        """
         scored_moves: list[tuple[int, chess.Move]] = []
+        killers = self.killer_moves[ply] if ply is not None and ply < len(self.killer_moves) else ()
+        history = self.history_scores[board.turn]
+        center_squares = (chess.E4, chess.D4, chess.E5, chess.D5)
 
         for move in moves:
-            piece = board.piece_at(move.from_square)
-            captured_piece = board.piece_at(move.to_square)
-            score = 0
+            # The transposition table's best move is the most likely cutoff.
+            if move == hash_move:
+                scored_moves.append((self.HASH_MOVE_SCORE, move))
+                continue
 
-            board.push(move)
-            try:
-                # Checkmate is the strongest possible outcome and should be searched first.
-                if board.is_checkmate():
-                    score += 1000000
+            captured_type = board.piece_type_at(move.to_square)
+            if captured_type is None and board.is_en_passant(move):
+                captured_type = chess.PAWN
+
+            if captured_type is not None or move.promotion is not None:
+                score = 0
+
+                # MVV-LVA: prefer capturing a more valuable enemy piece with a less valuable attacker.
+                if captured_type is not None:
+                    victim_value = self.PIECE_VALUES[captured_type]
+                    attacker_value = self.PIECE_VALUES[board.piece_type_at(move.from_square)]
+                    score += self.CAPTURE_SCORE + victim_value * 10 - attacker_value
 
                 # Promotions are often tactically important and should be tried early.
                 if move.promotion is not None:
-                    score += 500000
+                    score += self.PROMOTION_SCORE + self.PIECE_VALUES[move.promotion]
 
-                # MVV-LVA: prefer capturing a more valuable enemy piece with a less valuable attacker.
-                if captured_piece is not None:
-                    victim_value = self.PIECE_VALUES[captured_piece.piece_type]
-                    attacker_value = self.PIECE_VALUES[piece.piece_type]
-                    score += victim_value * 10 - attacker_value
+                scored_moves.append((score, move))
+                continue
 
-                # Checks are usually stronger than quiet moves and should be preferred.
-                if board.is_check():
-                    score += 10000
+            if move in killers:
+                score = self.KILLER_SCORE - killers.index(move)
+            elif self._gives_check(board, move):
+                score = self.CHECK_SCORE
+            else:
+                score = history[move.from_square][move.to_square]
 
                 # Small bonus for moving toward the center.
-                center_squares = {chess.E4, chess.D4, chess.E5, chess.D5}
                 if move.to_square in center_squares:
                     score += 20
-            finally:
-                board.pop()
 
             scored_moves.append((score, move))
 
         scored_moves.sort(key=lambda item: item[0], reverse=True)
         return [move for _, move in scored_moves]
 
+    def _record_cutoff(self, board: chess.Board, move: chess.Move, depth: int) -> None:
+        """Remember a quiet move that caused a beta cutoff as a killer and in the history table."""
+        if board.is_capture(move) or move.promotion is not None:
+            return
+
+        ply = len(board.move_stack) - self._root_ply
+        if 0 <= ply < len(self.killer_moves):
+            killers = self.killer_moves[ply]
+            if killers[0] != move:
+                killers[1] = killers[0]
+                killers[0] = move
+
+        history = self.history_scores[board.turn]
+        history[move.from_square][move.to_square] += depth * depth
+        if history[move.from_square][move.to_square] > self.HISTORY_LIMIT:
+            self._age_history()
+
+    def _age_history(self) -> None:
+        """Halve every history score so older cutoffs fade out."""
+        for color_table in self.history_scores:
+            for row in color_table:
+                for index, value in enumerate(row):
+                    row[index] = value // 2
+
     def get_piece_square_value(self, piece: chess.Piece, square: int) -> int:
         """Get the PST bonus for a piece on a square."""
         return self._piece_square_score(piece, square)
@@ -398,121 +1014,361 @@ class ChessAI:
         return score
 
 
-    def evaluate_board(self, board: chess.Board) -> int:
+    def evaluate_board(self, board: chess.Board, material: Optional[int] = None, key: Optional[int] = None) -> int:
         """
         Overall board evaluation.
 
         Positive score = White advantage
 
         Negative score = Black advantage
-        """
 
-        if board.is_checkmate():
+        ``material`` and ``key`` may carry an already known material + PST
+        score and Zobrist key (the search passes its incremental state).
 
-            if board.turn == chess.WHITE:
-                return -100000
+        Results are cached by Zobrist key across searches.
+        """
 
-            return 100000
+        if key is None:
+            key = zobrist_key(board)
+        cached = self.eval_cache.get(key)
+        if cached is not None:
+            return cached
 
-        if board.is_stalemate():
-            return 0
+        if board.is_checkmate():
+            score = -MATE_SCORE if board.turn == chess.WHITE else MATE_SCORE
 
-        if board.is_insufficient_material():
-            return 0
+        elif board.is_stalemate() or board.is_insufficient_material():
+            score = 0
 
-        score = 0
+        else:
+            score = 0
 
-        score += self.evaluate_material(board)
+            score += self.evaluate_material(board) if material is None else material
 
-        score += self.evaluate_mobility(board)
+            score += self.evaluate_mobility(board)
 
-        score += self.evaluate_center_control(board)
+            score += self.evaluate_center_control(board)
 
+        self.eval_cache.put(key, score)
         return score
 
 
     # ----------------------------------------------------
-    # Minimax + Alpha Beta
+    # Negamax + Alpha Beta
     # ----------------------------------------------------
 
-    def minimax(
-        self,
-        board: chess.Board,
-        depth: int,
-        alpha: float,
-        beta: float,
-        maximizing: bool,
-    ) -> int:
+    def _evaluate_relative(self, board: chess.Board) -> int:
+        """Static evaluation from the side to move's point of view."""
+        state = self._search_state
+        if state is None:
+            score = self.evaluate_board(board)
+        else:
+            score = self.evaluate_board(board, state.material, state.key)
+        return score if board.turn == chess.WHITE else -score
 
-        self.nodes_searched += 1
+    def _search_child(self, board: chess.Board, depth: int, alpha: int, beta: int, full_window: bool) -> int:
+        """
+        Score the move just made, from the mover's point of view, using
+        principal variation search: later moves are first tried with a
+        null window and only re-searched when they might beat alpha.
+        """
+        if full_window:
+            return -self._negamax(board, depth, -beta, -alpha)
 
-        if depth == 0 or board.is_game_over():
-            return self.evaluate_board(board)
+        score = -self._negamax(board, depth, -alpha - 1, -alpha)
+        if alpha < score < beta:
+            score = -self._negamax(board, depth, -beta, -alpha)
+        return score
 
-        if maximizing:
+    def _null_move_allowed(self, board: chess.Board, depth: int, beta: int) -> bool:
+        """
+        Return True when passing the turn is a safe test at this node: deep
+        enough, not right after another null move, not in a mate window, and
+        the side to move has a piece besides pawns and king. Pawn endings are
+        where zugzwang makes "passing is no better than moving" false.
+        """
+        if depth < self.NULL_MOVE_MIN_DEPTH or abs(beta) >= MATE_SCORE:
+            return False
+        if board.move_stack and not board.peek():
+            return False
+        pieces = board.occupied_co[board.turn] & ~(board.pawns | board.kings)
+        return pieces != 0
 
-            max_eval = -float("inf")
-            ordered_moves = self._order_moves(board, list(board.legal_moves))
+    def _generate_moves(self, board: chess.Board) -> list[chess.Move]:
+        return list(board.legal_moves)
 
-            for move in ordered_moves:
+    def _is_terminal(self, board: chess.Board) -> bool:
+        return board.is_game_over()
 
-                board.push(move)
+    def _negamax(self, board: chess.Board, depth: int, alpha: int, beta: int) -> int:
+        """Alpha-beta negamax core; scores are from the side to move's point of view."""
 
-                evaluation = self.minimax(
-                    board,
-                    depth - 1,
-                    alpha,
-                    beta,
-                    False,
-                )
+        if depth <= 0 and self.use_quiescence:
+            return self._quiescence(board, alpha, beta)
 
-                board.pop()
+        self.nodes_searched += 1
+        self._check_budget()
+
+        if depth <= 0:
+            return self._evaluate_relative(board)
+
+        original_alpha = alpha
+        original_beta = beta
+
+        # Probe before move generation: a deep enough entry may end the node outright.
+        key = self._position_key(board)
+        hash_move = None
+        entry = self.transposition_table.probe(key)
+        if entry is not None:
+            hash_move = entry.best_move
+            if entry.depth >= depth:
+                if entry.flag == EXACT:
+                    return entry.score
+                if entry.flag == LOWER_BOUND:
+                    alpha = max(alpha, entry.score)
+                elif entry.flag == UPPER_BOUND:
+                    beta = min(beta, entry.score)
+                if alpha >= beta:
+                    return entry.score
+
+        if self._is_terminal(board):
+            return self._evaluate_relative(board)
+
+        # Tables assume the fifty-move counter was just reset, so only
+        # probe right after a capture or pawn move.
+        if self.tablebase.available and board.halfmove_clock == 0:
+            tablebase_score = self.tablebase.score(board)
+            if tablebase_score is not None:
+                self.tablebase_hits += 1
+                return tablebase_score
+
+        in_check = board.is_check()
+        ply = len(board.move_stack) - self._root_ply
+
+        if self.use_null_move and ply > 0 and not in_check and self._null_move_allowed(board, depth, beta):
+            # Pass the turn and search shallower with a null window around beta:
+            # if the opponent still cannot get below beta, a real move will not either.
+            self._make_move(board, chess.Move.null())
+            score = -self._negamax(board, depth - 1 - self.NULL_MOVE_REDUCTION, -beta, -beta + 1)
+            self._unmake_move(board)
+            if score >= beta:
+                self.null_move_cutoffs += 1
+                # Mate scores found after passing are not proven; report the bound only.
+                return beta if score >= MATE_SCORE else score
+
+        best_score = -INFINITY_SCORE
+        best_move = None
+        ordered_moves = self._order_moves(board, self._generate_moves(board), hash_move, ply)
+        killers = self.killer_moves[ply] if ply < len(self.killer_moves) else ()
+
+        for index, move in enumerate(ordered_moves):
+
+            reduce = (
+                self.use_lmr
+                and index >= self.LMR_MIN_MOVE_INDEX
+                and depth >= self.LMR_MIN_DEPTH
+                and not in_check
+                and move.promotion is None
+                and not board.is_capture(move)
+                and move not in killers
+                and not self._gives_check(board, move)
+            )
 
-                max_eval = max(max_eval, evaluation)
+            self._make_move(board, move)
+            if reduce:
+                # Late quiet moves rarely matter: try them one ply shallower
+                # and only search them fully if they beat alpha anyway.
+                self.lmr_reductions += 1
+                score = -self._negamax(board, depth - 2, -alpha - 1, -alpha)
+                if score > alpha:
+                    self.lmr_researches += 1
+                    score = self._search_child(board, depth - 1, alpha, beta, False)
+            else:
+                score = self._search_child(board, depth - 1, alpha, beta, index == 0)
+            self._unmake_move(board)
+
+            if score > best_score:
+                best_score = score
+                best_move = move
+
+            if score > alpha:
+                alpha = score
+
+            if alpha >= beta:
+                self._record_cutoff(board, move, depth)
+                break
+
+        # Read once: the UI thread may switch profiling off mid-search.
+        profiler = self.profiler
+        if profiler is not None:
+            profiler.record_node(index + 1, alpha >= beta)
+
+        if best_score <= original_alpha:
+            # Every move failed low, so none of them is known to be best.
+            flag = UPPER_BOUND
+            best_move = None
+        elif best_score >= original_beta:
+            flag = LOWER_BOUND
+        else:
+            flag = EXACT
+        self.transposition_table.store(key, depth, best_score, flag, best_move)
 
-                alpha = max(alpha, evaluation)
+        return best_score
 
-                if beta <= alpha:
-                    break
+    def _white_window(self, board: chess.Board, alpha: float, beta: float) -> tuple[int, int]:
+        """Convert a White-perspective window into the side to move's integer window."""
+        alpha = int(max(-INFINITY_SCORE, min(INFINITY_SCORE, alpha)))
+        beta = int(max(-INFINITY_SCORE, min(INFINITY_SCORE, beta)))
+        if board.turn == chess.WHITE:
+            return alpha, beta
+        return -beta, -alpha
 
-            return max_eval
+    def minimax(
+        self,
+        board: chess.Board,
+        depth: int,
+        alpha: float,
+        beta: float,
+        maximizing: bool,
+    ) -> int:
+        """
+        White-perspective search value, kept for compatibility.
 
-        else:
+        ``maximizing`` is implied by the side to move; the work is done
+        by the negamax core.
+        """
+        low, high = self._white_window(board, alpha, beta)
+        score = self._negamax(board, depth, low, high)
+        return score if board.turn == chess.WHITE else -score
+
+    def _tactical_moves(self, board: chess.Board) -> list[chess.Move]:
+        """Return legal captures plus non-capturing promotions."""
+        moves = list(board.generate_legal_captures())
+        seventh_rank = chess.BB_RANK_7 if board.turn == chess.WHITE else chess.BB_RANK_2
+        promoting_pawns = board.pawns & board.occupied_co[board.turn] & seventh_rank
+        if promoting_pawns:
+            for move in board.generate_legal_moves(from_mask=promoting_pawns):
+                if move.promotion is not None and not board.is_capture(move):
+                    moves.append(move)
+        return moves
+
+    def _quiescence(self, board: chess.Board, alpha: int, beta: int) -> int:
+        """
+        Search only captures and promotions until the position is quiet,
+        so the horizon never stops in the middle of an exchange.
+        """
 
-            min_eval = float("inf")
-            ordered_moves = self._order_moves(board, list(board.legal_moves))
+        self.qnodes_searched += 1
+        self._check_budget()
 
-            for move in ordered_moves:
+        stand_pat = self._evaluate_relative(board)
+        if abs(stand_pat) >= MATE_SCORE or stand_pat >= beta:
+            return stand_pat
 
-                board.push(move)
+        alpha = max(alpha, stand_pat)
+        best_score = stand_pat
 
-                evaluation = self.minimax(
-                    board,
-                    depth - 1,
-                    alpha,
-                    beta,
-                    True,
-                )
+        for move in self._order_moves(board, self._tactical_moves(board)):
 
-                board.pop()
+            # Delta pruning: skip captures that cannot reach the window.
+            captured_type = chess.PAWN if board.is_en_passant(move) else board.piece_type_at(move.to_square)
+            gain = self.PIECE_VALUES[captured_type] if captured_type is not None else 0
+            if move.promotion is not None:
+                gain += self.PIECE_VALUES[move.promotion] - self.PIECE_VALUES[chess.PAWN]
+            # The pruned move still bounds the result, which keeps fail-soft
+            # scores valid for the transposition table.
+            optimistic = stand_pat + gain + self.DELTA_MARGIN
+            if optimistic <= alpha:
+                best_score = max(best_score, optimistic)
+                continue
 
-                min_eval = min(min_eval, evaluation)
+            self._make_move(board, move)
+            score = -self._quiescence(board, -beta, -alpha)
+            self._unmake_move(board)
 
-                beta = min(beta, evaluation)
+            if score > best_score:
+                best_score = score
+            if score > alpha:
+                alpha = score
+            if alpha >= beta:
+                break
 
-                if beta <= alpha:
-                    break
+        return best_score
+
+    def quiescence(
+        self,
+        board: chess.Board,
+        alpha: float,
+        beta: float,
+        maximizing: bool,
+    ) -> int:
+        """White-perspective quiescence value; see ``minimax``."""
+        low, high = self._white_window(board, alpha, beta)
+        score = self._quiescence(board, low, high)
+        return score if board.turn == chess.WHITE else -score
 
-            return min_eval
     # ----------------------------------------------------
     # Root Move Selection
     # ----------------------------------------------------
 
-    def find_best_move(self, board: chess.Board) -> Optional[chess.Move]:
+    def predict_reply(self, board: chess.Board) -> Optional[chess.Move]:
+        """Return the opponent's expected reply from the transposition table, if known and legal."""
+        entry = self.transposition_table.probe(zobrist_key(board))
+        if entry is None or entry.best_move is None:
+            return None
+        if entry.best_move in board.legal_moves:
+            return entry.best_move
+        return None
+
+    def principal_variation(
+        self,
+        board: chess.Board,
+        first_move: Optional[chess.Move] = None,
+        max_length: int = MAX_SEARCH_DEPTH,
+    ) -> list[chess.Move]:
+        """Follow the best moves stored in the transposition table, starting with ``first_move`` if given."""
+        line = board.copy(stack=False)
+        seen = {zobrist_key(line)}
+        moves: list[chess.Move] = []
+        move = first_move
+        while len(moves) < max_length:
+            if move is None:
+                entry = self.transposition_table.probe(zobrist_key(line))
+                move = entry.best_move if entry is not None else None
+            if move is None or move not in line.legal_moves:
+                break
+            moves.append(move)
+            line.push(move)
+            key = zobrist_key(line)
+            if key in seen:
+                break
+            seen.add(key)
+            move = None
+        return moves
+
+    def ponder(
+        self,
+        board: chess.Board,
+        on_iteration: Optional[Callable[[int, list[tuple[chess.Move, int]]], None]] = None,
+    ) -> Optional[chess.Move]:
+        """Search a predicted position beyond the normal depth until finished or stopped."""
+        return self.find_best_move(board, on_iteration, infinite=True, max_depth=self.depth + self.ponder_extra_depth)
+
+    def find_best_move(
+        self,
+        board: chess.Board,
+        on_iteration: Optional[Callable[[int, list[tuple[chess.Move, int]]], None]] = None,
+        infinite: bool = False,
+        max_depth: Optional[int] = None,
+    ) -> Optional[chess.Move]:
         """
         Search from the root and return the best legal move
         for the side to move, using the existing minimax +
         alpha-beta search.
+
+        ``infinite`` deepens until ``max_depth`` or ``stop()``, ignoring
+        the time and node budget; ``on_iteration`` is called with the
+        depth and ranking after every completed iteration.
         """
 
         legal_moves = list(board.legal_moves)
@@ -520,9 +1376,14 @@ class ChessAI:
         if not legal_moves:
             return None
 
+        profiler = self.profiler
+        if profiler is not None:
+            profiler.reset()
+
         book_move = self._get_book_move(board)
         if book_move is not None:
-            self.nodes_searched = 0
+            self._reset_search_counters()
+            self.last_depth = 0
             self.last_search_time = 0.0
             self.last_evaluation = 0
             self.last_best_move = book_move
@@ -530,17 +1391,48 @@ class ChessAI:
             self.has_completed_search = True
             return book_move
 
-        ordered_moves = self._order_moves(board, legal_moves)
-
-        self.nodes_searched = 0
+        tablebase_move = self._get_tablebase_move(board)
+        if tablebase_move is not None:
+            return tablebase_move
+
+        self.transposition_table.new_search()
+        self.eval_cache.new_search()
+        self._root_ply = len(board.move_stack)
+        self.killer_moves = [[None, None] for _ in range(MAX_SEARCH_DEPTH)]
+        self._age_history()
+        root_entry = self.transposition_table.probe(zobrist_key(board))
+        hash_move = root_entry.best_move if root_entry is not None else None
+        ordered_moves = self._order_moves(board, legal_moves, hash_move)
+
+        self._reset_search_counters()
+        self.last_depth = 0
         self.last_search_time = 0.0
         self.last_evaluation = 0
         self.last_best_move = None
         self.last_best_move_san = None
         self.has_completed_search = False
         start_time = time.perf_counter()
+        self._deadline = start_time + self.time_limit if self.time_limit is not None else None
+
+        self._begin_search_state(board)
+        try:
+            if infinite or self.iterative_deepening:
+                ranked_moves = self._iterative_deepening(board, ordered_moves, max_depth, not infinite, on_iteration)
+            else:
+                ranked_moves = self._rank_root_moves(board, ordered_moves)
+                self.last_depth = self.depth
+                if on_iteration is not None:
+                    on_iteration(self.depth, ranked_moves)
+        except SearchAborted:
+            self._unwind(board, self._root_ply)
+            ranked_moves = []
+        finally:
+            self._search_state = None
+
+        if not ranked_moves:
+            # Stopped before any iteration finished: fall back to move ordering.
+            ranked_moves = [(ordered_moves[0], 0)]
 
-        ranked_moves = self._rank_root_moves(board, ordered_moves)
         selected_move, selected_score = self._choose_move_by_difficulty(board, ranked_moves)
 
         self.last_search_time = time.perf_counter() - start_time
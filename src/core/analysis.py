@@ -0,0 +1,218 @@
+"""Batch engine analysis of PGN archives.
+
+Run from the repository root::
+
+    python -m src.core.analysis games.pgn --output annotated.pgn \\
+        --movetime 0.5 --workers 4
+
+Games are read one at a time, analysed on a process pool and written back in
+their original order as soon as each is finished, so memory use depends on
+the number of workers rather than the size of the archive. Every move gets an
+``[%eval]`` comment; inaccuracies, mistakes and blunders get a NAG and the
+engine's line as a variation.
+"""
+
+import argparse
+import io
+import multiprocessing
+import sys
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from typing import Iterator, NamedTuple, Optional, TextIO
+
+import chess
+import chess.engine
+import chess.pgn
+
+from .ai import MATE_SCORE, ChessAI
+from .tournament import EngineConfig
+
+# Centipawns lost by a move, from the mover's point of view, before it is flagged.
+INACCURACY_THRESHOLD = 50
+MISTAKE_THRESHOLD = 100
+BLUNDER_THRESHOLD = 200
+
+# Evaluations are clamped to this when measuring loss, so a missed mate does
+# not dwarf everything else.
+MAX_LOSS_SCORE = 1000
+
+# (threshold, NAG, comment), most severe first.
+JUDGEMENTS = [
+    (BLUNDER_THRESHOLD, chess.pgn.NAG_BLUNDER, "Blunder"),
+    (MISTAKE_THRESHOLD, chess.pgn.NAG_MISTAKE, "Mistake"),
+    (INACCURACY_THRESHOLD, chess.pgn.NAG_DUBIOUS_MOVE, "Inaccuracy"),
+]
+
+# Games in flight per worker: enough to keep the pool busy while results
+# are written out in order.
+PENDING_PER_WORKER = 2
+
+
+class PositionEval(NamedTuple):
+    score: int
+    best_move: Optional[chess.Move]
+    pv: list[chess.Move]
+
+
+def iter_games(stream: TextIO) -> Iterator[chess.pgn.Game]:
+    """Yield the games of a PGN stream one at a time."""
+    while True:
+        game = chess.pgn.read_game(stream)
+        if game is None:
+            return
+        yield game
+
+
+def evaluate_position(ai: ChessAI, board: chess.Board) -> PositionEval:
+    """Search ``board`` and return its White-perspective score, best move and line."""
+    outcome = board.outcome()
+    if outcome is not None:
+        if outcome.winner is None:
+            return PositionEval(0, None, [])
+        return PositionEval(MATE_SCORE if outcome.winner == chess.WHITE else -MATE_SCORE, None, [])
+
+    best: list[tuple[chess.Move, int]] = []
+
+    def on_iteration(depth: int, ranked_moves: list[tuple[chess.Move, int]]) -> None:
+        best[:] = ranked_moves[:1]
+
+    ai.find_best_move(board, on_iteration=on_iteration)
+    if best:
+        move, score = best[0]
+    else:
+        # Tablebase hits return without iterating.
+        move, score = ai.last_best_move, ai.last_evaluation
+    return PositionEval(score, move, ai.principal_variation(board, move))
+
+
+def _pov_score(board: chess.Board, score: int, pv_length: int) -> chess.engine.PovScore:
+    if board.is_checkmate():
+        # The side to move is already mated: mate in 0, not in 1.
+        return chess.engine.PovScore(chess.engine.Mate(0), board.turn)
+    if abs(score) >= MATE_SCORE:
+        # Mate scores carry no distance; the line to it is the best estimate.
+        moves = max(1, (pv_length + 1) // 2)
+        return chess.engine.PovScore(chess.engine.Mate(moves if score > 0 else -moves), chess.WHITE)
+    return chess.engine.PovScore(chess.engine.Cp(score), chess.WHITE)
+
+
+def _set_eval(node: chess.pgn.GameNode, score: chess.engine.PovScore) -> None:
+    if score.white().mate() == 0:
+        # set_eval skips mate 0 (it tests mate() for truth), so write it directly.
+        node.comment = f"{node.comment} [%eval #0]".strip()
+    else:
+        node.set_eval(score)
+
+
+def _clamp(score: int) -> int:
+    return max(-MAX_LOSS_SCORE, min(MAX_LOSS_SCORE, score))
+
+
+def analyse_game(ai: ChessAI, game: chess.pgn.Game) -> chess.pgn.Game:
+    """Annotate the mainline of ``game`` in place and return it."""
+    board = game.board()
+    node: chess.pgn.GameNode = game
+    before = evaluate_position(ai, board)
+
+    while node.variations:
+        child = node.variation(0)
+        mover = board.turn
+        board.push(child.move)
+        after = evaluate_position(ai, board)
+
+        sign = 1 if mover == chess.WHITE else -1
+        loss = sign * (_clamp(before.score) - _clamp(after.score))
+        if before.best_move is not None and child.move != before.best_move:
+            for threshold, nag, label in JUDGEMENTS:
+                if loss >= threshold:
+                    child.nags.add(nag)
+                    best_san = node.board().san(before.best_move)
+                    child.comment = f"{label}. {best_san} was best."
+                    node.add_line(before.pv)
+                    break
+        _set_eval(child, _pov_score(board, after.score, len(after.pv)))
+
+        node = child
+        before = after
+
+    game.headers["Annotator"] = f"ChessAI ({ai.level})"
+    return game
+
+
+# Per-process engine for analysis workers.
+_analysis_ai: Optional[ChessAI] = None
+
+
+def _init_analysis_worker(config: EngineConfig) -> None:
+    global _analysis_ai
+    _analysis_ai = config.create()
+    _analysis_ai.use_book = False
+
+
+def _analyse_pgn_task(pgn: str) -> str:
+    game = chess.pgn.read_game(io.StringIO(pgn))
+    _analysis_ai.transposition_table.clear()
+    return str(analyse_game(_analysis_ai, game))
+
+
+def analyse_pgn(source: TextIO, output: TextIO, config: EngineConfig, workers: int = 1) -> int:
+    """Annotate every game of ``source`` onto ``output`` in order; return the number of games."""
+    count = 0
+
+    def write(pgn: str) -> None:
+        nonlocal count
+        output.write(pgn + "\n\n")
+        output.flush()
+        count += 1
+
+    if workers <= 1:
+        _init_analysis_worker(config)
+        try:
+            for game in iter_games(source):
+                write(_analyse_pgn_task(str(game)))
+        finally:
+            _analysis_ai.close()
+        return count
+
+    context = multiprocessing.get_context("spawn")
+    pending: deque[Future] = deque()
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        mp_context=context,
+        initializer=_init_analysis_worker,
+        initargs=(config,),
+    ) as executor:
+        for game in iter_games(source):
+            if len(pending) >= workers * PENDING_PER_WORKER:
+                write(pending.popleft().result())
+            pending.append(executor.submit(_analyse_pgn_task, str(game)))
+        while pending:
+            write(pending.popleft().result())
+    return count
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Annotate a PGN file with engine evaluations.")
+    parser.add_argument("input", help="PGN file to analyse")
+    parser.add_argument("--output", help="write annotated PGN here instead of stdout")
+    parser.add_argument("--level", default="advanced", choices=sorted(ChessAI.DIFFICULTY_SETTINGS))
+    parser.add_argument("--movetime", type=float, help="seconds per position")
+    parser.add_argument("--nodes", type=int, help="node limit per position")
+    parser.add_argument("--depth", type=int, help="depth limit per position")
+    parser.add_argument("--workers", type=int, default=max(1, (multiprocessing.cpu_count() or 1)))
+    args = parser.parse_args(argv)
+
+    config = EngineConfig("analysis", args.level, args.movetime, args.nodes, args.depth)
+    with open(args.input, encoding="utf-8", errors="replace") as source:
+        if args.output:
+            with open(args.output, "w", encoding="utf-8") as output:
+                count = analyse_pgn(source, output, config, args.workers)
+        else:
+            count = analyse_pgn(source, sys.stdout, config, args.workers)
+
+    print(f"Analysed {count} games.", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,50 @@
+"""Vectorized material + piece-square evaluation for many boards at once.
+
+Intended for offline work (game review, tuning) where positions are scored
+in bulk. Requires NumPy; the interactive game does not import this module.
+"""
+
+from typing import Iterable, Optional
+
+import chess
+import numpy as np
+
+from .ai import ChessAI
+
+
+# Plane order: White P N B R Q K, then Black P N B R Q K.
+PLANE_PIECES = [(color, piece_type) for color in (chess.WHITE, chess.BLACK) for piece_type in chess.PIECE_TYPES]
+
+
+class BatchEvaluator:
+    """Scores boards with the same material + PST terms as ``ChessAI.evaluate_material``."""
+
+    def __init__(self, ai: Optional[ChessAI] = None):
+        ai = ai if ai is not None else ChessAI()
+        values = ai._piece_square_values
+        self.weights = np.array(
+            [values[color][piece_type] for color, piece_type in PLANE_PIECES],
+            dtype=np.int64,
+        )
+
+    @staticmethod
+    def to_planes(boards: Iterable[chess.Board]) -> np.ndarray:
+        """Return an (N, 12, 64) uint8 array of piece occupancy taken from the boards' bitboards."""
+        bitboards = np.array(
+            [
+                (board.pawns, board.knights, board.bishops, board.rooks, board.queens, board.kings,
+                 board.occupied_co[chess.WHITE], board.occupied_co[chess.BLACK])
+                for board in boards
+            ],
+            dtype=np.uint64,
+        ).reshape(-1, 8)
+        # (N, 2, 1) colors & (N, 1, 6) piece types -> (N, 12) in PLANE_PIECES order.
+        masks = (bitboards[:, None, 6:8].transpose(0, 2, 1) & bitboards[:, None, :6]).reshape(-1, len(PLANE_PIECES))
+        # Little-endian bytes + little bit order put square 0 (a1) at index 0.
+        as_bytes = masks.astype("<u8").view(np.uint8).reshape(len(masks), len(PLANE_PIECES), 8)
+        return np.unpackbits(as_bytes, axis=-1, bitorder="little")
+
+    def evaluate_material(self, boards: Iterable[chess.Board]) -> np.ndarray:
+        """Return an int64 array of White-perspective material + PST scores, one per board."""
+        planes = self.to_planes(boards)
+        return np.tensordot(planes.astype(np.int64), self.weights, axes=([1, 2], [0, 1]))
@@ -0,0 +1,232 @@
+"""Engine benchmark: perft, fixed-depth searches, nodes per second and time to depth.
+
+Run from the repository root::
+
+    python -m src.core.benchmark --output bench.json
+    python -m src.core.benchmark --compare bench.json
+
+Results are written as JSON. With ``--compare`` the new run is checked
+against a saved baseline, and the exit status is 1 when anything regressed
+beyond the threshold.
+"""
+
+import argparse
+import json
+import platform
+import sys
+import time
+from typing import Any, Optional
+
+import chess
+
+from .ai import ChessAI
+
+# (name, FEN, depth, expected leaf count)
+PERFT_POSITIONS = [
+    ("start", chess.STARTING_FEN, 3, 8902),
+    ("kiwipete", "r3k2r/p1ppqpb1/bn2pnp1/3PN3/1p2P3/2N2Q1p/PPPBBPPP/R3K2R w KQkq - 0 1", 2, 2039),
+    ("endgame", "8/2p5/3p4/KP5r/1R3p1k/8/4P1P1/8 w - - 0 1", 3, 2812),
+    ("promotions", "r3k2r/Pppp1ppp/1b3nbN/nP6/BBP1P3/q4N2/Pp1P2PP/R2Q1RK1 w kq - 0 1", 2, 264),
+    ("discovered", "rnbq1k1r/pp1Pbppp/2p5/8/2B5/8/PPP1NnPP/RNBQK2R w KQ - 1 8", 2, 1486),
+]
+
+# Out-of-book positions for the fixed-depth searches.
+SEARCH_POSITIONS = [
+    ("italian", "r1bqk2r/pppp1ppp/2n2n2/2b1p3/2B1P3/3P1N2/PPP2PPP/RNBQK2R w KQkq - 1 5"),
+    ("queens_gambit", "rnbqkb1r/pp3ppp/4pn2/2pp4/2PP4/2N1PN2/PP3PPP/R1BQKB1R w KQkq - 0 5"),
+    ("open_middlegame", "r1bq1rk1/ppp2ppp/2np1n2/2b1p3/2B1P3/2NP1N2/PPP2PPP/R1BQ1RK1 w - - 0 7"),
+    ("tactics", "r3k2r/ppp2ppp/2n5/1N1q4/8/8/PPP2PPP/R3K2R w KQkq - 0 1"),
+    ("rook_ending", "2r3k1/5ppp/8/8/8/8/5PPP/3R2K1 w - - 0 1"),
+]
+
+DEFAULT_DEPTH = 3
+DEFAULT_THRESHOLD = 0.10
+
+
+def perft(ai: ChessAI, board: chess.Board, depth: int) -> int:
+    """Count leaf nodes using the search's own make/unmake path."""
+    if depth == 0:
+        return 1
+
+    nodes = 0
+    for move in list(board.legal_moves):
+        ai._make_move(board, move)
+        nodes += perft(ai, board, depth - 1)
+        ai._unmake_move(board)
+    return nodes
+
+
+def _nps(nodes: int, seconds: float) -> float:
+    return round(nodes / seconds, 1) if seconds > 0 else 0.0
+
+
+def run_perft(positions: list[tuple[str, str, int, int]] = PERFT_POSITIONS) -> list[dict[str, Any]]:
+    ai = ChessAI()
+    results = []
+    for name, fen, depth, expected in positions:
+        board = chess.Board(fen)
+        ai._begin_search_state(board)
+        start = time.perf_counter()
+        try:
+            nodes = perft(ai, board, depth)
+        finally:
+            ai._search_state = None
+        seconds = time.perf_counter() - start
+        results.append({
+            "name": name,
+            "fen": fen,
+            "depth": depth,
+            "nodes": nodes,
+            "expected": expected,
+            "ok": nodes == expected,
+            "seconds": round(seconds, 4),
+            "nps": _nps(nodes, seconds),
+        })
+    return results
+
+
+def run_search(
+    positions: list[tuple[str, str]] = SEARCH_POSITIONS,
+    depth: int = DEFAULT_DEPTH,
+    level: str = "advanced",
+) -> list[dict[str, Any]]:
+    """Search every position to a fixed depth with a fresh engine, timing each iteration."""
+    results = []
+    for name, fen in positions:
+        ai = ChessAI(level)
+        board = chess.Board(fen)
+        time_to_depth: dict[str, float] = {}
+        best_move: list[Optional[str]] = [None]
+        start = time.perf_counter()
+
+        def on_iteration(completed_depth: int, ranked_moves: list[tuple[chess.Move, int]]) -> None:
+            time_to_depth[str(completed_depth)] = round(time.perf_counter() - start, 4)
+            best_move[0] = ranked_moves[0][0].uci()
+
+        try:
+            ai.find_best_move(board, on_iteration=on_iteration, infinite=True, max_depth=depth)
+        finally:
+            ai.close()
+        seconds = time.perf_counter() - start
+        nodes = ai.nodes_searched + ai.qnodes_searched
+        results.append({
+            "name": name,
+            "fen": fen,
+            "depth": ai.last_depth,
+            "nodes": ai.nodes_searched,
+            "qnodes": ai.qnodes_searched,
+            "seconds": round(seconds, 4),
+            "nps": _nps(nodes, seconds),
+            "time_to_depth": time_to_depth,
+            "best_move": best_move[0],
+        })
+    return results
+
+
+def run_benchmark(
+    depth: int = DEFAULT_DEPTH,
+    level: str = "advanced",
+    perft_positions: Optional[list[tuple[str, str, int, int]]] = PERFT_POSITIONS,
+    search_positions: Optional[list[tuple[str, str]]] = SEARCH_POSITIONS,
+) -> dict[str, Any]:
+    """Run the selected suites; pass None to skip one."""
+    report: dict[str, Any] = {
+        "python": platform.python_version(),
+        "python_chess": chess.__version__,
+        "depth": depth,
+        "level": level,
+        "perft": run_perft(perft_positions) if perft_positions is not None else [],
+        "search": run_search(search_positions, depth, level) if search_positions is not None else [],
+    }
+
+    totals: dict[str, Any] = {}
+    if report["perft"]:
+        nodes = sum(entry["nodes"] for entry in report["perft"])
+        seconds = sum(entry["seconds"] for entry in report["perft"])
+        totals["perft_nodes"] = nodes
+        totals["perft_nps"] = _nps(nodes, seconds)
+    if report["search"]:
+        nodes = sum(entry["nodes"] + entry["qnodes"] for entry in report["search"])
+        seconds = sum(entry["seconds"] for entry in report["search"])
+        totals["search_nodes"] = nodes
+        totals["search_seconds"] = round(seconds, 4)
+        totals["search_nps"] = _nps(nodes, seconds)
+    report["totals"] = totals
+    return report
+
+
+def compare_reports(baseline: dict[str, Any], current: dict[str, Any], threshold: float = DEFAULT_THRESHOLD) -> list[str]:
+    """
+    Return one message per regression of ``current`` against ``baseline``.
+
+    Perft node counts must match exactly. Per-position search node counts
+    and total nodes per second may not get worse by more than
+    ``threshold``; single-position timings are too noisy to compare.
+    """
+    regressions = []
+
+    for entry in current["perft"]:
+        if not entry["ok"]:
+            regressions.append(f"perft {entry['name']}: {entry['nodes']} nodes, expected {entry['expected']}")
+
+    baseline_search = {entry["name"]: entry for entry in baseline.get("search", [])}
+    for entry in current["search"]:
+        old = baseline_search.get(entry["name"])
+        if old is None or old["depth"] != entry["depth"]:
+            continue
+        name = entry["name"]
+
+        old_nodes = old["nodes"] + old["qnodes"]
+        new_nodes = entry["nodes"] + entry["qnodes"]
+        if new_nodes > old_nodes * (1 + threshold):
+            regressions.append(f"search {name}: {new_nodes} nodes vs {old_nodes} in baseline")
+
+    old_totals = baseline.get("totals", {})
+    new_totals = current.get("totals", {})
+    for key in ("perft_nps", "search_nps"):
+        if key in old_totals and key in new_totals and new_totals[key] < old_totals[key] * (1 - threshold):
+            regressions.append(f"{key}: {new_totals[key]:.0f} vs {old_totals[key]:.0f} in baseline")
+
+    return regressions
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark the chess engine.")
+    parser.add_argument("--depth", type=int, default=DEFAULT_DEPTH, help="fixed search depth")
+    parser.add_argument("--level", default="advanced", choices=sorted(ChessAI.DIFFICULTY_SETTINGS))
+    parser.add_argument("--output", help="write the JSON report here instead of stdout")
+    parser.add_argument("--compare", metavar="BASELINE", help="flag regressions against a saved report")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD, help="allowed relative slowdown")
+    parser.add_argument("--skip-perft", action="store_true")
+    parser.add_argument("--skip-search", action="store_true")
+    args = parser.parse_args(argv)
+
+    report = run_benchmark(
+        depth=args.depth,
+        level=args.level,
+        perft_positions=None if args.skip_perft else PERFT_POSITIONS,
+        search_positions=None if args.skip_search else SEARCH_POSITIONS,
+    )
+
+    text = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as report_file:
+            report_file.write(text + "\n")
+    else:
+        print(text)
+
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as baseline_file:
+            baseline = json.load(baseline_file)
+        regressions = compare_reports(baseline, report, args.threshold)
+        for message in regressions:
+            print(f"REGRESSION {message}", file=sys.stderr)
+        if regressions:
+            return 1
+        print("No regressions against baseline.", file=sys.stderr)
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
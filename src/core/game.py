@@ -1,15 +1,36 @@
 from datetime import date
 import threading
-from typing import Any, Optional
+from typing import Any, Callable, Optional
 
 import chess
 import chess.pgn
 from .ai import ChessAI
 
 
+def build_pgn(board: chess.Board, event: str = "Local Game", result: Optional[str] = None, **headers: str) -> str:
+    """Return the moves played on ``board`` as PGN; extra headers are passed as keywords."""
+    game = chess.pgn.Game()
+    game.headers["Event"] = event
+    game.headers["Date"] = date.today().strftime("%Y.%m.%d")
+    for name, value in headers.items():
+        game.headers[name] = value
+    if result is None:
+        result = board.result() if board.is_game_over() else "*"
+    game.headers["Result"] = result
+
+    node = game
+    for move in board.move_stack:
+        node = node.add_main_variation(move)
+
+    return str(game)
+
+
 class ChessGame:
     _active_instance: Optional["ChessGame"] = None
 
+    # How long cancelling waits for a stopped search thread to unwind.
+    SEARCH_JOIN_TIMEOUT = 2.0
+
     def __init__(self):
         self.board = None
         self.ai = None
@@ -21,13 +42,35 @@ class ChessGame:
         self.pending_ai_move: Optional[chess.Move] = None
         self.pending_move: Optional[chess.Move] = None
         self.ai_thread: Optional[threading.Thread] = None
+        self.ai_stop_event: Optional[threading.Event] = None
+        # Called from the search thread once its move can be applied; lets a UI
+        # sleeping on its event queue wake up instead of polling.
+        self.on_search_finished: Optional[Callable[[], None]] = None
+        self.ponder_enabled = False
+        self.ponder_thread: Optional[threading.Thread] = None
+        self.ponder_stop_event: Optional[threading.Event] = None
+        self.ponder_move: Optional[chess.Move] = None
+        self.ponder_result: Optional[tuple[int, Optional[chess.Move], dict[str, Any]]] = None
+        self.ponder_hits = 0
+        # Statistics shown instead of the engine's live counters, which a ponder
+        # search overwrites with a position that may never be played. None means
+        # read the engine directly.
+        self._shown_statistics: Optional[dict[str, Any]] = None
+        self.instrumentation_enabled = False
         self.move_history: list[str] = []
         self._last_exported_pgn = ""
+        # Legal moves of the current position, from-square -> {to-square -> moves},
+        # built on first use and dropped whenever the position changes.
+        self._move_index: Optional[dict[int, dict[int, list[chess.Move]]]] = None
+        self._move_index_key: Optional[tuple[int, int]] = None
         ChessGame._active_instance = self
 
     def start_new_game(self, level: str):
+        self.cancel_ai_search()
+        if self.ai is not None:
+            self.ai.close()
         self.board = chess.Board()
-        self.ai = ChessAI(level)
+        self.ai = ChessAI(level, instrument=self.instrumentation_enabled)
         self.selected_square = None
         self.valid_moves = []
         self.game_over = False
@@ -36,13 +79,45 @@ class ChessGame:
         self.pending_ai_move = None
         self.pending_move = None
         self.ai_thread = None
+        self.ponder_result = None
+        self.ponder_hits = 0
+        self._shown_statistics = None
         self.move_history = []
         self._last_exported_pgn = ""
+        self._invalidate_move_index()
+
+    def _invalidate_move_index(self) -> None:
+        self._move_index = None
+
+    def legal_move_index(self) -> dict[int, dict[int, list[chess.Move]]]:
+        """Return the legal moves as from-square -> {to-square -> moves}; promotions list every piece."""
+        # Boards assigned or pushed directly are caught by the key check.
+        key = (id(self.board), len(self.board.move_stack)) if self.board is not None else None
+        if self._move_index is None or key != self._move_index_key:
+            index: dict[int, dict[int, list[chess.Move]]] = {}
+            if self.board is not None:
+                for move in self.board.legal_moves:
+                    index.setdefault(move.from_square, {}).setdefault(move.to_square, []).append(move)
+            self._move_index = index
+            self._move_index_key = key
+        return self._move_index
+
+    def moves_from(self, square: Optional[int]) -> dict[int, list[chess.Move]]:
+        """Return to-square -> legal moves for the piece on ``square`` (empty if it has none)."""
+        if square is None:
+            return {}
+        return self.legal_move_index().get(square, {})
+
+    def select_square(self, square: Optional[int]) -> None:
+        """Select ``square`` (None clears the selection) and list its legal moves in ``valid_moves``."""
+        self.selected_square = square
+        self.valid_moves = [move for moves in self.moves_from(square).values() for move in moves]
 
     def make_move(self, move: chess.Move):
         if self.board and move in self.board.legal_moves:
             san_move = self.board.san(move)
             self.board.push(move)
+            self._invalidate_move_index()
             self.move_history.append(san_move)
             self._check_game_state()
             return True
@@ -68,12 +143,15 @@ class ChessGame:
 
         san_move = self.board.san(move)
         self.board.push(move)
+        self._invalidate_move_index()
         self.move_history.append(san_move)
         self._check_game_state()
         return True
 
     def undo_move(self):
+        self.cancel_ai_search()
         if self.board and len(self.board.move_stack) > 0:
+            self._invalidate_move_index()
             self.board.pop()
             if self.move_history:
                 self.move_history.pop()
@@ -84,6 +162,7 @@ class ChessGame:
             self.game_over = False
             self.message = ""
             self.pending_move = None
+            self.select_square(None)
 
     @classmethod
     def get_active_instance(cls) -> Optional["ChessGame"]:
@@ -99,24 +178,132 @@ class ChessGame:
         if not self.ai or not self.board or self.ai_thinking or self.ai_thread is not None:
             return
 
+        if self._take_ponder_hit():
+            return
+
         self.ai_thinking = True
         self.pending_ai_move = None
+        # Until this search finishes the engine may still hold ponder counters.
+        self._shown_statistics = self._ai_statistics(has_data=False)
+
+        # A fresh event per search, so cancelling never affects a later search.
+        stop_event = threading.Event()
+        self.ai_stop_event = stop_event
+        self.ai.stop_event = stop_event
 
         def _worker() -> None:
             try:
                 search_board = self.board.copy(stack=True) if self.board is not None else None
                 move = self.ai.find_best_move(search_board) if search_board is not None else None
-                self.pending_ai_move = move
+                if not stop_event.is_set():
+                    self.pending_ai_move = move
+                    self._shown_statistics = None
             except Exception as exc:
                 print(f"AI search error: {exc}")
                 self.pending_ai_move = None
                 self.ai_thinking = False
             finally:
-                self.ai_thread = None
+                if self.ai_thread is threading.current_thread():
+                    self.ai_thread = None
+                    if not stop_event.is_set() and self.on_search_finished is not None:
+                        self.on_search_finished()
 
         self.ai_thread = threading.Thread(target=_worker, daemon=True)
         self.ai_thread.start()
 
+    def cancel_ai_search(self) -> None:
+        """Stop a running AI search or ponder and discard its result."""
+        self._stop_pondering()
+
+        thread = self.ai_thread
+        if self.ai_stop_event is not None:
+            self.ai_stop_event.set()
+        if thread is not None and thread is not threading.current_thread():
+            thread.join(self.SEARCH_JOIN_TIMEOUT)
+
+        self.ai_thread = None
+        self.ai_stop_event = None
+        self.ai_thinking = False
+        self.pending_ai_move = None
+
+    def start_pondering(self) -> None:
+        """Search the predicted human reply in the background while the human thinks."""
+        if not self.ponder_enabled or not self.ai or not self.board or self.game_over:
+            return
+        if self.ponder_thread is not None or self.ai_thread is not None:
+            return
+
+        # Keep showing the search that produced the move just played; even
+        # predicting the reply probes the transposition table.
+        if self._shown_statistics is None:
+            self._shown_statistics = self._ai_statistics()
+
+        predicted = self.ai.predict_reply(self.board)
+        if predicted is None:
+            return
+
+        ponder_board = self.board.copy(stack=True)
+        ponder_board.push(predicted)
+        if ponder_board.is_game_over():
+            return
+
+        stop_event = threading.Event()
+        self.ponder_stop_event = stop_event
+        self.ai.stop_event = stop_event
+        self.ponder_move = predicted
+        self.ponder_result = None
+
+        def _worker() -> None:
+            try:
+                move = self.ai.ponder(ponder_board)
+                # Stopping on a ponder hit still yields the last completed iteration.
+                if self.ponder_stop_event is stop_event:
+                    self.ponder_result = (self.ai.last_depth, move, self._ai_statistics())
+            except Exception as exc:
+                print(f"AI ponder error: {exc}")
+            finally:
+                if self.ponder_thread is threading.current_thread():
+                    self.ponder_thread = None
+
+        self.ponder_thread = threading.Thread(target=_worker, daemon=True)
+        self.ponder_thread.start()
+
+    def _stop_pondering(self) -> None:
+        thread = self.ponder_thread
+        if self.ponder_stop_event is not None:
+            self.ponder_stop_event.set()
+        if thread is not None and thread is not threading.current_thread():
+            thread.join(self.SEARCH_JOIN_TIMEOUT)
+
+        self.ponder_thread = None
+        self.ponder_stop_event = None
+        self.ponder_move = None
+
+    def _take_ponder_hit(self) -> bool:
+        """Stop pondering; on a ponder hit with a deep enough result, queue it as the AI move."""
+        if self.ponder_move is None:
+            return False
+
+        last_move = self.board.peek() if self.board.move_stack else None
+        hit = last_move == self.ponder_move
+        self._stop_pondering()
+
+        result = self.ponder_result
+        self.ponder_result = None
+        if not hit or result is None:
+            return False
+
+        depth, move, statistics = result
+        if depth < self.ai.depth or move is None or move not in self.board.legal_moves:
+            return False
+
+        # The pondered position is now the real one, so its search is the one to show.
+        self._shown_statistics = statistics
+        self.ponder_hits += 1
+        self.ai_thinking = True
+        self.pending_ai_move = move
+        return True
+
     def apply_pending_ai_move(self) -> bool:
         """Apply the AI move from the worker thread safely on the main thread."""
         if not self.ai_thinking or self.ai_thread is not None:
@@ -131,11 +318,18 @@ class ChessGame:
 
         if self.make_move(move):
             self.ai_thinking = False
+            self.start_pondering()
             return True
 
         self.ai_thinking = False
         return False
 
+    def set_instrumentation(self, enabled: bool) -> None:
+        """Turn per-phase search timing on or off for this and later games."""
+        self.instrumentation_enabled = enabled
+        if self.ai is not None:
+            self.ai.enable_instrumentation(enabled)
+
     def get_ai_statistics(self) -> dict[str, Any]:
         if not self.ai:
             return {
@@ -143,19 +337,45 @@ class ChessGame:
                 "depth": "--",
                 "evaluation": "--",
                 "nodes": "--",
+                "qnodes": "--",
                 "search_time": "--",
                 "best_move": "--",
+                "tt_hit_rate": "--",
+                "eval_cache_hits": "--",
+                "eval_cache_misses": "--",
+                "null_move_cutoffs": "--",
+                "lmr_reductions": "--",
+                "tablebase_hits": "--",
+                "profile": None,
+                "ponder_hits": "--",
                 "has_data": False,
             }
 
+        statistics = self._shown_statistics if self._shown_statistics is not None else self._ai_statistics()
+        return {**statistics, "ponder_hits": self.ponder_hits}
+
+    def _ai_statistics(self, has_data: Optional[bool] = None) -> dict[str, Any]:
+        """Read the engine's statistics for its last search; ``has_data=False`` blanks them."""
+        if has_data is None:
+            has_data = self.ai.has_completed_search
+        # The ponder thread calls this too, while F3 may switch profiling off.
+        profiler = self.ai.profiler if has_data else None
         return {
             "difficulty": self.ai.level.capitalize(),
-            "depth": self.ai.depth,
-            "evaluation": self.ai.last_evaluation if self.ai.has_completed_search else "--",
-            "nodes": self.ai.nodes_searched if self.ai.has_completed_search else "--",
-            "search_time": self.ai.last_search_time if self.ai.has_completed_search else "--",
-            "best_move": self.ai.last_best_move_san or self.ai.last_best_move.uci() if self.ai.has_completed_search and self.ai.last_best_move else "--",
-            "has_data": self.ai.has_completed_search,
+            "depth": self.ai.last_depth if has_data and self.ai.last_depth else self.ai.depth,
+            "evaluation": self.ai.last_evaluation if has_data else "--",
+            "nodes": self.ai.nodes_searched if has_data else "--",
+            "qnodes": self.ai.qnodes_searched if has_data else "--",
+            "search_time": self.ai.last_search_time if has_data else "--",
+            "best_move": self.ai.last_best_move_san or self.ai.last_best_move.uci() if has_data and self.ai.last_best_move else "--",
+            "tt_hit_rate": self.ai.transposition_table.hit_rate if has_data else "--",
+            "eval_cache_hits": self.ai.eval_cache.hits if has_data else "--",
+            "eval_cache_misses": self.ai.eval_cache.misses if has_data else "--",
+            "null_move_cutoffs": self.ai.null_move_cutoffs if has_data else "--",
+            "lmr_reductions": self.ai.lmr_reductions if has_data else "--",
+            "tablebase_hits": self.ai.tablebase_hits if has_data else "--",
+            "profile": profiler.summary() if profiler is not None else None,
+            "has_data": has_data,
         }
 
     def get_move_history_rows(self, max_half_moves: int = 16) -> list[tuple[int, Optional[str], Optional[str]]]:
@@ -178,23 +398,13 @@ class ChessGame:
         if self.board is None:
             return ""
 
-        game = chess.pgn.Game()
-        game.headers["Event"] = "Local Game"
-        game.headers["Date"] = date.today().strftime("%Y.%m.%d")
-        game.headers["White"] = "Player"
-        game.headers["Black"] = "Chess AI"
-        game.headers["Result"] = self.board.result() if self.board.is_game_over() else "*"
-
-        node = game
-        for move in self.board.move_stack:
-            node = node.add_main_variation(move)
-
-        self._last_exported_pgn = str(game)
+        self._last_exported_pgn = build_pgn(self.board, White="Player", Black="Chess AI")
         return self._last_exported_pgn
 
     def _check_game_state(self):
         if self.board.is_game_over():
             self.game_over = True
+            self._stop_pondering()
             if self.board.is_checkmate():
                 winner = "White" if self.board.turn == chess.BLACK else "Black"
                 self.message = f"Checkmate! {winner} wins!"
@@ -0,0 +1,102 @@
+"""Optional per-phase timing of the search.
+
+A ``SearchProfiler`` attached to a ``ChessAI`` wraps the methods behind each
+phase with timed versions on that instance only, so the search pays nothing
+for instrumentation while it is off.
+"""
+
+import time
+from typing import Any, Callable
+
+PHASES = ("eval", "mobility", "center_control", "ordering", "movegen", "terminal", "book")
+
+# ChessAI method -> phase it is charged to. "eval" includes "mobility" and
+# "center_control", which are also reported on their own.
+TIMED_METHODS = {
+    "evaluate_board": "eval",
+    "evaluate_mobility": "mobility",
+    "evaluate_center_control": "center_control",
+    "_order_moves": "ordering",
+    "_generate_moves": "movegen",
+    "_tactical_moves": "movegen",
+    "_is_terminal": "terminal",
+    "_get_book_move": "book",
+}
+
+
+class SearchProfiler:
+    """Call counts and elapsed time per phase, plus branching and cutoff statistics."""
+
+    def __init__(self):
+        # Updated in place: the timed wrappers hold on to these dicts.
+        self.calls = dict.fromkeys(PHASES, 0)
+        self.seconds = dict.fromkeys(PHASES, 0.0)
+        self.reset()
+
+    def reset(self) -> None:
+        for phase in PHASES:
+            self.calls[phase] = 0
+            self.seconds[phase] = 0.0
+        self.expanded_nodes = 0
+        self.moves_searched = 0
+        self.cutoffs = 0
+        self.first_move_cutoffs = 0
+
+    def attach(self, ai: Any) -> None:
+        for name, phase in TIMED_METHODS.items():
+            setattr(ai, name, self._timed(getattr(type(ai), name).__get__(ai), phase))
+
+    @staticmethod
+    def detach(ai: Any) -> None:
+        for name in TIMED_METHODS:
+            ai.__dict__.pop(name, None)
+
+    def _timed(self, method: Callable[..., Any], phase: str) -> Callable[..., Any]:
+        calls = self.calls
+        seconds = self.seconds
+        perf_counter = time.perf_counter
+
+        def timed(*args: Any, **kwargs: Any) -> Any:
+            start = perf_counter()
+            try:
+                return method(*args, **kwargs)
+            finally:
+                seconds[phase] += perf_counter() - start
+                calls[phase] += 1
+
+        return timed
+
+    def record_node(self, moves_searched: int, cutoff: bool) -> None:
+        """Record an expanded node: how many moves it searched and whether it failed high."""
+        self.expanded_nodes += 1
+        self.moves_searched += moves_searched
+        if cutoff:
+            self.cutoffs += 1
+            if moves_searched == 1:
+                self.first_move_cutoffs += 1
+
+    @property
+    def branching_factor(self) -> float:
+        """Average number of moves searched per expanded node."""
+        if self.expanded_nodes == 0:
+            return 0.0
+        return self.moves_searched / self.expanded_nodes
+
+    @property
+    def first_move_cutoff_rate(self) -> float:
+        """Share of beta cutoffs produced by the first move searched."""
+        if self.cutoffs == 0:
+            return 0.0
+        return self.first_move_cutoffs / self.cutoffs
+
+    def summary(self) -> dict[str, Any]:
+        return {
+            "phases": {
+                phase: {"calls": self.calls[phase], "seconds": self.seconds[phase]}
+                for phase in PHASES
+            },
+            "expanded_nodes": self.expanded_nodes,
+            "branching_factor": self.branching_factor,
+            "cutoffs": self.cutoffs,
+            "first_move_cutoff_rate": self.first_move_cutoff_rate,
+        }
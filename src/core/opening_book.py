@@ -1,15 +1,28 @@
-"""Small built-in opening book keyed by FEN strings.
+"""Opening books used as a fast-path before the search.
 
-The book is intentionally compact and easy to extend. It is only used as a
-fast-path before the existing minimax search.
+A Polyglot ``.bin`` book is memory-mapped and searched by Zobrist key, so
+large books cost neither import time nor memory. Positions it does not cover
+fall back to the small built-in book below, which is keyed by FEN strings for
+readability and re-keyed by Zobrist hash on first use.
 """
 
+import os
+import random
+from typing import Optional
+
+import chess
+import chess.polyglot
+
+from .transposition import zobrist_key
+
+# Book picked up automatically when present; without it only the built-in book is used.
+DEFAULT_BOOK_PATH = os.path.join(os.path.dirname(os.path.dirname(__file__)), "assets", "book.bin")
+
 OPENING_BOOK: dict[str, list[str]] = {
     "rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR w KQkq - 0 1": ["e2e4", "d2d4", "c2c4", "g2g3", "f2f4"],
     "rnbqkbnr/pppp1ppp/8/4p3/4P3/8/PPPP1PPP/RNBQKBNR b KQkq - 0 2": ["g8f6", "b8c6", "d7d5"],
     "rnbqkbnr/pppp1ppp/4p3/8/4P3/8/PPPP1PPP/RNBQKBNR b KQkq - 0 2": ["g8f6", "b8c6", "d7d5"],
     "rnbqkbnr/pp1ppppp/8/2p5/4P3/8/PPPP1PPP/RNBQKBNR b KQkq - 0 2": ["d7d5", "g8f6", "b8c6"],
-    "rnbqkbnr/pppp1ppp/4p3/8/4P3/8/PPPP1PPP/RNBQKBNR b KQkq - 0 2": ["g8f6", "b8c6", "d7d5"],
     "rnbqkbnr/ppp1pppp/8/3p4/3P4/8/PPP1PPPP/RNBQKBNR b KQkq - 0 2": ["c7c5", "g8f6", "c7c6"],
     "rnbqkbnr/pp2pppp/2p5/3p4/2PP4/8/PP2PPPP/RNBQKBNR w KQkq - 0 3": ["g2g3", "b1c3", "f1g2"],
     "rnbqkbnr/pppppppp/8/8/2P5/8/PP1PPPPP/RNBQKBNR b KQkq - 0 1": ["e7e5", "d7d5", "g7g6"],
@@ -24,11 +37,70 @@ OPENING_BOOK: dict[str, list[str]] = {
     "rnbqkbnr/pp1ppppp/2p5/8/4P3/8/PPPP1PPP/RNBQKBNR w KQkq - 0 2": ["d2d4", "g1f3", "b1c3"],
     "rnbqkb1r/pppppppp/5n2/8/8/8/PPPPPPPP/RNBQKBNR b KQkq - 0 1": ["e7e5", "d7d5", "c7c5"],
     "rnbqkbnr/ppp1pppp/8/3p4/2PP4/8/PP2PPPP/RNBQKBNR b KQkq - 0 2": ["c7c5", "g8f6", "e7e6"],
-    "rnbqkbnr/ppp1pppp/8/3p4/2PP4/8/PP2PPPP/RNBQKBNR b KQkq - 0 2": ["c7c5", "g8f6", "e7e6"],
-    "rnbqkbnr/ppp1pppp/8/3p4/2PP4/8/PP2PPPP/RNBQKBNR b KQkq - 0 2": ["c7c5", "g8f6", "e7e6"],
-    "rnbqkbnr/pppppppp/8/8/8/8/8/PPPPPPPP/RNBQKBNR w KQkq - 0 1": ["e2e4", "d2d4", "c2c4", "g2g3", "f2f4"],
-    "rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR b KQkq - 0 1": ["e7e5", "d7d5", "g7g6"],
-    "rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR b KQkq - 0 1": ["e7e5", "d7d5", "g7g6"],
-    "rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR b KQkq - 0 1": ["e7e5", "d7d5", "g7g6"],
     "rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR b KQkq - 0 1": ["e7e5", "d7d5", "g7g6"],
 }
+
+_builtin_book_by_key: Optional[dict[int, list[chess.Move]]] = None
+
+
+def builtin_book_by_key() -> dict[int, list[chess.Move]]:
+    """Return the built-in book keyed by Zobrist hash, building it on first use."""
+    global _builtin_book_by_key
+    if _builtin_book_by_key is None:
+        book: dict[int, list[chess.Move]] = {}
+        for fen, moves in OPENING_BOOK.items():
+            try:
+                board = chess.Board(fen)
+            except ValueError:
+                continue
+            entries = book.setdefault(zobrist_key(board), [])
+            for uci in moves:
+                try:
+                    move = chess.Move.from_uci(uci)
+                except ValueError:
+                    continue
+                if move in board.legal_moves and move not in entries:
+                    entries.append(move)
+        _builtin_book_by_key = {key: moves for key, moves in book.items() if moves}
+    return _builtin_book_by_key
+
+
+class OpeningBook:
+    """
+    Polyglot book with the built-in book as fallback.
+
+    The ``.bin`` file is opened lazily on the first lookup. Moves from it are
+    chosen with probability proportional to their weights; built-in moves
+    are chosen uniformly.
+    """
+
+    def __init__(self, path: Optional[str] = None, rng: Optional[random.Random] = None):
+        if path is None and os.path.exists(DEFAULT_BOOK_PATH):
+            path = DEFAULT_BOOK_PATH
+        self.path = path
+        self.random = rng if rng is not None else random.Random()
+        self._reader: Optional[chess.polyglot.MemoryMappedReader] = None
+
+    def _get_reader(self) -> Optional[chess.polyglot.MemoryMappedReader]:
+        if self._reader is None and self.path is not None:
+            self._reader = chess.polyglot.open_reader(self.path)
+        return self._reader
+
+    def choose_move(self, board: chess.Board) -> Optional[chess.Move]:
+        """Return a book move for the position, or None when it is out of book."""
+        reader = self._get_reader()
+        if reader is not None:
+            try:
+                return reader.weighted_choice(board, random=self.random).move
+            except IndexError:
+                pass
+
+        moves = builtin_book_by_key().get(zobrist_key(board))
+        if not moves:
+            return None
+        return self.random.choice(moves)
+
+    def close(self) -> None:
+        if self._reader is not None:
+            self._reader.close()
+            self._reader = None
@@ -0,0 +1,160 @@
+"""Incremental search state kept alongside the board during a search.
+
+Every node needs the position's Zobrist key (for the transposition table and
+evaluation cache) and its material + PST score. Recomputing either from the
+board costs a pass over all pieces; here both are updated from the move being
+played and restored from preallocated stacks on unmake.
+"""
+
+import chess
+import chess.polyglot
+
+_RANDOM = chess.polyglot.POLYGLOT_RANDOM_ARRAY
+
+# Polyglot piece keys indexed [color][piece_type][square].
+PIECE_KEYS: list[list[list[int]]] = [
+    [
+        [0] * 64 if piece_type == 0 else [_RANDOM[64 * ((piece_type - 1) * 2 + color) + square] for square in chess.SQUARES]
+        for piece_type in range(7)
+    ]
+    for color in (chess.BLACK, chess.WHITE)
+]
+
+_CASTLING_KEYS = (
+    (chess.BB_H1, _RANDOM[768]),
+    (chess.BB_A1, _RANDOM[768 + 1]),
+    (chess.BB_H8, _RANDOM[768 + 2]),
+    (chess.BB_A8, _RANDOM[768 + 3]),
+)
+_EP_KEYS = _RANDOM[772:780]
+_TURN_KEY = _RANDOM[780]
+
+# Initial depth of the undo stacks; they grow if a line runs deeper.
+STACK_SIZE = 256
+
+
+def piece_key(board: chess.BaseBoard) -> int:
+    """Return the piece-placement part of the Polyglot key."""
+    key = 0
+    for color in chess.COLORS:
+        keys = PIECE_KEYS[color]
+        for square in chess.scan_reversed(board.occupied_co[color]):
+            key ^= keys[board.piece_type_at(square)][square]
+    return key
+
+
+def state_key(board: chess.Board) -> int:
+    """Return the castling, en passant and turn part of the Polyglot key."""
+    key = _TURN_KEY if board.turn == chess.WHITE else 0
+
+    rights = board.castling_rights
+    if rights:
+        for mask, castling_key in _CASTLING_KEYS:
+            if rights & mask:
+                key ^= castling_key
+
+    ep_square = board.ep_square
+    if ep_square is not None:
+        # Polyglot only hashes the file when a pawn could actually capture.
+        if board.turn == chess.WHITE:
+            ep_mask = chess.shift_down(chess.BB_SQUARES[ep_square])
+        else:
+            ep_mask = chess.shift_up(chess.BB_SQUARES[ep_square])
+        ep_mask = chess.shift_left(ep_mask) | chess.shift_right(ep_mask)
+        if ep_mask & board.pawns & board.occupied_co[board.turn]:
+            key ^= _EP_KEYS[chess.square_file(ep_square)]
+
+    return key
+
+
+class SearchState:
+    """
+    Zobrist key and material + PST score of the board being searched.
+
+    ``push``/``pop`` wrap ``board.push``/``board.pop``; the previous values
+    go into fixed slots indexed by ply rather than freshly appended objects.
+    """
+
+    __slots__ = ("key", "material", "ply", "_piece_key", "_values", "_keys", "_piece_keys", "_materials")
+
+    def __init__(self, board: chess.Board, values: list[list[list[int]]], material: int):
+        self._values = values
+        self._piece_key = piece_key(board)
+        self.key = self._piece_key ^ state_key(board)
+        self.material = material
+        self.ply = 0
+        self._keys = [0] * STACK_SIZE
+        self._piece_keys = [0] * STACK_SIZE
+        self._materials = [0] * STACK_SIZE
+
+    def push(self, board: chess.Board, move: chess.Move) -> None:
+        ply = self.ply
+        if ply == len(self._materials):
+            self._keys.append(0)
+            self._piece_keys.append(0)
+            self._materials.append(0)
+        self._keys[ply] = self.key
+        self._piece_keys[ply] = self._piece_key
+        self._materials[ply] = self.material
+        self.ply = ply + 1
+
+        # A null move only passes the turn.
+        if move:
+            self._apply(board, move)
+        board.push(move)
+        self.key = self._piece_key ^ state_key(board)
+
+    def pop(self, board: chess.Board) -> None:
+        board.pop()
+        ply = self.ply - 1
+        self.ply = ply
+        self.key = self._keys[ply]
+        self._piece_key = self._piece_keys[ply]
+        self.material = self._materials[ply]
+
+    def _apply(self, board: chess.Board, move: chess.Move) -> None:
+        """Update the piece key and material for a legal move that is about to be pushed."""
+        values = self._values
+        us = board.turn
+        them = not us
+        our_keys = PIECE_KEYS[us]
+        from_square = move.from_square
+        to_square = move.to_square
+        piece_type = board.piece_type_at(from_square)
+
+        if board.is_castling(move):
+            rank = chess.square_rank(from_square)
+            if chess.square_file(to_square) > chess.square_file(from_square):
+                king_to, rook_from, rook_to = chess.square(6, rank), chess.square(7, rank), chess.square(5, rank)
+            else:
+                king_to, rook_from, rook_to = chess.square(2, rank), chess.square(0, rank), chess.square(3, rank)
+            king_values = values[us][chess.KING]
+            rook_values = values[us][chess.ROOK]
+            self.material += (
+                king_values[king_to] - king_values[from_square]
+                + rook_values[rook_to] - rook_values[rook_from]
+            )
+            king_keys = our_keys[chess.KING]
+            rook_keys = our_keys[chess.ROOK]
+            self._piece_key ^= (
+                king_keys[from_square] ^ king_keys[king_to]
+                ^ rook_keys[rook_from] ^ rook_keys[rook_to]
+            )
+            return
+
+        moved_to = move.promotion if move.promotion is not None else piece_type
+        material = values[us][moved_to][to_square] - values[us][piece_type][from_square]
+        key = our_keys[piece_type][from_square] ^ our_keys[moved_to][to_square]
+
+        if board.is_en_passant(move):
+            captured_square = to_square - 8 if us == chess.WHITE else to_square + 8
+            material -= values[them][chess.PAWN][captured_square]
+            key ^= PIECE_KEYS[them][chess.PAWN][captured_square]
+        else:
+            captured_type = board.piece_type_at(to_square)
+            if captured_type is not None:
+                material -= values[them][captured_type][to_square]
+                key ^= PIECE_KEYS[them][captured_type][to_square]
+
+        self.material += material
+        self._piece_key ^= key
@@ -0,0 +1,132 @@
+"""Optional Syzygy endgame tablebase probing.
+
+Tables are read from a local directory with ``chess.syzygy``. WDL results are
+kept in an LRU cache keyed by Zobrist hash, since the search reaches the same
+endgame positions through many move orders.
+"""
+
+import os
+from typing import Any, Optional
+
+import chess
+import chess.syzygy
+
+from .transposition import EvaluationCache, zobrist_key
+
+# Directory picked up automatically when present.
+DEFAULT_SYZYGY_PATH = os.path.join(os.path.dirname(os.path.dirname(__file__)), "assets", "syzygy")
+
+# Score for a tablebase win from the winner's point of view. It stays below
+# MATE_SCORE so a proven mate found by the search is still preferred.
+TABLEBASE_WIN_SCORE = 50000
+
+
+class SyzygyTablebase:
+    """
+    WDL/DTZ probing with a probe cache.
+
+    The directory is opened lazily on first use. Positions with castling
+    rights or more pieces than the largest table are never probed.
+    """
+
+    def __init__(self, path: Optional[str] = None, cache_size: int = 100000):
+        if path is None and os.path.isdir(DEFAULT_SYZYGY_PATH):
+            path = DEFAULT_SYZYGY_PATH
+        self.path = path
+        self.cache = EvaluationCache(cache_size)
+        self._tablebase: Any = None
+        self._max_pieces = 0
+
+    @property
+    def available(self) -> bool:
+        return self.path is not None
+
+    def _get_tablebase(self) -> Any:
+        if self._tablebase is None and self.path is not None:
+            self._tablebase = chess.syzygy.open_tablebase(self.path)
+            self._max_pieces = max((len(name) - 1 for name in self._tablebase.wdl), default=0)
+        return self._tablebase
+
+    @property
+    def max_pieces(self) -> int:
+        self._get_tablebase()
+        return self._max_pieces
+
+    def covers(self, board: chess.Board) -> bool:
+        """Return True when the position is small enough to be in the tables."""
+        if self.path is None or board.castling_rights:
+            return False
+        return chess.popcount(board.occupied) <= self.max_pieces
+
+    def probe_wdl(self, board: chess.Board) -> Optional[int]:
+        """
+        Return the WDL value for the side to move (2 win, 1 cursed win,
+        0 draw, -1 blessed loss, -2 loss), or None when no table covers it.
+        """
+        if not self.covers(board):
+            return None
+
+        key = zobrist_key(board)
+        wdl = self.cache.get(key)
+        if wdl is not None:
+            return wdl
+
+        wdl = self._get_tablebase().get_wdl(board)
+        if wdl is not None:
+            self.cache.put(key, wdl)
+        return wdl
+
+    def score(self, board: chess.Board) -> Optional[int]:
+        """Return a search score for the side to move, or None when not covered."""
+        wdl = self.probe_wdl(board)
+        if wdl is None:
+            return None
+        # Cursed wins and blessed losses are draws under the fifty-move rule.
+        if wdl == 2:
+            return TABLEBASE_WIN_SCORE
+        if wdl == -2:
+            return -TABLEBASE_WIN_SCORE
+        return 0
+
+    def best_move(self, board: chess.Board) -> Optional[tuple[chess.Move, int]]:
+        """
+        Pick a root move from the tables and return it with its WDL value.
+
+        Moves are ranked by the opponent's WDL after the move, then by DTZ:
+        the shortest way to convert a win and the longest way to lose.
+        Returns None when any move leads out of the tables.
+        """
+        if not self.covers(board):
+            return None
+
+        tablebase = self._get_tablebase()
+        best: Optional[tuple[tuple[int, int], chess.Move, int]] = None
+        for move in board.legal_moves:
+            board.push(move)
+            try:
+                if board.is_checkmate():
+                    return move, 2
+                wdl = self.probe_wdl(board)
+                dtz = tablebase.get_dtz(board) if wdl is not None else None
+            finally:
+                board.pop()
+
+            if wdl is None or dtz is None:
+                return None
+
+            # The opponent's loss is our win; a smaller |dtz| is a faster conversion.
+            rank = (-wdl, -abs(dtz) if wdl < 0 else abs(dtz))
+            if best is None or rank > best[0]:
+                best = (rank, move, -wdl)
+
+        if best is None:
+            return None
+        return best[1], best[2]
+
+    def new_search(self) -> None:
+        self.cache.new_search()
+
+    def close(self) -> None:
+        if self._tablebase is not None:
+            self._tablebase.close()
+            self._tablebase = None
@@ -0,0 +1,237 @@
+"""Headless self-play matches between two engine configurations.
+
+Run from the repository root::
+
+    python -m src.core.tournament --first advanced --second intermediate \\
+        --games 100 --movetime 0.2 --workers 4 --pgn match.pgn
+
+Games are played in pairs from the same book opening with colours swapped,
+spread over a process pool. The summary reports win/draw/loss for the first
+engine, an Elo difference with a 95% confidence interval and nodes per second.
+"""
+
+import argparse
+import json
+import math
+import multiprocessing
+import random
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, NamedTuple, Optional
+
+import chess
+
+from .ai import ChessAI
+from .game import build_pgn
+from .opening_book import OpeningBook
+
+# Games still running after this many plies are adjudicated as draws.
+DEFAULT_MAX_PLIES = 300
+
+# Random book plies played before the engines take over.
+DEFAULT_OPENING_PLIES = 4
+
+
+class EngineConfig(NamedTuple):
+    name: str
+    level: str = "advanced"
+    time_limit: Optional[float] = None
+    node_limit: Optional[int] = None
+    max_depth: Optional[int] = None
+
+    def create(self) -> ChessAI:
+        ai = ChessAI(self.level, time_limit=self.time_limit, node_limit=self.node_limit, max_depth=self.max_depth)
+        if self.max_depth is not None and not ai.iterative_deepening:
+            # Without a time or node budget the depth limit is the fixed search depth.
+            ai.depth = self.max_depth
+        return ai
+
+
+def random_opening(book: OpeningBook, plies: int) -> list[str]:
+    """Play up to ``plies`` random book moves from the start position."""
+    board = chess.Board()
+    moves = []
+    for _ in range(plies):
+        move = book.choose_move(board)
+        if move is None or move not in board.legal_moves:
+            break
+        board.push(move)
+        moves.append(move.uci())
+    return moves
+
+
+def play_game(
+    white: EngineConfig,
+    black: EngineConfig,
+    opening: list[str],
+    max_plies: int = DEFAULT_MAX_PLIES,
+    round_number: int = 1,
+) -> dict[str, Any]:
+    """Play one game and return its PGN, result and per-engine search totals."""
+    engines = {chess.WHITE: white.create(), chess.BLACK: black.create()}
+    nodes = {chess.WHITE: 0, chess.BLACK: 0}
+    seconds = {chess.WHITE: 0.0, chess.BLACK: 0.0}
+
+    board = chess.Board()
+    for uci in opening:
+        board.push_uci(uci)
+
+    try:
+        while not board.is_game_over(claim_draw=True) and len(board.move_stack) < max_plies:
+            ai = engines[board.turn]
+            start = time.perf_counter()
+            move = ai.find_best_move(board)
+            seconds[board.turn] += time.perf_counter() - start
+            nodes[board.turn] += ai.nodes_searched + ai.qnodes_searched
+            if move is None:
+                break
+            board.push(move)
+    finally:
+        for ai in engines.values():
+            ai.close()
+
+    result = board.result(claim_draw=True) if board.is_game_over(claim_draw=True) else "1/2-1/2"
+    pgn = build_pgn(
+        board,
+        event="Self-play Match",
+        result=result,
+        White=white.name,
+        Black=black.name,
+        Round=str(round_number),
+    )
+    return {
+        "white": white.name,
+        "black": black.name,
+        "result": result,
+        "plies": len(board.move_stack),
+        "pgn": pgn,
+        "nodes": {white.name: nodes[chess.WHITE], black.name: nodes[chess.BLACK]},
+        "seconds": {white.name: seconds[chess.WHITE], black.name: seconds[chess.BLACK]},
+    }
+
+
+def _play_game_task(args: tuple[EngineConfig, EngineConfig, list[str], int, int]) -> dict[str, Any]:
+    return play_game(*args)
+
+
+def elo_difference(score: float) -> float:
+    """Elo difference implied by an expected score in (0, 1)."""
+    score = min(max(score, 1e-6), 1 - 1e-6)
+    return 400 * math.log10(score / (1 - score))
+
+
+def summarize(games: list[dict[str, Any]], first: str, second: str) -> dict[str, Any]:
+    """Win/draw/loss and Elo for ``first`` against ``second``, with a 95% interval."""
+    points = []
+    for game in games:
+        if game["result"] == "1/2-1/2":
+            points.append(0.5)
+        elif (game["result"] == "1-0") == (game["white"] == first):
+            points.append(1.0)
+        else:
+            points.append(0.0)
+
+    count = len(points)
+    wins = points.count(1.0)
+    draws = points.count(0.5)
+    losses = points.count(0.0)
+    score = sum(points) / count if count else 0.5
+
+    # Normal approximation of the per-game score distribution.
+    variance = sum((point - score) ** 2 for point in points) / count if count else 0.0
+    margin = 1.96 * math.sqrt(variance / count) if count else 0.0
+
+    nps = {}
+    for name in (first, second):
+        nodes = sum(game["nodes"].get(name, 0) for game in games)
+        seconds = sum(game["seconds"].get(name, 0.0) for game in games)
+        nps[name] = round(nodes / seconds, 1) if seconds > 0 else 0.0
+
+    return {
+        "first": first,
+        "second": second,
+        "games": count,
+        "wins": wins,
+        "draws": draws,
+        "losses": losses,
+        "score": score,
+        "elo": elo_difference(score),
+        "elo_low": elo_difference(score - margin),
+        "elo_high": elo_difference(score + margin),
+        "nps": nps,
+    }
+
+
+def run_match(
+    first: EngineConfig,
+    second: EngineConfig,
+    games: int = 2,
+    workers: int = 1,
+    opening_plies: int = DEFAULT_OPENING_PLIES,
+    max_plies: int = DEFAULT_MAX_PLIES,
+    seed: Optional[int] = None,
+) -> tuple[list[dict[str, Any]], dict[str, Any]]:
+    """Play ``games`` games in colour-swapped pairs; return the games in order and the summary."""
+    book = OpeningBook(rng=random.Random(seed))
+    tasks = []
+    for index in range(games):
+        if index % 2 == 0:
+            opening = random_opening(book, opening_plies)
+            white, black = first, second
+        else:
+            white, black = second, first
+        tasks.append((white, black, opening, max_plies, index + 1))
+
+    if workers > 1:
+        context = multiprocessing.get_context("spawn")
+        with ProcessPoolExecutor(max_workers=workers, mp_context=context) as executor:
+            results = list(executor.map(_play_game_task, tasks))
+    else:
+        results = [_play_game_task(task) for task in tasks]
+
+    return results, summarize(results, first.name, second.name)
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Play a headless match between two engine levels.")
+    levels = sorted(ChessAI.DIFFICULTY_SETTINGS)
+    parser.add_argument("--first", default="advanced", choices=levels)
+    parser.add_argument("--second", default="intermediate", choices=levels)
+    parser.add_argument("--games", type=int, default=20)
+    parser.add_argument("--workers", type=int, default=max(1, (multiprocessing.cpu_count() or 1)))
+    parser.add_argument("--movetime", type=float, help="seconds per move")
+    parser.add_argument("--nodes", type=int, help="node limit per move")
+    parser.add_argument("--depth", type=int, help="depth limit per move")
+    parser.add_argument("--opening-plies", type=int, default=DEFAULT_OPENING_PLIES)
+    parser.add_argument("--max-plies", type=int, default=DEFAULT_MAX_PLIES)
+    parser.add_argument("--seed", type=int)
+    parser.add_argument("--pgn", help="write all games to this PGN file")
+    args = parser.parse_args(argv)
+
+    names = (args.first, args.second) if args.first != args.second else (f"{args.first}-1", f"{args.second}-2")
+    first, second = (
+        EngineConfig(name, level, args.movetime, args.nodes, args.depth)
+        for name, level in zip(names, (args.first, args.second))
+    )
+
+    games, summary = run_match(
+        first,
+        second,
+        games=args.games,
+        workers=args.workers,
+        opening_plies=args.opening_plies,
+        max_plies=args.max_plies,
+        seed=args.seed,
+    )
+
+    if args.pgn:
+        with open(args.pgn, "w", encoding="utf-8") as pgn_file:
+            pgn_file.write("\n\n".join(game["pgn"] for game in games) + "\n")
+
+    print(json.dumps(summary, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
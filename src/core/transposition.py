@@ -0,0 +1,143 @@
+"""Zobrist-keyed caches for the search: transposition table and evaluation cache.
+
+Positions reached through different move orders share a single entry, so the
+search can reuse scores and best moves instead of re-searching the subtree.
+"""
+
+from collections import OrderedDict
+from typing import NamedTuple, Optional
+
+import chess
+import chess.polyglot
+
+
+EXACT = 0
+LOWER_BOUND = 1
+UPPER_BOUND = 2
+
+
+def zobrist_key(board: chess.Board) -> int:
+    """Return the 64-bit Polyglot Zobrist hash for the position."""
+    return chess.polyglot.zobrist_hash(board)
+
+
+class TTEntry(NamedTuple):
+    key: int
+    depth: int
+    score: int
+    flag: int
+    best_move: Optional[chess.Move]
+    generation: int
+
+
+class TranspositionTable:
+    """
+    Fixed number of slots indexed by ``key % size``.
+
+    Replacement is depth-preferred with aging: an entry is overwritten
+    by a shallower result only if it belongs to an older search.
+    """
+
+    # Approximate CPython footprint of one slot (list pointer + entry tuple).
+    ENTRY_SIZE_BYTES = 128
+
+    def __init__(self, size_mb: float = 16):
+        self.size_mb = size_mb
+        self.size = max(1, int(size_mb * 1024 * 1024) // self.ENTRY_SIZE_BYTES)
+        self.entries: list[Optional[TTEntry]] = [None] * self.size
+        self.generation = 0
+        self.probes = 0
+        self.hits = 0
+        self.stores = 0
+
+    def new_search(self) -> None:
+        """Age existing entries and reset the per-search counters."""
+        self.generation = (self.generation + 1) & 0xFF
+        self.probes = 0
+        self.hits = 0
+        self.stores = 0
+
+    def clear(self) -> None:
+        self.entries = [None] * self.size
+        self.generation = 0
+        self.probes = 0
+        self.hits = 0
+        self.stores = 0
+
+    def probe(self, key: int) -> Optional[TTEntry]:
+        self.probes += 1
+        entry = self.entries[key % self.size]
+        if entry is not None and entry.key == key:
+            self.hits += 1
+            return entry
+        return None
+
+    def store(self, key: int, depth: int, score: int, flag: int, best_move: Optional[chess.Move]) -> None:
+        index = key % self.size
+        existing = self.entries[index]
+
+        if (
+            existing is None
+            or existing.key == key
+            or existing.generation != self.generation
+            or depth >= existing.depth
+        ):
+            # Keep the previous best move when a bound-only result has none.
+            if best_move is None and existing is not None and existing.key == key:
+                best_move = existing.best_move
+            self.entries[index] = TTEntry(key, depth, score, flag, best_move, self.generation)
+            self.stores += 1
+
+    @property
+    def hit_rate(self) -> float:
+        if self.probes == 0:
+            return 0.0
+        return self.hits / self.probes
+
+
+class EvaluationCache:
+    """
+    Bounded map from Zobrist key to static evaluation with LRU eviction.
+
+    Entries persist across searches; only the hit/miss counters are reset.
+    """
+
+    def __init__(self, max_entries: int = 200000):
+        self.max_entries = max(1, max_entries)
+        self.entries: OrderedDict[int, int] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def new_search(self) -> None:
+        self.hits = 0
+        self.misses = 0
+
+    def clear(self) -> None:
+        self.entries.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: int) -> Optional[int]:
+        score = self.entries.get(key)
+        if score is None:
+            self.misses += 1
+            return None
+        self.entries.move_to_end(key)
+        self.hits += 1
+        return score
+
+    def put(self, key: int, score: int) -> None:
+        self.entries[key] = score
+        self.entries.move_to_end(key)
+        if len(self.entries) > self.max_entries:
+            self.entries.popitem(last=False)
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        if lookups == 0:
+            return 0.0
+        return self.hits / lookups
@@ -0,0 +1,253 @@
+"""UCI front-end for ``ChessAI``.
+
+Reads commands from stdin and answers on stdout, so the engine can be loaded
+into any UCI GUI (``chess-uci`` once installed, or ``python -m src.core.uci``).
+Searches run on a separate thread: the stdin loop stays responsive and
+``stop`` takes effect at the next node.
+"""
+
+import sys
+import threading
+import time
+from typing import Optional, TextIO
+
+import chess
+
+from .ai import MATE_SCORE, MAX_SEARCH_DEPTH, ChessAI
+
+ENGINE_NAME = "Chess Game AI"
+ENGINE_AUTHOR = "chess-game contributors"
+
+# Share of the remaining clock spent on one move when no movetime is given.
+DEFAULT_MOVES_TO_GO = 30
+
+
+def format_score(score: int, pv_length: int) -> str:
+    """Return the UCI ``score`` field for a side-to-move ``score`` reached along a ``pv_length`` line."""
+    if abs(score) >= MATE_SCORE:
+        # Mate scores carry no distance; the principal variation ends in the mate.
+        moves = max(1, (pv_length + 1) // 2)
+        return f"mate {moves if score > 0 else -moves}"
+    return f"cp {score}"
+
+
+class UCIEngine:
+    """Maps UCI commands onto a ``ChessAI``; output goes to ``output``."""
+
+    def __init__(self, output: TextIO = sys.stdout):
+        self.output = output
+        self.output_lock = threading.Lock()
+        self.options = {
+            "Level": "advanced",
+            "UCI_LimitStrength": False,
+            "Hash": 16,
+            "Threads": 1,
+            "SyzygyPath": "",
+        }
+        self.ai: Optional[ChessAI] = None
+        self.board = chess.Board()
+        self.search_thread: Optional[threading.Thread] = None
+        self.stop_event: Optional[threading.Event] = None
+
+    def send(self, line: str) -> None:
+        with self.output_lock:
+            self.output.write(line + "\n")
+            self.output.flush()
+
+    def _get_ai(self) -> ChessAI:
+        if self.ai is None:
+            self.ai = ChessAI(
+                self.options["Level"],
+                tt_size_mb=self.options["Hash"],
+                workers=self.options["Threads"],
+                syzygy_path=self.options["SyzygyPath"] or None,
+            )
+        return self.ai
+
+    def _reset_ai(self) -> None:
+        self.stop_search()
+        if self.ai is not None:
+            self.ai.close()
+            self.ai = None
+
+    # -----------------------------
+    # Commands
+    # -----------------------------
+
+    def handle(self, line: str) -> bool:
+        """Handle one command line; return False once the engine should exit."""
+        tokens = line.split()
+        if not tokens:
+            return True
+
+        command, args = tokens[0], tokens[1:]
+        if command == "uci":
+            self.send(f"id name {ENGINE_NAME}")
+            self.send(f"id author {ENGINE_AUTHOR}")
+            levels = " ".join(f"var {level}" for level in ChessAI.DIFFICULTY_SETTINGS)
+            self.send(f"option name Level type combo default advanced {levels}")
+            self.send("option name UCI_LimitStrength type check default false")
+            self.send("option name Hash type spin default 16 min 1 max 1024")
+            self.send("option name Threads type spin default 1 min 1 max 64")
+            self.send("option name SyzygyPath type string default <empty>")
+            self.send("uciok")
+        elif command == "isready":
+            self.send("readyok")
+        elif command == "setoption":
+            self._set_option(args)
+        elif command == "ucinewgame":
+            self._reset_ai()
+            self.board = chess.Board()
+        elif command == "position":
+            self.stop_search()
+            self._set_position(args)
+        elif command == "go":
+            self.stop_search()
+            self._go(args)
+        elif command == "stop":
+            self.stop_search()
+        elif command == "quit":
+            self._reset_ai()
+            return False
+        return True
+
+    def _set_option(self, args: list[str]) -> None:
+        # setoption name <id> [value <x>]; both may contain spaces.
+        if "name" not in args:
+            return
+        name_start = args.index("name") + 1
+        value_start = args.index("value") if "value" in args else len(args)
+        name = " ".join(args[name_start:value_start])
+        value = " ".join(args[value_start + 1:])
+
+        if name == "Level" and value.lower() in ChessAI.DIFFICULTY_SETTINGS:
+            self.options["Level"] = value.lower()
+        elif name == "UCI_LimitStrength" and value.lower() in ("true", "false"):
+            # Only changes how the move is picked, so the engine is kept.
+            self.options[name] = value.lower() == "true"
+            return
+        elif name in ("Hash", "Threads") and value.isdigit():
+            self.options[name] = max(1, int(value))
+        elif name == "SyzygyPath":
+            self.options[name] = "" if value == "<empty>" else value
+        else:
+            return
+        self._reset_ai()
+
+    def _set_position(self, args: list[str]) -> None:
+        moves_index = args.index("moves") if "moves" in args else len(args)
+        # A bad FEN or move leaves the previous position in place; the GUI is told why.
+        try:
+            if args and args[0] == "fen":
+                board = chess.Board(" ".join(args[1:moves_index]))
+            else:
+                board = chess.Board()
+
+            for uci in args[moves_index + 1:]:
+                board.push_uci(uci)
+        except ValueError as exc:
+            self.send(f"info string error: {exc}")
+            return
+        self.board = board
+
+    def _go(self, args: list[str]) -> None:
+        params: dict[str, int] = {}
+        infinite = False
+        index = 0
+        while index < len(args):
+            token = args[index]
+            if token == "infinite":
+                infinite = True
+                index += 1
+            elif index + 1 < len(args) and args[index + 1].lstrip("-").isdigit():
+                params[token] = int(args[index + 1])
+                index += 2
+            else:
+                index += 1
+
+        ai = self._get_ai()
+        ai.time_limit = None
+        ai.node_limit = params.get("nodes")
+        ai.max_depth = params.get("depth")
+
+        if "movetime" in params:
+            ai.time_limit = params["movetime"] / 1000
+        else:
+            clock = params.get("wtime" if self.board.turn == chess.WHITE else "btime")
+            if clock is not None:
+                increment = params.get("winc" if self.board.turn == chess.WHITE else "binc", 0)
+                moves_to_go = params.get("movestogo", DEFAULT_MOVES_TO_GO)
+                budget = clock / max(1, moves_to_go) + increment * 0.8
+                ai.time_limit = max(0.01, min(budget, clock * 0.5) / 1000)
+
+        # A bare depth limit searches exactly that deep; no limit at all is "infinite".
+        unbounded = ai.time_limit is None and ai.node_limit is None
+        max_depth = ai.max_depth if ai.max_depth is not None else (MAX_SEARCH_DEPTH if unbounded else None)
+
+        self.stop_event = threading.Event()
+        ai.stop_event = self.stop_event
+        self.search_thread = threading.Thread(
+            target=self._search,
+            args=(ai, self.board.copy(), unbounded, max_depth, infinite, self.stop_event),
+            daemon=True,
+        )
+        self.search_thread.start()
+
+    def _search(
+        self,
+        ai: ChessAI,
+        board: chess.Board,
+        unbounded: bool,
+        max_depth: Optional[int],
+        infinite: bool,
+        stop_event: threading.Event,
+    ) -> None:
+        start = time.perf_counter()
+        best: list[chess.Move] = []
+
+        def on_iteration(depth: int, ranked_moves: list[tuple[chess.Move, int]]) -> None:
+            best_move, white_score = ranked_moves[0]
+            best[:] = [best_move]
+            score = white_score if board.turn == chess.WHITE else -white_score
+            nodes = ai.nodes_searched + ai.qnodes_searched
+            elapsed = time.perf_counter() - start
+            pv = ai.principal_variation(board, best_move, depth)
+            self.send(
+                f"info depth {depth} score {format_score(score, len(pv))} nodes {nodes} "
+                f"nps {int(nodes / elapsed) if elapsed > 0 else 0} time {int(elapsed * 1000)} "
+                f"pv {' '.join(move.uci() for move in pv)}"
+            )
+
+        move = ai.find_best_move(board, on_iteration=on_iteration, infinite=unbounded, max_depth=max_depth)
+        # find_best_move may pick a weaker move to play the level's strength;
+        # unless UCI_LimitStrength asks for that, play the search's best move.
+        if best and not self.options["UCI_LimitStrength"]:
+            move = best[0]
+
+        # In infinite mode the GUI expects bestmove only after it sends stop.
+        if infinite:
+            stop_event.wait()
+        self.send(f"bestmove {move.uci() if move is not None else '0000'}")
+
+    def stop_search(self) -> None:
+        """Stop a running search and wait for its bestmove to be sent."""
+        if self.search_thread is None:
+            return
+        if self.stop_event is not None:
+            self.stop_event.set()
+        self.search_thread.join()
+        self.search_thread = None
+
+    def run(self, stream: TextIO = sys.stdin) -> None:
+        for line in stream:
+            if not self.handle(line):
+                break
+        self._reset_ai()
+
+
+def main() -> None:
+    UCIEngine().run()
+
+
+if __name__ == "__main__":
+    main()
@@ -1,65 +1,127 @@
 import pygame
 import chess
 from ..utils.constants import *
+from .sprites import PieceAtlas
 
 
 class BoardRenderer:
-    def __init__(self, screen):
+    def __init__(self, screen, atlas=None):
         self.screen = screen
-        self.piece_images = self._load_piece_images()
+        self.atlas = atlas if atlas is not None else PieceAtlas(SQUARE_SIZE)
+        self.piece_images = self.atlas.images
 
-    def _load_piece_images(self):
-        images = {}
-        for piece, filename in PIECE_IMAGES.items():
-            images[piece] = pygame.image.load(get_image_path(filename)).convert_alpha()
-            images[piece] = pygame.transform.scale(images[piece], (SQUARE_SIZE, SQUARE_SIZE))
-        return images
+        # Static layers, built once and blitted as needed.
+        self.board_surface = self._render_board_surface()
+        self.selected_highlight = self._highlight_surface(HIGHLIGHT_COLOR)
+        self.check_highlight = self._highlight_surface(CHECK_HIGHLIGHT)
 
-    def draw(self, board, selected_square=None, valid_moves=None, animated_piece=None, skip_square=None):
-        valid_moves = valid_moves or []
-        
+        # What each square showed when last drawn; None forces a redraw.
+        self._drawn_squares = [None] * 64
+        self._animated_rect = None
+
+    @staticmethod
+    def _render_board_surface():
+        surface = pygame.Surface((BOARD_SIZE, BOARD_SIZE))
         for row in range(8):
             for col in range(8):
                 color = LIGHT_SQUARE if (row + col) % 2 == 0 else DARK_SQUARE
-                pygame.draw.rect(self.screen, color, 
-                               (col * SQUARE_SIZE, row * SQUARE_SIZE, SQUARE_SIZE, SQUARE_SIZE))
-                
-                square = chess.square(col, 7-row)
-                
-                # Highlight selected square
-                if selected_square == square:
-                    highlight = pygame.Surface((SQUARE_SIZE, SQUARE_SIZE), pygame.SRCALPHA)
-                    highlight.fill(HIGHLIGHT_COLOR)
-                    self.screen.blit(highlight, (col * SQUARE_SIZE, row * SQUARE_SIZE))
-                
-                # Show dots for valid moves
-                for move in valid_moves:
-                    if move.from_square == selected_square and move.to_square == square:
-                        center_x = col * SQUARE_SIZE + SQUARE_SIZE // 2
-                        center_y = row * SQUARE_SIZE + SQUARE_SIZE // 2
-                        pygame.draw.circle(self.screen, (0, 150, 0), (center_x, center_y), 12)
-                
-                # Highlight king in check
-                if board.is_check():
-                    king_square = board.king(board.turn)
-                    if square == king_square:
-                        highlight = pygame.Surface((SQUARE_SIZE, SQUARE_SIZE), pygame.SRCALPHA)
-                        highlight.fill(CHECK_HIGHLIGHT)
-                        self.screen.blit(highlight, (col * SQUARE_SIZE, row * SQUARE_SIZE))
-                
-                # Draw pieces
-                piece = board.piece_at(square)
-                if piece and square != skip_square:
-                    self.screen.blit(self.piece_images[piece.symbol()], 
-                                   (col * SQUARE_SIZE, row * SQUARE_SIZE))
+                pygame.draw.rect(surface, color, (col * SQUARE_SIZE, row * SQUARE_SIZE, SQUARE_SIZE, SQUARE_SIZE))
+        return surface
+
+    @staticmethod
+    def _highlight_surface(color):
+        surface = pygame.Surface((SQUARE_SIZE, SQUARE_SIZE), pygame.SRCALPHA)
+        surface.fill(color)
+        return surface
+
+    @staticmethod
+    def square_rect(square):
+        return pygame.Rect(
+            chess.square_file(square) * SQUARE_SIZE,
+            (7 - chess.square_rank(square)) * SQUARE_SIZE,
+            SQUARE_SIZE,
+            SQUARE_SIZE,
+        )
+
+    @staticmethod
+    def _squares_under(rect):
+        rect = rect.clip(pygame.Rect(0, 0, BOARD_SIZE, BOARD_SIZE))
+        if rect.width == 0 or rect.height == 0:
+            return []
+        cols = range(rect.left // SQUARE_SIZE, (rect.right - 1) // SQUARE_SIZE + 1)
+        rows = range(rect.top // SQUARE_SIZE, (rect.bottom - 1) // SQUARE_SIZE + 1)
+        return [chess.square(col, 7 - row) for row in rows for col in cols]
+
+    def invalidate(self, rect=None):
+        """Redraw the squares under ``rect`` (the whole board by default) on the next draw."""
+        if rect is None:
+            self._drawn_squares = [None] * 64
+            return
+        for square in self._squares_under(pygame.Rect(rect)):
+            self._drawn_squares[square] = None
+
+    def draw(self, board, selected_square=None, valid_moves=None, animated_piece=None, skip_square=None):
+        """
+        Redraw the squares that changed since the last call and return their rects.
+
+        ``valid_moves`` is either a list of moves or the selected piece's
+        to-square -> moves mapping from ``ChessGame.moves_from``.
+        """
+        valid_moves = valid_moves or []
+
+        check_square = board.king(board.turn) if board.is_check() else None
+        if isinstance(valid_moves, dict):
+            targets = valid_moves.keys()
+        else:
+            targets = {move.to_square for move in valid_moves if move.from_square == selected_square}
+        pieces = board.piece_map()
 
+        # The animated piece leaves a trail: repaint whatever it covered last frame.
+        animated_rect = None
         if animated_piece:
-            piece, (x, y) = animated_piece
-            self.screen.blit(self.piece_images[piece.symbol()], (x, y))
+            animated, (x, y) = animated_piece
+            animated_rect = pygame.Rect(int(x), int(y), SQUARE_SIZE, SQUARE_SIZE)
+        for rect in (self._animated_rect, animated_rect):
+            if rect is not None:
+                self.invalidate(rect)
+
+        dirty = []
+        for square in chess.SQUARES:
+            piece = pieces.get(square) if square != skip_square else None
+            state = (
+                piece.symbol() if piece else None,
+                square == selected_square,
+                square in targets,
+                square == check_square,
+            )
+            if state == self._drawn_squares[square]:
+                continue
+            self._drawn_squares[square] = state
+
+            rect = self.square_rect(square)
+            self.screen.blit(self.board_surface, rect, rect)
+            if state[1]:
+                self.screen.blit(self.selected_highlight, rect)
+            if state[2]:
+                pygame.draw.circle(self.screen, (0, 150, 0), rect.center, 12)
+            if state[3]:
+                self.screen.blit(self.check_highlight, rect)
+            if state[0]:
+                self.atlas.blit(self.screen, state[0], rect)
+            dirty.append(rect)
+
+        if animated_rect is not None:
+            self.atlas.blit(self.screen, animated.symbol(), animated_rect)
+            dirty.append(animated_rect)
+        if self._animated_rect is not None:
+            dirty.append(self._animated_rect)
+        self._animated_rect = animated_rect
+
+        return dirty
 
     def coords_to_square(self, x, y):
         if 0 <= x < BOARD_SIZE and 0 <= y < BOARD_SIZE:
             file = x // SQUARE_SIZE
             rank = 7 - (y // SQUARE_SIZE)
             return chess.square(file, rank)
-        return None
\ No newline at end of file
+        return None
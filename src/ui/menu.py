@@ -1,5 +1,6 @@
 import pygame
 from ..utils.constants import *
+from .text_cache import text_cache
 
 
 class MenuRenderer:
@@ -7,6 +8,7 @@ class MenuRenderer:
         self.screen = screen
         self.font = pygame.font.SysFont('Arial', 24)
         self.title_font = pygame.font.SysFont('Arial', 32, bold=True)
+        self.text_cache = text_cache
         
         self.buttons = {
             'beginner': pygame.Rect(BOARD_SIZE // 2 - 100, 200, 200, 50),
@@ -18,14 +20,14 @@ class MenuRenderer:
         self.screen.fill(WHITE)
         
         # Draw title
-        title = self.title_font.render("Chess Game", True, BLACK)
+        title = self.text_cache.render(self.title_font, "Chess Game", BLACK)
         title_rect = title.get_rect(center=(BOARD_SIZE // 2, 100))
         self.screen.blit(title, title_rect)
         
         # Draw result message
         if result_message:
             color = (0, 128, 0) if "won" in result_message else (255, 0, 0)
-            result_text = self.font.render(result_message, True, color)
+            result_text = self.text_cache.render(self.font, result_message, color)
             result_rect = result_text.get_rect(center=(BOARD_SIZE // 2, 160))
             self.screen.blit(result_text, result_rect)
         
@@ -36,7 +38,7 @@ class MenuRenderer:
             pygame.draw.rect(self.screen, btn_color, btn_rect, border_radius=5)
             pygame.draw.rect(self.screen, BLACK, btn_rect, 2, border_radius=5)
             
-            btn_text = self.font.render(btn_name.capitalize(), True, WHITE)
+            btn_text = self.text_cache.render(self.font, btn_name.capitalize(), WHITE)
             text_rect = btn_text.get_rect(center=btn_rect.center)
             self.screen.blit(btn_text, text_rect)
 
@@ -4,38 +4,73 @@ from ..utils.constants import *
 
 
 class PromotionDialog:
+    """Piece picker shown over the promotion file; the main loop feeds it events while it is open."""
+
+    KEYS = {
+        pygame.K_q: chess.QUEEN,
+        pygame.K_r: chess.ROOK,
+        pygame.K_b: chess.BISHOP,
+        pygame.K_n: chess.KNIGHT,
+    }
+
     def __init__(self, screen, piece_images):
         self.screen = screen
         self.piece_images = piece_images
+        self.active = False
+        self.rect = None
+        self.pieces = []
+        self.moves = {}
+        self.surface = None
+
+    def open(self, moves, is_white_turn):
+        """Offer the promotion ``moves`` (all to the same square) until one is picked or the dialog is cancelled."""
+        self.pieces = ['q', 'r', 'b', 'n'] if is_white_turn else ['Q', 'R', 'B', 'N']
+        self.moves = {move.promotion: move for move in moves}
+
+        self.surface = pygame.Surface((SQUARE_SIZE, SQUARE_SIZE * 4))
+        self.surface.fill((240, 240, 240))
+        pygame.draw.rect(self.surface, BLACK, (0, 0, SQUARE_SIZE, SQUARE_SIZE * 4), 2)
+        for i, piece in enumerate(self.pieces):
+            self.surface.blit(self.piece_images[piece], (0, i * SQUARE_SIZE))
+
+        self.rect = pygame.Rect(chess.square_file(moves[0].to_square) * SQUARE_SIZE, 0,
+                                SQUARE_SIZE, SQUARE_SIZE * 4)
+        if self.rect.y + self.rect.height > BOARD_SIZE:
+            self.rect.y = BOARD_SIZE - self.rect.height
+        self.active = True
+
+    def close(self):
+        self.active = False
+        self.moves = {}
+        self.surface = None
+
+    def draw(self):
+        if not self.active:
+            return None
+        return self.screen.blit(self.surface, self.rect)
+
+    def handle_event(self, event):
+        """
+        Return the chosen move, or None while still waiting.
+
+        Q/R/B/N pick a piece; Escape or a click outside the dialog cancels,
+        which leaves ``active`` False with no move.
+        """
+        if event.type == pygame.KEYDOWN:
+            if event.key == pygame.K_ESCAPE:
+                self.close()
+            elif event.key in self.KEYS:
+                return self._choose(self.KEYS[event.key])
+        elif event.type == pygame.MOUSEBUTTONDOWN:
+            if not self.rect.collidepoint(event.pos):
+                self.close()
+                return None
+            piece_index = (event.pos[1] - self.rect.y) // SQUARE_SIZE
+            if 0 <= piece_index < len(self.pieces):
+                return self._choose(chess.Piece.from_symbol(self.pieces[piece_index]).piece_type)
+        return None
 
-    def show(self, move, is_white_turn):
-        pieces = ['q', 'r', 'b', 'n'] if is_white_turn else ['Q', 'R', 'B', 'N']
-        
-        dialog = pygame.Surface((SQUARE_SIZE, SQUARE_SIZE * 4))
-        dialog.fill((240, 240, 240))
-        pygame.draw.rect(dialog, BLACK, (0, 0, SQUARE_SIZE, SQUARE_SIZE * 4), 2)
-        
-        for i, piece in enumerate(pieces):
-            dialog.blit(self.piece_images[piece], (0, i * SQUARE_SIZE))
-        
-        rect = pygame.Rect(chess.square_file(move.to_square) * SQUARE_SIZE, 0, 
-                          SQUARE_SIZE, SQUARE_SIZE * 4)
-        
-        if rect.y + rect.height > BOARD_SIZE:
-            rect.y = BOARD_SIZE - rect.height
-        
-        self.screen.blit(dialog, rect)
-        pygame.display.flip()
-        
-        while True:
-            for event in pygame.event.get():
-                if event.type == pygame.QUIT:
-                    return None
-                if event.type == pygame.MOUSEBUTTONDOWN:
-                    mouse_x, mouse_y = pygame.mouse.get_pos()
-                    if rect.collidepoint(mouse_x, mouse_y):
-                        rel_y = mouse_y - rect.y
-                        piece_index = rel_y // SQUARE_SIZE
-                        if 0 <= piece_index < len(pieces):
-                            return pieces[piece_index]
-        return 'q'
\ No newline at end of file
+    def _choose(self, piece_type):
+        move = self.moves[piece_type]
+        self.close()
+        return move
@@ -1,20 +1,67 @@
+from functools import cached_property
+
 import pygame
 from ..core.game import ChessGame
 from ..utils.constants import *
+from .text_cache import text_cache
+
+SIDEBAR_WIDTH = 200
+SIDEBAR_COLOR = (200, 200, 200)
+
+# Panels extend this far below their layout height so descenders are not clipped.
+PANEL_PADDING = 8
+
+EMPTY_STATS = {
+    "difficulty": "--",
+    "depth": "--",
+    "evaluation": "--",
+    "nodes": "--",
+    "search_time": "--",
+    "best_move": "--",
+}
 
 
 class SidebarRenderer:
     def __init__(self, screen):
         self.screen = screen
-        self.font = pygame.font.SysFont('Arial', 24)
-        self.small_font = pygame.font.SysFont('Arial', 18)
-        
+        self.text_cache = text_cache
+        self.show_debug = False
+        self.debug_rect = None
+
         self.buttons = {
             'undo': pygame.Rect(BOARD_SIZE + 10, 400, 180, 40),
             'restart': pygame.Rect(BOARD_SIZE + 10, 450, 180, 40),
             'back': pygame.Rect(BOARD_SIZE + 10, 500, 180, 40)
         }
 
+        # The sidebar is composed from panels, each re-rendered only when the
+        # data it shows changes. Panel name -> (data key, surface, layout height).
+        self.rect = pygame.Rect(BOARD_SIZE, 0, SIDEBAR_WIDTH, BOARD_SIZE)
+        self.surface = pygame.Surface(self.rect.size)
+        self._panels = {}
+        self._composed_keys = None
+        self._overlay = (None, None)
+
+    # Fonts are looked up on first use; the debug font usually never is.
+    @cached_property
+    def font(self):
+        return pygame.font.SysFont('Arial', 24)
+
+    @cached_property
+    def small_font(self):
+        return pygame.font.SysFont('Arial', 18)
+
+    @cached_property
+    def debug_font(self):
+        return pygame.font.SysFont('Courier New', 14)
+
+    def _text(self, font, text, color=BLACK):
+        return self.text_cache.render(font, text, color)
+
+    def invalidate(self):
+        """Blit the sidebar again on the next draw (after something else drew over it)."""
+        self._composed_keys = None
+
     @staticmethod
     def _format_search_time(search_time: float) -> str:
         if search_time <= 0:
@@ -36,52 +83,25 @@ class SidebarRenderer:
         sign = "+" if value >= 0 else "-"
         return f"{sign}{abs(value) / 100:.2f}"
 
-    def _draw_ai_statistics(self, ai_level: str, y_cursor: int) -> int:
-        game = ChessGame.get_active_instance()
-        stats = game.get_ai_statistics() if game else {
-            "difficulty": "--",
-            "depth": "--",
-            "evaluation": "--",
-            "nodes": "--",
-            "search_time": "--",
-            "best_move": "--",
-        }
-
-        title = self.font.render("AI Statistics", True, BLACK)
-        self.screen.blit(title, (BOARD_SIZE + 10, y_cursor))
-        y_cursor += 30
+    def _stat_rows(self, stats: dict, ai_level: str) -> tuple:
+        has_data = stats.get("has_data", False)
+        search_time = stats.get("search_time")
+        return (
+            ("Difficulty", str(stats.get("difficulty", ai_level.capitalize() or "--"))),
+            ("Depth", str(stats.get("depth", "--"))),
+            ("Evaluation", self._format_evaluation(stats.get("evaluation", "--")) if has_data else "--"),
+            ("Nodes", str(stats.get("nodes", "--")) if has_data else "--"),
+            ("Search Time", self._format_search_time(float(search_time) if isinstance(search_time, (int, float)) else 0.0) if has_data else "--"),
+            ("Best Move", str(stats.get("best_move", "--")) if has_data else "--"),
+        )
 
-        rows = [
-            ("Difficulty", stats.get("difficulty", ai_level.capitalize() or "--")),
-            ("Depth", stats.get("depth", "--")),
-            ("Evaluation", self._format_evaluation(stats.get("evaluation", "--")) if stats.get("has_data", False) else "--"),
-            ("Nodes", stats.get("nodes", "--") if stats.get("has_data", False) else "--"),
-            ("Search Time", self._format_search_time(float(stats.get("search_time", 0)) if stats.get("has_data", False) and isinstance(stats.get("search_time"), (int, float)) else 0.0) if stats.get("has_data", False) else "--"),
-            ("Best Move", stats.get("best_move", "--") if stats.get("has_data", False) else "--"),
-        ]
-
-        for label, value in rows:
-            self.screen.blit(self.small_font.render(label, True, BLACK), (BOARD_SIZE + 10, y_cursor))
-            self.screen.blit(self.small_font.render(str(value), True, BLACK), (BOARD_SIZE + 10, y_cursor + 18))
-            y_cursor += 34
-
-        return y_cursor + 8
-
-    def _draw_move_history(self, y_cursor: int) -> int:
-        game = ChessGame.get_active_instance()
+    @staticmethod
+    def _history_rows(game) -> tuple:
         if game is None:
-            return y_cursor
-
-        title = self.font.render("Move History", True, BLACK)
-        self.screen.blit(title, (BOARD_SIZE + 10, y_cursor))
-        y_cursor += 28
+            return ()
 
-        rows = game.get_move_history_rows(16)
-        if not rows:
-            self.screen.blit(self.small_font.render("--", True, BLACK), (BOARD_SIZE + 10, y_cursor))
-            return y_cursor + 22
-
-        for move_number, white_move, black_move in rows:
+        rows = []
+        for move_number, white_move, black_move in game.get_move_history_rows(16):
             row_text = f"{move_number}."
             if white_move:
                 row_text += f" {white_move}"
@@ -90,66 +110,145 @@ class SidebarRenderer:
 
             if len(row_text) > 34:
                 row_text = row_text[:31] + "..."
+            rows.append(row_text)
+        return tuple(rows)
+
+    def _panel(self, name, key, render):
+        """Return the panel surface and height for ``key``, rendering it only if the key changed."""
+        cached = self._panels.get(name)
+        if cached is not None and cached[0] == key:
+            return cached[1:]
+        surface, height = render(key)
+        self._panels[name] = (key, surface, height)
+        return surface, height
+
+    def _render_header(self, ai_level):
+        height = 66 if ai_level else 36
+        surface = pygame.Surface((SIDEBAR_WIDTH, height + PANEL_PADDING), pygame.SRCALPHA)
+        surface.blit(self._text(self.font, "Chess Game"), (10, 0))
+        if ai_level:
+            surface.blit(self._text(self.font, f"Level: {ai_level}"), (10, 36))
+        return surface, height
+
+    def _render_ai_statistics(self, rows):
+        height = 30 + 34 * len(rows) + 8
+        surface = pygame.Surface((SIDEBAR_WIDTH, height + PANEL_PADDING), pygame.SRCALPHA)
+        surface.blit(self._text(self.font, "AI Statistics"), (10, 0))
+        y_cursor = 30
+        for label, value in rows:
+            surface.blit(self._text(self.small_font, label), (10, y_cursor))
+            surface.blit(self._text(self.small_font, value), (10, y_cursor + 18))
+            y_cursor += 34
+        return surface, height
 
-            self.screen.blit(self.small_font.render(row_text, True, BLACK), (BOARD_SIZE + 10, y_cursor))
-            y_cursor += 18
+    def _render_move_history(self, rows):
+        height = 28 + (18 * len(rows) if rows else 22)
+        surface = pygame.Surface((SIDEBAR_WIDTH, height + PANEL_PADDING), pygame.SRCALPHA)
+        surface.blit(self._text(self.font, "Move History"), (10, 0))
+        if not rows:
+            surface.blit(self._text(self.small_font, "--"), (10, 28))
+        for index, row_text in enumerate(rows):
+            surface.blit(self._text(self.small_font, row_text), (10, 28 + index * 18))
+        return surface, height
+
+    def _render_footer(self, key):
+        # Messages sit 70 and 30 pixels above the buttons.
+        game_over, message, in_check = key
+        height = 210
+        surface = pygame.Surface((SIDEBAR_WIDTH, height), pygame.SRCALPHA)
+        buttons = (
+            ("Undo Move", (100, 100, 100) if game_over else (150, 150, 255), BLACK),
+            ("Restart Game", (255, 150, 150), BLACK),
+            ("Back to Menu", BUTTON_COLOR, WHITE),
+        )
+        for index, (caption, fill, text_color) in enumerate(buttons):
+            rect = pygame.Rect(10, 70 + index * 50, 180, 40)
+            pygame.draw.rect(surface, fill, rect)
+            pygame.draw.rect(surface, BLACK, rect, 2)
+            surface.blit(self._text(self.small_font, caption, text_color), (rect.x + 10, rect.y + 10))
 
-        return y_cursor
+        if game_over and message:
+            surface.blit(self._text(self.font, message), (10, 0))
+        if in_check:
+            surface.blit(self._text(self.font, "Check!!", (255, 0, 0)), (10, 40))
+        return surface, height
 
-    def draw(self, ai_level="", game_over=False, message="", check_timer=0):
-        sidebar = pygame.Rect(BOARD_SIZE, 0, 200, BOARD_SIZE)
-        pygame.draw.rect(self.screen, (200, 200, 200), sidebar)
+    def toggle_debug(self) -> bool:
+        self.show_debug = not self.show_debug
+        return self.show_debug
 
-        y_cursor = 20
+    @staticmethod
+    def _debug_lines(stats: dict) -> list[str]:
+        profile = stats.get("profile")
+        if not profile:
+            return ["Search profile: waiting for a search"]
+
+        lines = ["phase           calls      ms"]
+        for phase, data in profile["phases"].items():
+            lines.append(f"{phase:<14}{data['calls']:>7}{data['seconds'] * 1000:>8.0f}")
+        lines.append(f"branching factor {profile['branching_factor']:.2f}")
+        lines.append(f"cutoffs {profile['cutoffs']}, first move {profile['first_move_cutoff_rate']:.0%}")
+        return lines
+
+    def draw_debug_overlay(self):
+        """Draw the search profile over the top-left of the board."""
+        if not self.show_debug:
+            self.debug_rect = None
+            return None
 
-        # Title
-        title = self.font.render("Chess Game", True, BLACK)
-        self.screen.blit(title, (BOARD_SIZE + 10, y_cursor))
-        y_cursor += 36
+        game = ChessGame.get_active_instance()
+        lines = tuple(self._debug_lines(game.get_ai_statistics() if game else {}))
 
-        # Level
-        if ai_level:
-            level_text = self.font.render(f"Level: {ai_level}", True, BLACK)
-            self.screen.blit(level_text, (BOARD_SIZE + 10, y_cursor))
-            y_cursor += 30
+        overlay_lines, overlay = self._overlay
+        if overlay_lines != lines:
+            line_height = 16
+            overlay = pygame.Surface((290, line_height * len(lines) + 12), pygame.SRCALPHA)
+            overlay.fill((0, 0, 0, 180))
+            for index, line in enumerate(lines):
+                overlay.blit(self._text(self.debug_font, line, WHITE), (8, 6 + index * line_height))
+            self._overlay = (lines, overlay)
+
+        self.debug_rect = self.screen.blit(overlay, (8, 8))
+        return self.debug_rect
 
-        y_cursor = self._draw_ai_statistics(ai_level, y_cursor)
-        y_cursor += 12
-        y_cursor = self._draw_move_history(y_cursor)
+    def draw(self, ai_level="", game_over=False, message="", check_timer=0):
+        """Blit the sidebar if anything on it changed; return its rect, or None when nothing did."""
+        game = ChessGame.get_active_instance()
+        stats = game.get_ai_statistics() if game else EMPTY_STATS
+
+        keys = (
+            ai_level,
+            self._stat_rows(stats, ai_level),
+            self._history_rows(game),
+            (game_over, message if game_over else "", check_timer > 0),
+        )
+        if keys == self._composed_keys:
+            return None
+        self._composed_keys = keys
+
+        self.surface.fill(SIDEBAR_COLOR)
+        y_cursor = 20
+        panels = (
+            ("header", self._render_header, 0),
+            ("statistics", self._render_ai_statistics, 12),
+            ("history", self._render_move_history, 0),
+        )
+        for (name, render, gap), key in zip(panels, keys):
+            surface, height = self._panel(name, key, render)
+            self.surface.blit(surface, (0, y_cursor))
+            y_cursor += height + gap
 
-        # Buttons
         button_y = max(420, y_cursor + 18)
         self.buttons['undo'] = pygame.Rect(BOARD_SIZE + 10, button_y, 180, 40)
         self.buttons['restart'] = pygame.Rect(BOARD_SIZE + 10, button_y + 50, 180, 40)
         self.buttons['back'] = pygame.Rect(BOARD_SIZE + 10, button_y + 100, 180, 40)
+        footer, _ = self._panel("footer", keys[3], self._render_footer)
+        self.surface.blit(footer, (0, button_y - 70))
 
-        undo_color = (100, 100, 100) if game_over else (150, 150, 255)
-        pygame.draw.rect(self.screen, undo_color, self.buttons['undo'])
-        pygame.draw.rect(self.screen, (255, 150, 150), self.buttons['restart'])
-        pygame.draw.rect(self.screen, BUTTON_COLOR, self.buttons['back'])
-
-        for btn_rect in self.buttons.values():
-            pygame.draw.rect(self.screen, BLACK, btn_rect, 2)
-
-        # Button text
-        self.screen.blit(self.small_font.render("Undo Move", True, BLACK),
-                        (self.buttons['undo'].x + 10, self.buttons['undo'].y + 10))
-        self.screen.blit(self.small_font.render("Restart Game", True, BLACK),
-                        (self.buttons['restart'].x + 10, self.buttons['restart'].y + 10))
-        self.screen.blit(self.small_font.render("Back to Menu", True, WHITE),
-                        (self.buttons['back'].x + 10, self.buttons['back'].y + 10))
-
-        # Messages
-        if game_over and message:
-            result_text = self.font.render(message, True, BLACK)
-            self.screen.blit(result_text, (BOARD_SIZE + 10, button_y - 70))
-
-        if check_timer > 0:
-            check_text = self.font.render("Check!!", True, (255, 0, 0))
-            self.screen.blit(check_text, (BOARD_SIZE + 10, button_y - 30))
+        return self.screen.blit(self.surface, self.rect)
 
     def handle_click(self, pos):
         for btn_name, btn_rect in self.buttons.items():
             if btn_rect.collidepoint(pos):
                 return btn_name
-        return None
\ No newline at end of file
+        return None
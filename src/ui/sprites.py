@@ -0,0 +1,82 @@
+import hashlib
+import os
+
+import pygame
+from ..utils.constants import *
+
+# Atlas files are named after the square size and a digest of the source images,
+# so changing either makes a fresh one.
+ATLAS_PREFIX = "pieces"
+
+
+def default_cache_dir():
+    base = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    return os.path.join(base, "chess-game")
+
+
+def _assets_digest():
+    digest = hashlib.sha1()
+    for piece, filename in PIECE_IMAGES.items():
+        digest.update(piece.encode())
+        with open(get_image_path(filename), "rb") as image_file:
+            digest.update(image_file.read())
+    return digest.hexdigest()[:12]
+
+
+class PieceAtlas:
+    """
+    All twelve piece images, scaled to ``size`` and packed in one row.
+
+    The scaled atlas is saved under ``cache_dir`` and loaded as a single
+    image on later runs; pieces are blitted from it by sub-rect.
+    """
+
+    def __init__(self, size=SQUARE_SIZE, cache_dir=None):
+        self.size = size
+        self.cache_dir = cache_dir if cache_dir is not None else default_cache_dir()
+        self.rects = {
+            piece: pygame.Rect(index * size, 0, size, size) for index, piece in enumerate(PIECE_IMAGES)
+        }
+        self.loaded_from_cache = False
+        self.surface = self._load()
+        # Subsurfaces share the atlas pixels; kept for code that wants one surface per piece.
+        self.images = {piece: self.surface.subsurface(rect) for piece, rect in self.rects.items()}
+
+    def cache_path(self):
+        return os.path.join(self.cache_dir, f"{ATLAS_PREFIX}_{self.size}_{_assets_digest()}.png")
+
+    def _load(self):
+        path = self.cache_path()
+        if os.path.exists(path):
+            try:
+                surface = pygame.image.load(path).convert_alpha()
+                if surface.get_size() == (self.size * len(self.rects), self.size):
+                    self.loaded_from_cache = True
+                    return surface
+            except pygame.error:
+                pass
+
+        surface = self._build()
+        self._save(surface, path)
+        return surface
+
+    def _build(self):
+        surface = pygame.Surface((self.size * len(self.rects), self.size), pygame.SRCALPHA)
+        for piece, filename in PIECE_IMAGES.items():
+            image = pygame.image.load(get_image_path(filename)).convert_alpha()
+            surface.blit(pygame.transform.scale(image, (self.size, self.size)), self.rects[piece])
+        return surface
+
+    def _save(self, surface, path):
+        # The cache is an optimization only; an unwritable directory just means no cache.
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            for name in os.listdir(self.cache_dir):
+                if name.startswith(f"{ATLAS_PREFIX}_{self.size}_") and name != os.path.basename(path):
+                    os.remove(os.path.join(self.cache_dir, name))
+            pygame.image.save(surface, path)
+        except (OSError, pygame.error):
+            pass
+
+    def blit(self, target, piece, dest):
+        return target.blit(self.surface, dest, self.rects[piece])
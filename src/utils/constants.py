@@ -15,6 +15,18 @@ CHECK_HIGHLIGHT = (255, 0, 0, 150)
 BUTTON_COLOR = (70, 130, 180)
 BUTTON_HOVER = (100, 160, 210)
 
+# Frame rate caps: full speed while something moves on screen, reduced while
+# the AI searches so the UI thread leaves it the GIL.
+ANIMATION_FPS = 60
+THINKING_FPS = 10
+
+# Longest the main loop sleeps on an empty event queue (ms).
+IDLE_WAIT_MS = 500
+THINKING_WAIT_MS = 1000 // THINKING_FPS
+
+# How long the "Check!!" banner stays up (ms).
+CHECK_BANNER_MS = 1000
+
 # Piece images
 PIECE_IMAGES = {
     'P': 'wp.png', 'p': 'bp.png',
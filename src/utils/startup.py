@@ -0,0 +1,49 @@
+import os
+import sys
+import time
+from contextlib import contextmanager
+
+# Set this environment variable to print startup timings to stderr.
+REPORT_ENV_VAR = "CHESS_STARTUP_REPORT"
+
+
+class StartupTimer:
+    """Time spent in each startup step, up to and including the first frame."""
+
+    def __init__(self, start=None, enabled=None):
+        self.start = start if start is not None else time.perf_counter()
+        self.enabled = bool(os.environ.get(REPORT_ENV_VAR)) if enabled is None else enabled
+        self.steps = []
+        self.first_frame = None
+        self._last = self.start
+
+    def mark(self, label):
+        """Record the time since the previous mark as step ``label``."""
+        now = time.perf_counter()
+        self.steps.append((label, now - self._last))
+        self._last = now
+
+    @contextmanager
+    def measure(self, label):
+        """Record the duration of the block; after the first frame it is reported on its own line."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - start
+            self.steps.append((label, elapsed))
+            if self.first_frame is not None and self.enabled:
+                print(f"startup: {label} {elapsed * 1000:.1f} ms (deferred)", file=sys.stderr)
+
+    def frame_shown(self):
+        """Mark the first frame and print the report once."""
+        if self.first_frame is not None:
+            return
+        self.mark("first frame")
+        self.first_frame = self._last - self.start
+        if self.enabled:
+            print(self.report(), file=sys.stderr)
+
+    def report(self):
+        steps = ", ".join(f"{label} {seconds * 1000:.1f} ms" for label, seconds in self.steps)
+        return f"startup: {steps}; time to first frame {(self._last - self.start) * 1000:.1f} ms"
@@ -1,6 +1,9 @@
+import random
+
 import chess
 
-from src.core.ai import ChessAI
+from src.core.ai import INFINITY_SCORE, NODE_SYNC_INTERVAL, ChessAI
+from src.core.instrumentation import SearchProfiler
 
 
 def test_ai_initialization():
@@ -93,4 +96,306 @@ def test_book_move_is_legal():
 
     move = ai._get_book_move(board)
 
-    assert move in board.legal_moves
\ No newline at end of file
+    assert move in board.legal_moves
+
+def test_iterative_deepening_respects_node_budget():
+    ai = ChessAI("advanced", node_limit=300)
+
+    board = chess.Board("r1bqkbnr/pppp1ppp/2n5/4p3/4P3/5N2/PPPP1PPP/RNBQKB1R w KQkq - 2 3")
+    fen = board.fen()
+
+    move = ai.find_best_move(board)
+
+    assert move in board.legal_moves
+    assert board.fen() == fen
+    assert ai.last_depth >= 1
+
+
+def test_iterative_deepening_respects_time_budget():
+    ai = ChessAI("advanced", time_limit=0.2)
+
+    board = chess.Board("r1bq1rk1/ppp2ppp/2np1n2/2b1p3/2B1P3/2NP1N2/PPP2PPP/R1BQ1RK1 w - - 0 7")
+
+    move = ai.find_best_move(board)
+
+    assert move in board.legal_moves
+    assert ai.last_depth >= 1
+    assert ai.last_search_time < 2.0
+
+
+def test_iterative_deepening_stops_at_max_depth():
+    ai = ChessAI("advanced", time_limit=30, max_depth=2)
+
+    board = chess.Board("8/5pk1/6p1/8/3R4/6P1/5PK1/3r4 w - - 0 1")
+
+    ai.find_best_move(board)
+
+    assert ai.last_depth == 2
+
+
+def test_incremental_material_matches_full_evaluation_over_random_games():
+    ai = ChessAI()
+    rng = random.Random(1234)
+
+    start_positions = [
+        chess.STARTING_FEN,
+        # Castling both ways, en passant and promotions are all available here.
+        "r3k2r/pPppqpb1/bn2pnp1/3PN3/1p2P3/2N2Q1p/PPPBBPPP/R3K2R w KQkq - 0 1",
+        "8/P1k5/8/3pP3/8/8/5Kp1/8 w - d6 0 1",
+    ]
+
+    for fen in start_positions:
+        for _ in range(10):
+            board = chess.Board(fen)
+            ai._begin_search_state(board)
+
+            for _ in range(80):
+                moves = list(board.legal_moves)
+                if not moves:
+                    break
+                ai._make_move(board, rng.choice(moves))
+                assert ai._search_state.material == ai.evaluate_material(board)
+
+            while board.move_stack:
+                ai._unmake_move(board)
+                assert ai._search_state.material == ai.evaluate_material(board)
+
+    # Random play rarely finds en passant, so check it explicitly.
+    board = chess.Board("8/P1k5/8/3pP3/8/8/5Kp1/8 w - d6 0 1")
+    ai._begin_search_state(board)
+    ai._make_move(board, chess.Move.from_uci("e5d6"))
+    assert ai._search_state.material == ai.evaluate_material(board)
+
+
+def test_fast_check_detection_matches_python_chess():
+    ai = ChessAI()
+    rng = random.Random(99)
+
+    for fen in [chess.STARTING_FEN, "r3k2r/pPppqpb1/bn2pnp1/3PN3/1p2P3/2N2Q1p/PPPBBPPP/R3K2R w KQkq - 0 1"]:
+        for _ in range(10):
+            board = chess.Board(fen)
+            for _ in range(60):
+                moves = list(board.legal_moves)
+                if not moves:
+                    break
+                for move in moves:
+                    assert ai._gives_check(board, move) == board.gives_check(move)
+                board.push(rng.choice(moves))
+
+
+def test_move_ordering_stages():
+    ai = ChessAI()
+
+    board = chess.Board("r1bqkbnr/pppp1ppp/2n5/4p3/3PP3/5N2/PPP2PPP/RNBQKB1R b KQkq - 0 3")
+    moves = list(board.legal_moves)
+    hash_move = chess.Move.from_uci("g8f6")
+    killer = chess.Move.from_uci("f8b4")
+    ai.killer_moves[0][0] = killer
+
+    ordered = ai._order_moves(board, moves, hash_move, ply=0)
+
+    assert ordered[0] == hash_move
+    # Captures come next, then the killer move ahead of other quiet moves.
+    assert board.is_capture(ordered[1])
+    first_quiet = next(move for move in ordered[1:] if not board.is_capture(move))
+    assert first_quiet == killer
+
+
+def test_quiescence_avoids_capturing_a_defended_pawn_with_the_queen():
+    board = chess.Board("4k3/8/2p5/3p4/8/8/3Q4/4K3 w - - 0 1")
+
+    horizon_ai = ChessAI("advanced", use_quiescence=False)
+    quiet_ai = ChessAI("advanced")
+
+    horizon_best, _ = horizon_ai._rank_root_moves(board, list(board.legal_moves), 1)[0]
+    quiet_best, _ = quiet_ai._rank_root_moves(board, list(board.legal_moves), 1)[0]
+
+    assert horizon_best == chess.Move.from_uci("d2d5")
+    assert quiet_best != chess.Move.from_uci("d2d5")
+    assert quiet_ai.qnodes_searched > 0
+
+
+def test_parallel_root_search_matches_serial_choice():
+    serial = ChessAI("advanced")
+    parallel = ChessAI("advanced", workers=2)
+
+    try:
+        for fen in [
+            "r1bqkbnr/pppp1ppp/2n5/4p3/4P3/5N2/PPPP1PPP/RNBQKB1R w KQkq - 2 3",
+            "r3k2r/pPppqpb1/bn2pnp1/3PN3/1p2P3/2N2Q1p/PPPBBPPP/R3K2R b KQkq - 0 1",
+        ]:
+            board = chess.Board(fen)
+            moves = serial._order_moves(board, list(board.legal_moves))
+
+            serial_best = serial._rank_root_moves(board, moves, 2)[0]
+            parallel_best = parallel._rank_root_moves(board, moves, 2)[0]
+
+            assert parallel_best == serial_best
+            assert parallel.nodes_searched > 0
+    finally:
+        parallel.close()
+
+
+def test_parallel_search_stops_near_the_node_limit():
+    ai = ChessAI("advanced", workers=2, node_limit=20000)
+    ai.use_book = False
+    board = chess.Board("r1bq1rk1/ppp2ppp/2np1n2/2b1p3/2B1P3/2NP1N2/PPP2PPP/R1BQ1RK1 w - - 0 7")
+
+    try:
+        assert ai.find_best_move(board) in board.legal_moves
+        # Counts every worker's nodes, including those of root moves cut off by the budget.
+        searched = ai._shared_node_count.value
+    finally:
+        ai.close()
+
+    assert 20000 <= searched <= 20000 + ai.workers * NODE_SYNC_INTERVAL
+
+
+def test_minimax_wrapper_matches_negamax_core():
+    board = chess.Board("r1bqkbnr/pppp1ppp/2n5/4p3/4P3/5N2/PPPP1PPP/RNBQKB1R b KQkq - 3 3")
+
+    wrapper_ai = ChessAI()
+    core_ai = ChessAI()
+
+    white_view = wrapper_ai.minimax(board, 2, -float("inf"), float("inf"), False)
+    side_view = core_ai._negamax(board, 2, -INFINITY_SCORE, INFINITY_SCORE)
+
+    assert white_view == -side_view
+
+
+def test_aspiration_failure_falls_back_to_full_window():
+    board = chess.Board("r1bqkbnr/pppp1ppp/2n5/4p3/4P3/5N2/PPPP1PPP/RNBQKB1R w KQkq - 2 3")
+
+    full_ai = ChessAI()
+    aspiration_ai = ChessAI()
+    moves = full_ai._order_moves(board, list(board.legal_moves))
+
+    expected = full_ai._rank_root_moves(board, moves, 2)[0]
+    # A previous score far outside the real one forces a fail-low re-search.
+    result = aspiration_ai._aspiration_search(board, moves, 2, 5000)[0]
+
+    assert result == expected
+    assert aspiration_ai.aspiration_researches == 1
+
+
+def test_stopped_search_still_returns_a_legal_move():
+    ai = ChessAI("advanced")
+    board = chess.Board("r1bq1rk1/ppp2ppp/2np1n2/2b1p3/2B1P3/2NP1N2/PPP2PPP/R1BQ1RK1 w - - 0 7")
+    fen = board.fen()
+
+    ai.stop()
+    move = ai.find_best_move(board)
+
+    assert move in board.legal_moves
+    assert board.fen() == fen
+    assert ai.nodes_searched <= 1
+
+
+def test_null_move_is_skipped_in_pawn_endings_and_in_check():
+    ai = ChessAI("advanced")
+
+    pawn_ending = chess.Board("8/5k2/5p2/8/8/5P2/5K2/8 w - - 0 1")
+    rook_ending = chess.Board("8/5k2/5p2/8/8/5P2/5K2/R7 w - - 0 1")
+
+    assert not ai._null_move_allowed(pawn_ending, 4, 0)
+    assert ai._null_move_allowed(rook_ending, 4, 0)
+    assert not ai._null_move_allowed(rook_ending, 2, 0)
+
+    rook_ending.push(chess.Move.null())
+    rook_ending.push(chess.Move.from_uci("f7e6"))
+    rook_ending.push(chess.Move.null())
+    assert not ai._null_move_allowed(rook_ending, 4, 0)
+
+
+def test_selective_search_prunes_and_keeps_the_tactic():
+    # White wins the queen with Nc7+.
+    board = chess.Board("r3k2r/ppp2ppp/2n5/1N1q4/8/8/PPP2PPP/R3K2R w KQkq - 0 1")
+    moves = ChessAI()._order_moves(board, list(board.legal_moves))
+
+    full_ai = ChessAI("advanced")
+    full_ai.use_null_move = False
+    full_ai.use_lmr = False
+    selective_ai = ChessAI("advanced")
+
+    full_best = full_ai._rank_root_moves(board, moves, 4)[0][0]
+    selective_best = selective_ai._rank_root_moves(board, moves, 4)[0][0]
+
+    assert selective_best == full_best == chess.Move.from_uci("b5c7")
+    assert selective_ai.null_move_cutoffs > 0
+    assert selective_ai.nodes_searched < full_ai.nodes_searched
+    assert full_ai.null_move_cutoffs == full_ai.lmr_reductions == 0
+
+
+def test_late_move_reductions_shrink_the_tree():
+    board = chess.Board("2r3k1/5ppp/8/8/8/8/5PPP/3R2K1 w - - 0 1")
+    moves = ChessAI()._order_moves(board, list(board.legal_moves))
+
+    full_ai = ChessAI("advanced")
+    full_ai.use_null_move = False
+    full_ai.use_lmr = False
+    reduced_ai = ChessAI("advanced")
+    reduced_ai.use_null_move = False
+
+    full_ai._rank_root_moves(board, moves, 4)
+    reduced_best = reduced_ai._rank_root_moves(board, moves, 4)[0][0]
+
+    assert reduced_best in board.legal_moves
+    assert reduced_ai.lmr_reductions > 0
+    assert reduced_ai.lmr_researches <= reduced_ai.lmr_reductions
+    assert reduced_ai.nodes_searched < full_ai.nodes_searched
+
+
+def test_beginner_level_searches_without_pruning():
+    ai = ChessAI("beginner")
+
+    assert not ai.use_null_move
+    assert not ai.use_lmr
+
+
+def test_instrumentation_reports_phases_and_cutoffs():
+    board = chess.Board("r1bqk2r/pppp1ppp/2n2n2/2b1p3/2B1P3/3P1N2/PPP2PPP/RNBQK2R w KQkq - 1 5")
+    ai = ChessAI("advanced", instrument=True)
+
+    ai.find_best_move(board, max_depth=3, infinite=True)
+    profile = ai.profiler.summary()
+
+    for phase in ("eval", "mobility", "center_control", "ordering", "movegen", "terminal", "book"):
+        assert profile["phases"][phase]["calls"] > 0
+    assert profile["phases"]["eval"]["seconds"] >= profile["phases"]["mobility"]["seconds"]
+    assert profile["branching_factor"] > 1
+    assert 0 < profile["first_move_cutoff_rate"] <= 1
+
+
+def test_instrumentation_can_be_switched_off():
+    ai = ChessAI(instrument=True)
+    ai.enable_instrumentation(False)
+
+    assert ai.profiler is None
+    assert "evaluate_board" not in ai.__dict__
+
+
+
+class _ProfilerSwitchedOffMidSearch(ChessAI):
+    """Profiling flips off and on between every read of ``profiler``, as if F3 were pressed mid-search."""
+
+    @property
+    def profiler(self):
+        self._profiler_reads += 1
+        return self._profiler if self._profiler_reads % 2 else None
+
+    @profiler.setter
+    def profiler(self, value):
+        self._profiler = value
+        self._profiler_reads = 0
+
+
+def test_search_survives_profiling_being_switched_off():
+    ai = _ProfilerSwitchedOffMidSearch("advanced")
+    ai.profiler = SearchProfiler()
+    ai.use_book = False
+    ai.depth = 2
+    board = chess.Board("r1bqk2r/pppp1ppp/2n2n2/2b1p3/2B1P3/3P1N2/PPP2PPP/RNBQK2R w KQkq - 1 5")
+
+    move = ai.find_best_move(board)
+
+    assert move in board.legal_moves
@@ -0,0 +1,89 @@
+import io
+
+import chess
+import chess.engine
+import chess.pgn
+
+from src.core.analysis import analyse_game, analyse_pgn, iter_games
+from src.core.tournament import EngineConfig
+
+SCHOLARS_MATE = """[Event "Scholar"]
+[Result "1-0"]
+
+1. e4 e5 2. Qh5 Nc6 3. Bc4 Nf6 4. Qxf7# 1-0
+"""
+
+QUEENS_GAMBIT = """[Event "Gambit"]
+[Result "*"]
+
+1. d4 d5 2. c4 e6 *
+"""
+
+CONFIG = EngineConfig("analysis", "advanced", max_depth=2)
+
+
+def _engine():
+    ai = CONFIG.create()
+    ai.use_book = False
+    return ai
+
+
+def test_analyse_game_flags_the_blunder():
+    game = chess.pgn.read_game(io.StringIO(SCHOLARS_MATE))
+    ai = _engine()
+    try:
+        analyse_game(ai, game)
+    finally:
+        ai.close()
+
+    nodes = list(game.mainline())
+    assert all(node.eval() is not None for node in nodes)
+    assert nodes[-1].eval().white().is_mate()
+
+    blunder = nodes[5]
+    assert blunder.san() == "Nf6"
+    assert chess.pgn.NAG_BLUNDER in blunder.nags
+    assert "Blunder" in blunder.comment
+    # The engine's line is added as a variation, leaving the mainline intact.
+    assert len(blunder.parent.variations) == 2
+    assert blunder.parent.variations[0] is blunder
+    assert not nodes[0].nags
+
+
+def test_final_checkmate_is_annotated_as_mate_in_zero():
+    game = chess.pgn.read_game(io.StringIO(SCHOLARS_MATE))
+    ai = _engine()
+    try:
+        analyse_game(ai, game)
+    finally:
+        ai.close()
+
+    last = game.end()
+    assert last.san() == "Qxf7#"
+    assert last.comment.endswith("[%eval #0]")
+    # python-chess reads #0 as the side to move (Black) being mated.
+    assert last.eval().white().mate() == 0
+    assert last.eval().white() > chess.engine.Cp(0)
+    # The move before the mate still reads as mate in one.
+    assert "[%eval #1]" in last.parent.comment
+
+
+def test_iter_games_reads_lazily():
+    stream = io.StringIO(SCHOLARS_MATE + "\n" + QUEENS_GAMBIT)
+    games = iter_games(stream)
+
+    assert next(games).headers["Event"] == "Scholar"
+    assert stream.tell() < len(stream.getvalue())
+    assert [game.headers["Event"] for game in games] == ["Gambit"]
+
+
+def test_analyse_pgn_keeps_game_order_across_workers():
+    source = SCHOLARS_MATE + "\n" + QUEENS_GAMBIT
+    serial, parallel = io.StringIO(), io.StringIO()
+
+    assert analyse_pgn(io.StringIO(source), serial, CONFIG, workers=1) == 2
+    assert analyse_pgn(io.StringIO(source), parallel, CONFIG, workers=2) == 2
+
+    events = [game.headers["Event"] for game in iter_games(io.StringIO(parallel.getvalue()))]
+    assert events == ["Scholar", "Gambit"]
+    assert parallel.getvalue() == serial.getvalue()
@@ -0,0 +1,46 @@
+import random
+
+import chess
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from src.core.ai import ChessAI
+from src.core.batch_eval import BatchEvaluator
+
+
+def test_planes_match_board_occupancy():
+    board = chess.Board()
+
+    planes = BatchEvaluator.to_planes([board])
+
+    assert planes.shape == (1, 12, 64)
+    assert planes[0, 0, chess.E2] == 1
+    assert planes[0, 5, chess.E1] == 1
+    assert planes[0, 11, chess.E8] == 1
+    assert planes.sum() == 32
+
+
+def test_batch_scores_match_evaluate_material():
+    ai = ChessAI()
+    evaluator = BatchEvaluator(ai)
+    rng = random.Random(7)
+
+    boards = []
+    board = chess.Board()
+    for _ in range(200):
+        moves = list(board.legal_moves)
+        if not moves:
+            board = chess.Board()
+            continue
+        board.push(rng.choice(moves))
+        boards.append(board.copy(stack=False))
+
+    scores = evaluator.evaluate_material(boards)
+
+    assert scores.dtype == np.int64
+    assert scores.tolist() == [ai.evaluate_material(b) for b in boards]
+
+
+def test_empty_batch():
+    assert BatchEvaluator().evaluate_material([]).shape == (0,)
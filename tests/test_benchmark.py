@@ -0,0 +1,48 @@
+import json
+
+import chess
+
+from src.core.benchmark import compare_reports, main, run_benchmark, run_perft
+
+
+def test_perft_counts_match_reference_values():
+    results = run_perft([("start", chess.STARTING_FEN, 2, 400)])
+
+    assert results[0]["nodes"] == 400
+    assert results[0]["ok"]
+
+
+def test_benchmark_report_is_json_with_time_to_depth(tmp_path):
+    output = tmp_path / "bench.json"
+
+    assert main(["--depth", "2", "--skip-perft", "--output", str(output)]) == 0
+
+    report = json.loads(output.read_text())
+    assert report["depth"] == 2
+    assert report["perft"] == []
+    for entry in report["search"]:
+        assert entry["depth"] == 2
+        assert set(entry["time_to_depth"]) == {"1", "2"}
+        assert entry["nodes"] > 0
+    assert report["totals"]["search_nps"] > 0
+
+
+def test_compare_flags_node_and_speed_regressions():
+    search = [("rook_ending", "2r3k1/5ppp/8/8/8/8/5PPP/3R2K1 w - - 0 1")]
+    baseline = run_benchmark(depth=2, perft_positions=None, search_positions=search)
+
+    assert compare_reports(baseline, baseline) == []
+
+    slower = json.loads(json.dumps(baseline))
+    slower["search"][0]["nodes"] *= 2
+    slower["totals"]["search_nps"] /= 2
+    regressions = compare_reports(baseline, slower)
+
+    assert len(regressions) == 2
+    assert "rook_ending" in regressions[0]
+
+
+def test_compare_flags_wrong_perft_counts():
+    report = {"perft": [{"name": "start", "nodes": 8901, "expected": 8902, "ok": False}], "search": []}
+
+    assert compare_reports({}, report) == ["perft start: 8901 nodes, expected 8902"]
@@ -0,0 +1,111 @@
+import os
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import chess
+import pygame
+import pytest
+
+from src.ui.board import BoardRenderer
+from src.ui.sprites import PieceAtlas
+from src.utils.constants import BOARD_SIZE, SQUARE_SIZE
+
+
+@pytest.fixture
+def renderer(tmp_path):
+    pygame.display.init()
+    screen = pygame.display.set_mode((BOARD_SIZE + 200, BOARD_SIZE))
+    yield BoardRenderer(screen, PieceAtlas(SQUARE_SIZE, cache_dir=str(tmp_path)))
+    pygame.display.quit()
+
+
+def test_only_changed_squares_are_redrawn(renderer):
+    board = chess.Board()
+
+    assert len(renderer.draw(board)) == 64
+    assert renderer.draw(board) == []
+
+    board.push_uci("e2e4")
+    dirty = renderer.draw(board)
+    assert sorted(dirty, key=tuple) == sorted(
+        [renderer.square_rect(chess.E2), renderer.square_rect(chess.E4)], key=tuple
+    )
+
+
+def test_selection_and_move_dots_mark_their_squares(renderer):
+    board = chess.Board()
+    renderer.draw(board)
+
+    moves = [move for move in board.legal_moves if move.from_square == chess.G1]
+    dirty = renderer.draw(board, chess.G1, moves)
+
+    assert {renderer.coords_to_square(rect.x, rect.y) for rect in dirty} == {chess.G1, chess.F3, chess.H3}
+    # Deselecting repaints the same squares.
+    assert len(renderer.draw(board)) == 3
+
+
+def test_check_highlight_and_invalidate(renderer):
+    board = chess.Board("4k3/8/8/8/8/8/8/4K2R w - - 0 1")
+    renderer.draw(board)
+
+    board.push_uci("h1h8")
+    dirty = renderer.draw(board)
+    assert renderer.square_rect(chess.E8) in dirty
+
+    renderer.invalidate(pygame.Rect(0, 0, SQUARE_SIZE + 1, 1))
+    assert len(renderer.draw(board)) == 2
+    renderer.invalidate()
+    assert len(renderer.draw(board)) == 64
+
+
+def _record_blits(renderer, monkeypatch):
+    blits = []
+    blit = renderer.atlas.blit
+
+    def record(target, piece, dest):
+        blits.append((piece, pygame.Rect(dest)))
+        return blit(target, piece, dest)
+
+    monkeypatch.setattr(renderer.atlas, "blit", record)
+    return blits
+
+
+def test_animated_piece_repaints_its_trail(renderer, monkeypatch):
+    board = chess.Board()
+    renderer.draw(board)
+    knight = board.piece_at(chess.G1)
+    blits = _record_blits(renderer, monkeypatch)
+
+    first = renderer.draw(board, animated_piece=(knight, (450, 525)), skip_square=chess.G1)
+    second = renderer.draw(board, animated_piece=(knight, (460, 500)), skip_square=chess.G1)
+    done = renderer.draw(board)
+
+    assert pygame.Rect(450, 525, SQUARE_SIZE, SQUARE_SIZE) in first
+    assert pygame.Rect(450, 525, SQUARE_SIZE, SQUARE_SIZE) in second
+    assert pygame.Rect(460, 500, SQUARE_SIZE, SQUARE_SIZE) in done
+    # The moving piece is drawn with its own sprite, not whatever stands on h8.
+    assert ("N", pygame.Rect(450, 525, SQUARE_SIZE, SQUARE_SIZE)) in blits
+    assert ("N", pygame.Rect(460, 500, SQUARE_SIZE, SQUARE_SIZE)) in blits
+
+
+def test_animated_piece_draws_with_h8_empty(renderer, monkeypatch):
+    # Black has castled kingside, so h8 is empty.
+    board = chess.Board("rnbq1rk1/pppp1ppp/5n2/2b1p3/2B1P3/5N2/PPPP1PPP/RNBQK2R w KQ - 6 5")
+    renderer.draw(board)
+    pawn = board.piece_at(chess.D2)
+    blits = _record_blits(renderer, monkeypatch)
+
+    dirty = renderer.draw(board, animated_piece=(pawn, (225, 420)), skip_square=chess.D2)
+
+    assert pygame.Rect(225, 420, SQUARE_SIZE, SQUARE_SIZE) in dirty
+    assert blits[-1] == ("P", pygame.Rect(225, 420, SQUARE_SIZE, SQUARE_SIZE))
+
+
+def test_move_targets_can_come_from_the_legal_move_index(renderer):
+    board = chess.Board()
+    renderer.draw(board)
+    targets = {chess.F3: [chess.Move.from_uci("g1f3")], chess.H3: [chess.Move.from_uci("g1h3")]}
+
+    dirty = renderer.draw(board, chess.G1, targets)
+
+    assert {renderer.coords_to_square(rect.x, rect.y) for rect in dirty} == {chess.G1, chess.F3, chess.H3}
@@ -1,3 +1,4 @@
+import threading
 import time
 
 import chess
@@ -125,4 +126,151 @@ def test_statistics_dictionary_exists():
 
     assert "difficulty" in stats
     assert "depth" in stats
-    assert "nodes" in stats
\ No newline at end of file
+    assert "nodes" in stats
+
+def test_cancel_ai_search_stops_thread_and_discards_result():
+    game = ChessGame()
+
+    game.start_new_game("advanced")
+    game.board = chess.Board("r1bq1rk1/ppp2ppp/2np1n2/2b1p3/2B1P3/2NP1N2/PPP2PPP/R1BQ1RK1 b - - 0 7")
+    game.ai.depth = 8
+
+    game.start_ai_search()
+    thread = game.ai_thread
+    time.sleep(0.2)
+
+    started = time.perf_counter()
+    game.cancel_ai_search()
+
+    assert time.perf_counter() - started < 1.0
+    assert not thread.is_alive()
+    assert game.ai_thinking is False
+    assert game.pending_ai_move is None
+
+
+def test_search_finished_callback_fires_only_for_completed_searches():
+    game = ChessGame()
+    finished = []
+    done = threading.Event()
+
+    def on_search_finished():
+        finished.append(game.pending_ai_move)
+        done.set()
+
+    game.on_search_finished = on_search_finished
+    game.start_new_game("beginner")
+    game.board = chess.Board("r1bqkbnr/pppp1ppp/2n5/4p3/4P3/5N2/PPPP1PPP/RNBQKB1R b KQkq - 3 3")
+    game.ai.depth = 1
+    game.start_ai_search()
+
+    assert done.wait(5)
+    assert finished == [game.pending_ai_move]
+    assert game.apply_pending_ai_move()
+
+    game.ai.depth = 8
+    game.start_ai_search()
+    time.sleep(0.1)
+    game.cancel_ai_search()
+    assert len(finished) == 1
+
+
+def test_ponder_hit_answers_without_new_search():
+    game = ChessGame()
+
+    game.start_new_game("beginner")
+    game.ponder_enabled = True
+    game.ai.depth = 2
+    game.ai.ponder_extra_depth = 1
+    game.board = chess.Board("r1bqkbnr/pppp1ppp/2n5/4p3/4P3/5N2/PPPP1PPP/RNBQKB1R b KQkq - 3 3")
+
+    game.start_ai_search()
+    game.ai_thread.join()
+    assert game.apply_pending_ai_move()
+
+    assert game.ponder_move is not None
+    game.ponder_thread.join()
+
+    game.make_move(game.ponder_move)
+    game.start_ai_search()
+
+    assert game.ponder_hits == 1
+    assert game.ai_thread is None
+    assert game.pending_ai_move in game.board.legal_moves
+    assert game.apply_pending_ai_move()
+
+
+def test_pondering_keeps_statistics_of_the_played_search():
+    game = ChessGame()
+
+    game.start_new_game("beginner")
+    game.ponder_enabled = True
+    game.ai.depth = 2
+    game.ai.ponder_extra_depth = 1
+    game.board = chess.Board("r1bqkbnr/pppp1ppp/2n5/4p3/4P3/5N2/PPPP1PPP/RNBQKB1R b KQkq - 3 3")
+
+    game.start_ai_search()
+    game.ai_thread.join()
+    searched = game.get_ai_statistics()
+    assert game.apply_pending_ai_move()
+
+    assert game.ponder_move is not None
+    assert game.get_ai_statistics() == searched
+    game.ponder_thread.join()
+
+    assert game.ponder_result[0] > searched["depth"]
+    assert game.get_ai_statistics() == searched
+
+    game.make_move(game.ponder_move)
+    game.start_ai_search()
+    assert game.ponder_hits == 1
+    assert game.get_ai_statistics()["depth"] > searched["depth"]
+
+
+def test_statistics_include_search_profile_when_instrumented():
+    game = ChessGame()
+    game.start_new_game("beginner")
+    game.set_instrumentation(True)
+    game.board = chess.Board("r1bqk2r/pppp1ppp/2n2n2/2b1p3/2B1P3/3P1N2/PPP2PPP/RNBQK2R w KQkq - 1 5")
+
+    game.ai.find_best_move(game.board)
+    stats = game.get_ai_statistics()
+
+    assert stats["profile"]["phases"]["movegen"]["calls"] > 0
+    assert stats["profile"]["expanded_nodes"] > 0
+
+
+def test_legal_move_index_groups_moves_by_square():
+    game = ChessGame()
+    game.start_new_game("beginner")
+    game.board = chess.Board("4k3/1P6/8/8/8/8/8/4K3 w - - 0 1")
+
+    index = game.legal_move_index()
+    promotions = index[chess.B7][chess.B8]
+    assert sorted(move.promotion for move in promotions) == [chess.KNIGHT, chess.BISHOP, chess.ROOK, chess.QUEEN]
+    assert sum(len(moves) for targets in index.values() for moves in targets.values()) == game.board.legal_moves.count()
+    assert game.legal_move_index() is index
+
+    game.select_square(chess.B7)
+    assert game.selected_square == chess.B7
+    assert sorted(game.valid_moves, key=str) == sorted(promotions, key=str)
+    assert game.moves_from(chess.A1) == {}
+
+
+def test_legal_move_index_follows_the_position():
+    game = ChessGame()
+    game.start_new_game("beginner")
+
+    assert set(game.moves_from(chess.E2)) == {chess.E3, chess.E4}
+    game.make_move(chess.Move.from_uci("e2e4"))
+    assert game.moves_from(chess.E2) == {}
+    assert chess.E5 in game.moves_from(chess.E7)
+
+    game.make_move(chess.Move.from_uci("e7e5"))
+    game.select_square(chess.G1)
+    game.undo_move()
+    assert game.selected_square is None
+    assert set(game.moves_from(chess.E2)) == {chess.E3, chess.E4}
+
+    game.queue_pending_move(chess.Move.from_uci("d2d4"))
+    game.commit_pending_move()
+    assert game.moves_from(chess.D2) == {}
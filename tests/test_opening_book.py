@@ -1,7 +1,31 @@
+import random
+import struct
+
 import chess
+import chess.polyglot
 
 from src.core.ai import ChessAI
-from src.core.opening_book import OPENING_BOOK
+from src.core.opening_book import OPENING_BOOK, OpeningBook, builtin_book_by_key
+
+
+def _polyglot_move(move: chess.Move) -> int:
+    return (
+        chess.square_file(move.to_square)
+        | chess.square_rank(move.to_square) << 3
+        | chess.square_file(move.from_square) << 6
+        | chess.square_rank(move.from_square) << 9
+    )
+
+
+def _write_book(path, entries):
+    """Write (board, uci, weight) entries as a Polyglot book sorted by key."""
+    records = sorted(
+        (chess.polyglot.zobrist_hash(board), _polyglot_move(chess.Move.from_uci(uci)), weight)
+        for board, uci, weight in entries
+    )
+    with open(path, "wb") as book_file:
+        for key, move, weight in records:
+            book_file.write(struct.pack(">QHHI", key, move, weight, 0))
 
 
 def test_opening_book_not_empty():
@@ -29,4 +53,49 @@ def test_book_lookup_returns_legal_move():
 
     move = ai._get_book_move(board)
 
-    assert move in board.legal_moves
\ No newline at end of file
+    assert move in board.legal_moves
+
+def test_builtin_book_is_keyed_by_zobrist_hash():
+    board = chess.Board()
+    board.halfmove_clock = 7
+
+    moves = builtin_book_by_key()[chess.polyglot.zobrist_hash(board)]
+
+    assert chess.Move.from_uci("e2e4") in moves
+    assert len(moves) == len(set(moves))
+
+
+def test_polyglot_book_uses_weights(tmp_path):
+    path = tmp_path / "book.bin"
+    board = chess.Board()
+    _write_book(path, [(board, "d2d4", 1), (board, "g1f3", 0)])
+
+    book = OpeningBook(str(path), rng=random.Random(1))
+    try:
+        moves = {book.choose_move(board) for _ in range(20)}
+    finally:
+        book.close()
+
+    assert moves == {chess.Move.from_uci("d2d4")}
+
+
+def test_polyglot_book_falls_back_to_builtin_book(tmp_path):
+    path = tmp_path / "book.bin"
+    _write_book(path, [(chess.Board(), "d2d4", 1)])
+    board = chess.Board()
+    board.push_uci("e2e4")
+    board.push_uci("c7c5")
+
+    ai = ChessAI(book_path=str(path))
+    try:
+        move = ai._get_book_move(board)
+    finally:
+        ai.close()
+
+    assert move in builtin_book_by_key()[chess.polyglot.zobrist_hash(board)]
+
+
+def test_out_of_book_position_returns_none():
+    board = chess.Board("4k3/8/8/8/8/8/8/4K2R w K - 0 1")
+
+    assert OpeningBook().choose_move(board) is None
@@ -0,0 +1,83 @@
+import os
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import warnings
+
+import chess
+import pygame
+import pytest
+
+from main import ChessApp
+from src.utils.constants import SQUARE_SIZE
+
+PROMOTION_FEN = "4k3/1P6/8/8/8/8/8/4K3 w - - 0 1"
+
+
+@pytest.fixture
+def app(tmp_path, monkeypatch):
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+    with warnings.catch_warnings():
+        # SysFont warns when fc-list is unavailable and falls back to the default font.
+        warnings.simplefilter("ignore")
+        app = ChessApp()
+    app.game.start_new_game("beginner")
+    app.game.board = chess.Board(PROMOTION_FEN)
+    app.game_active = True
+    yield app
+    app.game.cancel_ai_search()
+    pygame.quit()
+
+
+def _center(square):
+    return (
+        chess.square_file(square) * SQUARE_SIZE + SQUARE_SIZE // 2,
+        (7 - chess.square_rank(square)) * SQUARE_SIZE + SQUARE_SIZE // 2,
+    )
+
+
+def _click(app, pos):
+    pygame.mouse.set_pos(pos)
+    return app._handle_event(pygame.event.Event(pygame.MOUSEBUTTONDOWN, pos=pos, button=1))
+
+
+def _open_dialog(app):
+    app.game.select_square(None)
+    app.handle_board_click(_center(chess.B7))
+    app.handle_board_click(_center(chess.B8))
+    assert app.promotion_dialog.active
+    assert app.game.pending_move is None
+
+
+def test_promotion_key_picks_the_piece(app):
+    _open_dialog(app)
+
+    app._handle_event(pygame.event.Event(pygame.KEYDOWN, key=pygame.K_n, mod=0, unicode="n"))
+
+    assert not app.promotion_dialog.active
+    assert app.game.pending_move == chess.Move.from_uci("b7b8n")
+
+
+def test_promotion_click_picks_the_piece(app):
+    _open_dialog(app)
+    rect = app.promotion_dialog.rect
+
+    # Second slot is the rook.
+    _click(app, (rect.centerx, rect.y + SQUARE_SIZE + SQUARE_SIZE // 2))
+
+    assert app.game.pending_move == chess.Move.from_uci("b7b8r")
+
+
+def test_promotion_dialog_is_modal_and_can_be_cancelled(app):
+    _open_dialog(app)
+
+    _click(app, _center(chess.E1))
+    assert not app.promotion_dialog.active
+    assert app.game.pending_move is None
+    # The click only closed the dialog; the pawn is still selected.
+    assert app.game.selected_square == chess.B7
+
+    _open_dialog(app)
+    app._handle_event(pygame.event.Event(pygame.KEYDOWN, key=pygame.K_ESCAPE, mod=0, unicode=""))
+    assert not app.promotion_dialog.active
+    assert app.game.pending_move is None
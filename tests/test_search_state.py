@@ -0,0 +1,66 @@
+import chess
+import chess.polyglot
+
+from src.core.ai import ChessAI
+from src.core.search_state import SearchState
+
+# Reference perft counts, as produced by python-chess.
+PERFT_POSITIONS = [
+    (chess.STARTING_FEN, 3, 8902),
+    ("r3k2r/p1ppqpb1/bn2pnp1/3PN3/1p2P3/2N2Q1p/PPPBBPPP/R3K2R w KQkq - 0 1", 2, 2039),
+    ("8/2p5/3p4/KP5r/1R3p1k/8/4P1P1/8 w - - 0 1", 3, 2812),
+    ("r3k2r/Pppp1ppp/1b3nbN/nP6/BBP1P3/q4N2/Pp1P2PP/R2Q1RK1 w kq - 0 1", 2, 264),
+]
+
+
+def _perft(ai: ChessAI, state: SearchState, board: chess.Board, depth: int) -> int:
+    assert state.key == chess.polyglot.zobrist_hash(board)
+    assert state.material == ai.evaluate_material(board)
+    if depth == 0:
+        return 1
+
+    nodes = 0
+    for move in list(board.legal_moves):
+        state.push(board, move)
+        nodes += _perft(ai, state, board, depth - 1)
+        state.pop(board)
+    return nodes
+
+
+def test_perft_matches_python_chess_and_keeps_key_and_material_in_step():
+    ai = ChessAI()
+
+    for fen, depth, expected in PERFT_POSITIONS:
+        board = chess.Board(fen)
+        state = SearchState(board, ai._piece_square_values, ai.evaluate_material(board))
+
+        assert _perft(ai, state, board, depth) == expected
+        assert board.fen() == fen
+        assert state.ply == 0
+
+
+def test_null_move_only_changes_the_turn_key():
+    ai = ChessAI()
+    board = chess.Board("r1bqkbnr/pppp1ppp/2n5/4p3/4P3/5N2/PPPP1PPP/RNBQKB1R w KQkq - 2 3")
+    state = SearchState(board, ai._piece_square_values, ai.evaluate_material(board))
+    material = state.material
+
+    state.push(board, chess.Move.null())
+
+    assert state.key == chess.polyglot.zobrist_hash(board)
+    assert state.material == material
+
+
+def test_undo_stack_grows_past_its_initial_size():
+    ai = ChessAI()
+    board = chess.Board()
+    state = SearchState(board, ai._piece_square_values, 0)
+    shuffle = [chess.Move.from_uci(uci) for uci in ("g1f3", "g8f6", "f3g1", "f6g8")]
+
+    for index in range(300):
+        state.push(board, shuffle[index % 4])
+    assert state.key == chess.polyglot.zobrist_hash(board)
+
+    while board.move_stack:
+        state.pop(board)
+    assert state.key == chess.polyglot.zobrist_hash(board)
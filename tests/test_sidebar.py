@@ -0,0 +1,66 @@
+import os
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import warnings
+
+import pygame
+import pytest
+
+from src.core.game import ChessGame
+from src.ui.sidebar import SidebarRenderer
+from src.ui.text_cache import TextCache
+from src.utils.constants import BLACK, BOARD_SIZE
+
+
+@pytest.fixture
+def screen():
+    pygame.display.init()
+    pygame.font.init()
+    yield pygame.display.set_mode((BOARD_SIZE + 200, BOARD_SIZE))
+    pygame.quit()
+
+
+def _sidebar(screen):
+    with warnings.catch_warnings():
+        # SysFont warns when fc-list is unavailable and falls back to the default font.
+        warnings.simplefilter("ignore")
+        return SidebarRenderer(screen)
+
+
+def test_text_cache_evicts_least_recently_used(screen):
+    cache = TextCache(max_entries=2)
+    font = pygame.font.Font(None, 18)
+
+    first = cache.render(font, "a", BLACK)
+    cache.render(font, "b", BLACK)
+    assert cache.render(font, "a", BLACK) is first
+    cache.render(font, "c", BLACK)
+
+    assert len(cache) == 2
+    assert cache.render(font, "a", BLACK) is first
+    assert (cache.hits, cache.misses) == (2, 3)
+    cache.render(font, "b", BLACK)
+    assert cache.misses == 4
+
+
+def test_sidebar_redraws_only_when_its_data_changes(screen):
+    sidebar = _sidebar(screen)
+    game = ChessGame()
+    game.start_new_game("beginner")
+
+    assert sidebar.draw("beginner") == sidebar.rect
+    assert sidebar.draw("beginner") is None
+
+    rendered = {name: panel[1] for name, panel in sidebar._panels.items()}
+    game.make_move(next(iter(game.board.legal_moves)))
+    assert sidebar.draw("beginner") == sidebar.rect
+    # Only the move history panel was rendered again.
+    assert sidebar._panels["history"][1] is not rendered["history"]
+    assert sidebar._panels["header"][1] is rendered["header"]
+    assert sidebar._panels["footer"][1] is rendered["footer"]
+
+    assert sidebar.draw("beginner", check_timer=30) == sidebar.rect
+    assert sidebar.draw("beginner", check_timer=29) is None
+    sidebar.invalidate()
+    assert sidebar.draw("beginner", check_timer=29) == sidebar.rect
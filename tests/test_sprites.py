@@ -0,0 +1,67 @@
+import os
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame
+import pytest
+
+from src.ui.sprites import PieceAtlas
+from src.utils.constants import PIECE_IMAGES, get_image_path
+from src.utils.startup import StartupTimer
+
+
+@pytest.fixture
+def display():
+    pygame.display.init()
+    yield pygame.display.set_mode((100, 100))
+    pygame.display.quit()
+
+
+def test_atlas_is_built_once_then_loaded_from_cache(display, tmp_path):
+    built = PieceAtlas(40, cache_dir=str(tmp_path))
+    assert not built.loaded_from_cache
+    assert os.path.exists(built.cache_path())
+
+    cached = PieceAtlas(40, cache_dir=str(tmp_path))
+    assert cached.loaded_from_cache
+    assert cached.surface.get_size() == (40 * len(PIECE_IMAGES), 40)
+
+    expected = pygame.transform.scale(pygame.image.load(get_image_path(PIECE_IMAGES["Q"])).convert_alpha(), (40, 40))
+    queen = cached.images["Q"]
+    for point in ((20, 20), (5, 35), (20, 8)):
+        assert queen.get_at(point) == expected.get_at(point)
+
+
+def test_atlas_is_rebuilt_for_a_new_size(display, tmp_path):
+    PieceAtlas(40, cache_dir=str(tmp_path))
+    other = PieceAtlas(50, cache_dir=str(tmp_path))
+
+    assert not other.loaded_from_cache
+    assert len(os.listdir(tmp_path)) == 2
+
+
+def test_unwritable_cache_still_gives_an_atlas(display, tmp_path):
+    blocker = tmp_path / "file"
+    blocker.write_text("")
+
+    atlas = PieceAtlas(40, cache_dir=str(blocker / "cache"))
+
+    assert not atlas.loaded_from_cache
+    assert atlas.rects["k"].x == 40 * list(PIECE_IMAGES).index("k")
+
+
+def test_startup_timer_reports_each_step(capsys):
+    timer = StartupTimer(enabled=True)
+    timer.mark("imports")
+    with timer.measure("atlas"):
+        pass
+    timer.frame_shown()
+    timer.frame_shown()
+    with timer.measure("sidebar"):
+        pass
+
+    err = capsys.readouterr().err.splitlines()
+    assert len(err) == 2
+    assert err[0].startswith("startup: imports") and "atlas" in err[0] and "time to first frame" in err[0]
+    assert err[1].startswith("startup: sidebar")
+    assert timer.first_frame is not None
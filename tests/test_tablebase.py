@@ -0,0 +1,100 @@
+import chess
+
+from src.core import tablebase as tablebase_module
+from src.core.ai import INFINITY_SCORE, ChessAI
+from src.core.tablebase import TABLEBASE_WIN_SCORE, SyzygyTablebase
+
+
+class QueenEndingTables:
+    """Stand-in for KQvK tables: the side with the queen wins, bare kings draw."""
+
+    wdl = {"KQvK": None}
+
+    def __init__(self):
+        self.wdl_probes = 0
+
+    def get_wdl(self, board):
+        self.wdl_probes += 1
+        if board.pieces(chess.QUEEN, board.turn):
+            return 2
+        if board.pieces(chess.QUEEN, not board.turn):
+            return -2
+        return 0
+
+    def get_dtz(self, board):
+        wdl = self.get_wdl(board)
+        # Fewer king moves for the defender means closer to mate.
+        return 0 if wdl == 0 else wdl * (1 + board.legal_moves.count())
+
+    def close(self):
+        pass
+
+
+def _tablebase():
+    tablebase = SyzygyTablebase("syzygy")
+    tablebase._tablebase = QueenEndingTables()
+    tablebase._max_pieces = 3
+    return tablebase
+
+
+def test_tablebase_is_disabled_without_tables(tmp_path, monkeypatch):
+    # Point the default location somewhere empty, whatever is installed locally.
+    monkeypatch.setattr(tablebase_module, "DEFAULT_SYZYGY_PATH", str(tmp_path / "syzygy"))
+    tablebase = SyzygyTablebase()
+
+    assert tablebase.available is False
+    assert tablebase.probe_wdl(chess.Board("8/8/8/8/8/2k5/8/K6Q w - - 0 1")) is None
+
+
+def test_probe_results_are_cached():
+    tablebase = _tablebase()
+    board = chess.Board("8/8/8/8/8/2k5/8/K6Q w - - 0 1")
+
+    assert tablebase.probe_wdl(board) == 2
+    assert tablebase.probe_wdl(board) == 2
+    assert tablebase._tablebase.wdl_probes == 1
+    assert tablebase.cache.hits == 1
+
+
+def test_positions_outside_the_tables_are_not_probed():
+    tablebase = _tablebase()
+
+    assert tablebase.probe_wdl(chess.Board("8/8/8/8/8/2k5/7p/K6Q w - - 0 1")) is None
+    assert tablebase.probe_wdl(chess.Board()) is None
+    assert tablebase._tablebase.wdl_probes == 0
+
+
+def test_root_move_keeps_the_win():
+    # Qc2+, Qd2+, Qd3+ and Qd4+ all hang the queen to the king.
+    board = chess.Board("8/8/8/8/8/2k5/8/K2Q4 w - - 0 1")
+
+    ai = ChessAI("advanced")
+    ai.tablebase = _tablebase()
+    move = ai.find_best_move(board)
+
+    board.push(move)
+    assert board.pieces(chess.QUEEN, chess.WHITE)
+    assert ai.tablebase_hits == 1
+    assert ai.last_evaluation == TABLEBASE_WIN_SCORE
+
+
+def test_root_move_prefers_mate():
+    board = chess.Board("k7/8/1K6/8/8/8/8/7Q w - - 0 1")
+
+    ai = ChessAI("advanced")
+    ai.tablebase = _tablebase()
+    move = ai.find_best_move(board)
+
+    board.push(move)
+    assert board.is_checkmate()
+
+
+def test_search_scores_capture_into_the_tables():
+    # Rxb1+ drops into a three-piece ending that the tables cover.
+    board = chess.Board("8/8/8/8/8/2k5/8/KQ5r b - - 0 1")
+
+    ai = ChessAI("advanced")
+    ai.tablebase = _tablebase()
+    ai._negamax(board, 2, -INFINITY_SCORE, INFINITY_SCORE)
+
+    assert ai.tablebase_hits > 0
@@ -0,0 +1,67 @@
+import io
+import random
+
+import chess
+import chess.pgn
+
+from src.core.opening_book import OpeningBook
+from src.core.tournament import EngineConfig, elo_difference, play_game, random_opening, run_match, summarize
+
+
+def test_elo_difference():
+    assert elo_difference(0.5) == 0
+    assert round(elo_difference(0.75)) == 191
+    assert round(elo_difference(0.25)) == -191
+
+
+def test_random_opening_follows_the_book():
+    for seed in range(10):
+        opening = random_opening(OpeningBook(rng=random.Random(seed)), 2)
+
+        board = chess.Board()
+        for uci in opening:
+            assert chess.Move.from_uci(uci) in board.legal_moves
+            board.push_uci(uci)
+        # Lines leave the book early when a move has no stored reply.
+        assert 1 <= len(opening) <= 2
+
+
+def test_play_game_produces_parseable_pgn():
+    first = EngineConfig("first", "beginner", max_depth=1, node_limit=200)
+    second = EngineConfig("second", "beginner", max_depth=1, node_limit=200)
+
+    game = play_game(first, second, ["e2e4", "e7e5"], max_plies=12)
+    parsed = chess.pgn.read_game(io.StringIO(game["pgn"]))
+
+    assert parsed.headers["White"] == "first"
+    assert parsed.headers["Result"] == game["result"]
+    assert len(list(parsed.mainline_moves())) == game["plies"] <= 12
+    if game["plies"] == 12:
+        assert game["result"] == "1/2-1/2"
+    assert game["nodes"]["first"] > 0
+
+
+def test_summary_counts_results_from_the_first_engine():
+    games = [
+        {"white": "a", "black": "b", "result": "1-0", "nodes": {"a": 100, "b": 50}, "seconds": {"a": 1.0, "b": 1.0}},
+        {"white": "b", "black": "a", "result": "1-0", "nodes": {"a": 100, "b": 50}, "seconds": {"a": 1.0, "b": 1.0}},
+        {"white": "b", "black": "a", "result": "0-1", "nodes": {}, "seconds": {}},
+        {"white": "a", "black": "b", "result": "1/2-1/2", "nodes": {}, "seconds": {}},
+    ]
+
+    summary = summarize(games, "a", "b")
+
+    assert (summary["wins"], summary["draws"], summary["losses"]) == (2, 1, 1)
+    assert summary["score"] == 0.625
+    assert summary["elo_low"] < summary["elo"] < summary["elo_high"]
+    assert summary["nps"] == {"a": 100.0, "b": 50.0}
+
+
+def test_parallel_match_swaps_colours():
+    first = EngineConfig("first", "beginner", max_depth=1, node_limit=100)
+    second = EngineConfig("second", "beginner", max_depth=1, node_limit=100)
+
+    games, summary = run_match(first, second, games=2, workers=2, max_plies=8, seed=3)
+
+    assert [(game["white"], game["black"]) for game in games] == [("first", "second"), ("second", "first")]
+    assert summary["games"] == 2
@@ -0,0 +1,90 @@
+import chess
+
+from src.core.ai import ChessAI
+from src.core.transposition import EXACT, LOWER_BOUND, EvaluationCache, TranspositionTable, zobrist_key
+
+
+def test_transposed_positions_share_a_key():
+    first = chess.Board()
+    for uci in ["g1f3", "g8f6", "b1c3"]:
+        first.push_uci(uci)
+
+    second = chess.Board()
+    for uci in ["b1c3", "g8f6", "g1f3"]:
+        second.push_uci(uci)
+
+    assert zobrist_key(first) == zobrist_key(second)
+
+
+def test_store_and_probe_round_trip():
+    table = TranspositionTable(1)
+
+    key = zobrist_key(chess.Board())
+    move = chess.Move.from_uci("e2e4")
+
+    table.store(key, 3, 42, EXACT, move)
+    entry = table.probe(key)
+
+    assert entry is not None
+    assert entry.depth == 3
+    assert entry.score == 42
+    assert entry.best_move == move
+    assert table.hit_rate == 1.0
+
+
+def test_depth_preferred_replacement_within_a_search():
+    table = TranspositionTable(1)
+    table.size = 1
+    table.entries = [None]
+
+    table.store(1, 5, 10, EXACT, None)
+    table.store(2, 2, 20, LOWER_BOUND, None)
+
+    assert table.probe(1) is not None
+    assert table.probe(2) is None
+
+    # Entries from an older search are always replaceable.
+    table.new_search()
+    table.store(2, 2, 20, LOWER_BOUND, None)
+
+    assert table.probe(2) is not None
+
+
+def test_search_populates_table_and_reports_hit_rate():
+    ai = ChessAI("beginner", tt_size_mb=1)
+
+    board = chess.Board("r1bqkbnr/pppp1ppp/2n5/4p3/4P3/5N2/PPPP1PPP/RNBQKB1R w KQkq - 2 3")
+
+    ai.find_best_move(board)
+
+    assert ai.transposition_table.stores > 0
+    assert 0.0 <= ai.transposition_table.hit_rate <= 1.0
+
+
+def test_evaluation_cache_evicts_least_recently_used():
+    cache = EvaluationCache(2)
+
+    cache.put(1, 10)
+    cache.put(2, 20)
+    assert cache.get(1) == 10
+
+    cache.put(3, 30)
+
+    assert len(cache) == 2
+    assert cache.get(2) is None
+    assert cache.get(1) == 10
+    assert cache.get(3) == 30
+    assert cache.hits == 3
+    assert cache.misses == 1
+
+
+def test_evaluate_board_uses_cache():
+    ai = ChessAI()
+    board = chess.Board()
+
+    first = ai.evaluate_board(board)
+    second = ai.evaluate_board(board)
+
+    assert first == second
+    assert ai.eval_cache.hits == 1
+    assert ai.eval_cache.misses == 1
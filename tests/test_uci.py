@@ -0,0 +1,134 @@
+import io
+import time
+
+import chess
+
+from src.core.ai import ChessAI
+from src.core.uci import UCIEngine, format_score
+
+ITALIAN = "r1bqk2r/pppp1ppp/2n2n2/2b1p3/2B1P3/3P1N2/PPP2PPP/RNBQK2R w KQkq - 1 5"
+BACK_RANK_MATE = "6k1/5ppp/8/8/8/8/8/R5K1 w - - 0 1"
+
+
+def _engine():
+    output = io.StringIO()
+    return UCIEngine(output), output
+
+
+def _wait_for_bestmove(engine, output, timeout=30.0):
+    deadline = time.time() + timeout
+    while "bestmove" not in output.getvalue() and time.time() < deadline:
+        time.sleep(0.01)
+    engine.stop_search()
+    return output.getvalue().splitlines()
+
+
+def test_handshake_and_options():
+    engine, output = _engine()
+
+    engine.handle("uci")
+    engine.handle("setoption name Level value Beginner")
+    engine.handle("setoption name UCI_LimitStrength value true")
+    engine.handle("isready")
+
+    lines = output.getvalue().splitlines()
+    assert lines[0].startswith("id name")
+    assert "uciok" in lines
+    assert lines[-1] == "readyok"
+    assert engine.options["Level"] == "beginner"
+    assert engine.options["UCI_LimitStrength"] is True
+
+
+def test_position_with_moves():
+    engine, _ = _engine()
+
+    engine.handle("position startpos moves e2e4 e7e5 g1f3")
+    assert engine.board.fen() == "rnbqkbnr/pppp1ppp/8/4p3/4P3/5N2/PPPP1PPP/RNBQKB1R b KQkq - 1 2"
+
+    engine.handle(f"position fen {ITALIAN} moves e1g1")
+    assert engine.board.piece_at(chess.G1) == chess.Piece.from_symbol("K")
+
+
+def test_bad_position_is_reported_and_ignored():
+    engine, output = _engine()
+
+    engine.handle("position startpos moves e2e4")
+    before = engine.board.fen()
+    engine.handle("position startpos moves e2e4 e2e4")
+    engine.handle("position fen not/a/fen w - - 0 1")
+    engine.handle("isready")
+
+    lines = output.getvalue().splitlines()
+    assert [line.startswith("info string error") for line in lines] == [True, True, False]
+    assert lines[-1] == "readyok"
+    assert engine.board.fen() == before
+
+
+def test_go_depth_streams_info_and_bestmove():
+    engine, output = _engine()
+
+    engine.handle(f"position fen {ITALIAN}")
+    engine.handle("go depth 2")
+    lines = _wait_for_bestmove(engine, output)
+
+    info = [line for line in lines if line.startswith("info")]
+    assert [line.split()[2] for line in info] == ["1", "2"]
+    for line in info:
+        assert " score cp " in line and " nodes " in line and " nps " in line and " pv " in line
+    move = chess.Move.from_uci(lines[-1].split()[1])
+    assert move in chess.Board(ITALIAN).legal_moves
+
+
+def test_mate_scores_are_reported_in_moves():
+    engine, output = _engine()
+
+    engine.handle(f"position fen {BACK_RANK_MATE}")
+    engine.handle("go depth 3")
+    lines = _wait_for_bestmove(engine, output)
+
+    info = [line for line in lines if line.startswith("info")]
+    assert " score mate 1 " in info[-1]
+    assert " score cp " not in info[-1]
+    assert lines[-1] == "bestmove a1a8"
+    assert format_score(-100000, 2) == "mate -1"
+    assert format_score(35, 4) == "cp 35"
+
+
+def test_go_plays_the_best_move_unless_strength_is_limited(monkeypatch):
+    # Make the level's move choice always the worst-ranked move.
+    monkeypatch.setattr(ChessAI, "_choose_move_by_difficulty", lambda self, board, ranked: ranked[-1])
+
+    for limit_strength, expect_best in (("false", True), ("true", False)):
+        engine, output = _engine()
+        engine.handle(f"setoption name UCI_LimitStrength value {limit_strength}")
+        engine.handle(f"position fen {BACK_RANK_MATE}")
+        engine.handle("go depth 2")
+        assert (_wait_for_bestmove(engine, output)[-1] == "bestmove a1a8") is expect_best
+
+
+def test_stop_ends_infinite_search_promptly():
+    engine, output = _engine()
+
+    engine.handle(f"position fen {ITALIAN}")
+    engine.handle("go infinite")
+    time.sleep(0.3)
+    started = time.perf_counter()
+    engine.handle("stop")
+
+    assert time.perf_counter() - started < 2.0
+    lines = output.getvalue().splitlines()
+    assert lines[-1].startswith("bestmove")
+    assert chess.Move.from_uci(lines[-1].split()[1]) in chess.Board(ITALIAN).legal_moves
+
+
+def test_go_movetime_respects_the_budget():
+    engine, output = _engine()
+
+    engine.handle(f"position fen {ITALIAN}")
+    started = time.perf_counter()
+    engine.handle("go movetime 200")
+    lines = _wait_for_bestmove(engine, output)
+
+    assert lines[-1].startswith("bestmove")
+    # The first iteration always completes, so allow for it.
+    assert time.perf_counter() - started < 5.0